@@ -0,0 +1,232 @@
+"""Run the benchmark scenarios and compare them with a stored baseline.
+
+    PYTHONPATH=src python -m benchmarks                      # fake backend, all scenarios
+    PYTHONPATH=src python -m benchmarks --only value_set --sizes 1k 100k
+    PYTHONPATH=src python -m benchmarks --backend live       # needs a running soffice
+    PYTHONPATH=src python -m benchmarks --update-baseline
+
+Each scenario/size is measured three times on fresh documents: wall time (best
+of ``--repeat``), peak working memory (tracemalloc) and UNO round trips (Tracer).
+Round trips do not depend on the machine and must never exceed the baseline;
+time and memory may exceed it by ``--tolerance``. The exit status is 1 when a
+regression is found.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from excellikeuno.core.tracing import Tracer
+from excellikeuno.testing import LatencyModel, fake_calc
+
+from .scenarios import SCENARIOS, Scenario
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+# Wall-time differences below this are noise, whatever the ratio.
+MIN_SECONDS_DELTA = 0.005
+
+
+@dataclass
+class Measurement:
+    scenario: str
+    size: str
+    round_trips: int
+    seconds: float
+    peak_kib: float
+    bridge_ms: Optional[float] = None  # LatencyModel time on the fake backend
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}/{self.size}"
+
+
+class _Backend:
+    """Opens a fresh (doc, sheet) per measurement and closes it afterwards."""
+
+    def __init__(self, name: str, latency: str, sleep: bool) -> None:
+        self.name = name
+        self.latency = latency
+        self.sleep = sleep
+        self.model: Optional[LatencyModel] = None
+
+    def _latency_model(self) -> LatencyModel:
+        if self.latency == "socket":
+            return LatencyModel.socket(sleep=self.sleep)
+        if self.latency == "pipe":
+            return LatencyModel.pipe(sleep=self.sleep)
+        return LatencyModel()
+
+    def open(self) -> Tuple[Any, Any]:
+        if self.name == "live":
+            from excellikeuno.connection import new_calc_document
+
+            _, doc, sheet = new_calc_document(hidden=True)
+            self.model = None
+            return doc, sheet
+        office, doc, sheet = fake_calc(self._latency_model())
+        self.model = office.latency
+        return doc, sheet
+
+    def close(self, doc: Any) -> None:
+        if self.name == "live":
+            doc.close()
+
+
+@contextmanager
+def _fresh(backend: _Backend, scenario: Scenario, size: str) -> Iterator[Tuple[Any, Any, Any]]:
+    doc, sheet = backend.open()
+    try:
+        state = scenario.setup(doc, sheet, size)
+        if backend.model is not None:
+            backend.model.reset()
+        yield doc, sheet, state
+    finally:
+        backend.close(doc)
+
+
+def measure(backend: _Backend, scenario: Scenario, size: str, repeat: int = 3) -> Measurement:
+    seconds = float("inf")
+    bridge_ms = None
+    for _ in range(max(1, repeat)):
+        with _fresh(backend, scenario, size) as (doc, sheet, state):
+            start = time.perf_counter()
+            scenario.run(doc, sheet, state)
+            seconds = min(seconds, time.perf_counter() - start)
+            if backend.model is not None:
+                bridge_ms = backend.model.elapsed * 1000.0
+
+    with _fresh(backend, scenario, size) as (doc, sheet, state):
+        tracemalloc.start()
+        try:
+            scenario.run(doc, sheet, state)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Working memory only: what the document still holds afterwards (the
+        # fake's own cell storage, for one) is not the caller's cost.
+        peak -= retained
+
+    with _fresh(backend, scenario, size) as (doc, sheet, state):
+        with Tracer() as tracer:
+            scenario.run(doc, sheet, state)
+
+    return Measurement(scenario.name, size, tracer.calls, seconds, peak / 1024.0, bridge_ms)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {}
+
+
+def compare(result: Measurement, base: Optional[Dict[str, Any]], tolerance: float, timings: bool) -> List[str]:
+    """Regressions of ``result`` against its baseline entry (empty when none)."""
+
+    if not base:
+        return []
+    problems = []
+    if result.round_trips > base["round_trips"]:
+        problems.append(f"round trips {base['round_trips']} -> {result.round_trips}")
+    if timings:
+        limit = base["seconds"] * (1.0 + tolerance)
+        if result.seconds > limit and result.seconds - base["seconds"] > MIN_SECONDS_DELTA:
+            problems.append(f"time {base['seconds'] * 1000:.1f} -> {result.seconds * 1000:.1f} ms")
+        if result.peak_kib > base["peak_kib"] * (1.0 + tolerance) and result.peak_kib - base["peak_kib"] > 64:
+            problems.append(f"peak {base['peak_kib']:.0f} -> {result.peak_kib:.0f} KiB")
+    return problems
+
+
+def _entry(result: Measurement) -> Dict[str, Any]:
+    return {
+        "round_trips": result.round_trips,
+        "seconds": round(result.seconds, 6),
+        "peak_kib": round(result.peak_kib, 1),
+        "bridge_ms": None if result.bridge_ms is None else round(result.bridge_ms, 3),
+    }
+
+
+def _format_row(result: Measurement, base: Optional[Dict[str, Any]], problems: List[str]) -> str:
+    def _delta(now: float, before: Optional[float]) -> str:
+        if not before:
+            return "      "
+        return f"{(now / before - 1.0) * 100.0:+5.0f}%"
+
+    bridge = "" if result.bridge_ms is None else f"{result.bridge_ms:>10.1f}"
+    return (
+        f"{result.key:<28} {result.round_trips:>8} {_delta(result.round_trips, base and base['round_trips'])}"
+        f" {result.seconds * 1000:>10.1f} {_delta(result.seconds, base and base['seconds'])}"
+        f" {result.peak_kib:>10.0f} {_delta(result.peak_kib, base and base['peak_kib'])} {bridge}"
+        + (f"  REGRESSION: {'; '.join(problems)}" if problems else "")
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("--backend", choices=("fake", "live"), default="fake")
+    parser.add_argument("--latency", choices=("none", "socket", "pipe"), default="socket",
+                        help="latency model of the fake backend")
+    parser.add_argument("--sleep", action="store_true", help="spend the modelled latency in time.sleep")
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="run only these scenarios")
+    parser.add_argument("--sizes", nargs="+", metavar="SIZE", help="run only these sizes (e.g. 1k 10)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per measurement (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed time/memory growth (0.5 = 50%%)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to PATH")
+    args = parser.parse_args(argv)
+
+    backend = _Backend(args.backend, args.latency, args.sleep)
+    baseline = load_baseline(args.baseline)
+    environment = {"backend": args.backend, "latency": args.latency if args.backend == "fake" else None}
+    # Round trips are comparable anywhere; time and memory only on the same backend setup.
+    timings = all(baseline.get(k) == v for k, v in environment.items())
+    stored = baseline.get("results", {})
+
+    print(f"{'scenario/size':<28} {'trips':>8} {'':6} {'ms':>10} {'':6} {'peak KiB':>10} {'':6}"
+          + (f" {'bridge ms':>10}" if args.backend == "fake" else ""))
+    results: List[Measurement] = []
+    regressions = 0
+    for scenario in SCENARIOS:
+        if args.only and scenario.name not in args.only:
+            continue
+        for size in scenario.sizes:
+            if args.sizes and size not in args.sizes:
+                continue
+            result = measure(backend, scenario, size, args.repeat)
+            base = stored.get(result.key)
+            problems = [] if args.update_baseline else compare(result, base, args.tolerance, timings)
+            regressions += bool(problems)
+            results.append(result)
+            print(_format_row(result, base, problems), flush=True)
+
+    document = {**environment, "python": sys.version.split()[0],
+                "results": {r.key: _entry(r) for r in results}}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(document, fh, indent=2)
+    if args.update_baseline:
+        merged = dict(stored) if timings else {}
+        merged.update(document["results"])
+        document["results"] = dict(sorted(merged.items()))
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(document, fh, indent=2)
+            fh.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{regressions} regression(s) against {args.baseline}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
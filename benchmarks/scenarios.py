@@ -0,0 +1,126 @@
+"""Hot-path scenarios timed by ``python -m benchmarks``.
+
+Each scenario prepares a fresh document in ``setup`` (not measured) and then
+performs one operation in ``run``. Sizes are labels into CELL_SIZES or
+SHAPE_SIZES.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from excellikeuno.style.border import Borders
+from excellikeuno.style.font import Font
+from excellikeuno.typing.structs import BorderLine2
+
+# label -> (rows, columns)
+CELL_SIZES: Dict[str, Tuple[int, int]] = {
+    "1k": (50, 20),
+    "100k": (500, 200),
+    "1M": (5000, 200),
+}
+SHAPE_SIZES: Dict[str, int] = {"10": 10, "1000": 1000}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    sizes: Tuple[str, ...]
+    setup: Callable[[Any, Any, str], Any]  # (doc, sheet, size) -> state
+    run: Callable[[Any, Any, Any], Any]  # (doc, sheet, state)
+
+
+def _matrix(rows: int, columns: int) -> List[List[float]]:
+    return [[float(r * columns + c) for c in range(columns)] for r in range(rows)]
+
+
+def _block(sheet: Any, size: str, fill: bool = False) -> Any:
+    rows, columns = CELL_SIZES[size]
+    rng = sheet.range(0, 0, columns - 1, rows - 1)
+    if fill:
+        rng.value = _matrix(rows, columns)
+    return rng
+
+
+def _table(sheet: Any, size: str) -> Any:
+    """Header row plus (key, value, ...) rows for charts and pivots."""
+
+    rows, columns = CELL_SIZES[size]
+    rng = sheet.range(0, 0, columns - 1, rows - 1)
+    header = [f"col{c}" for c in range(columns)]
+    body = [[f"k{r % 10}"] + [float(r + c) for c in range(1, columns)] for r in range(rows - 1)]
+    rng.value = [header] + body
+    return rng
+
+
+def _value_set(doc: Any, sheet: Any, size: str) -> Any:
+    rows, columns = CELL_SIZES[size]
+    return _block(sheet, size), _matrix(rows, columns)
+
+
+def _stream(sheet: Any, size: str) -> None:
+    rows, columns = CELL_SIZES[size]
+    with sheet.writer("A1") as writer:
+        writer.extend([float(r * columns + c) for c in range(columns)] for r in range(rows))
+
+
+def _timeseries(doc: Any, sheet: Any, size: str) -> Any:
+    """(timestamp, value) rows with as many cells as the size label."""
+
+    rows, columns = CELL_SIZES[size]
+    count = rows * columns // 2
+    start, step = datetime(2024, 1, 1), timedelta(minutes=5)
+    return sheet.range(0, 0, 1, count - 1), [[start + step * i, float(i)] for i in range(count)]
+
+
+def _timeseries_filled(doc: Any, sheet: Any, size: str) -> Any:
+    rng, data = _timeseries(doc, sheet, size)
+    rng.value = data
+    return rng
+
+
+def _add_shapes(sheet: Any, count: int) -> None:
+    shapes = sheet.shapes
+    for i in range(count):
+        shapes.add_rectangle_shape(1000 + (i % 40) * 600, 1000 + (i // 40) * 600, 500, 500, fill_color=0x3465A4)
+
+
+def _with_shapes(doc: Any, sheet: Any, size: str) -> Any:
+    _add_shapes(sheet, SHAPE_SIZES[size])
+
+
+def _pivot(doc: Any, sheet: Any, rng: Any) -> Any:
+    _, columns = rng._size()
+    target = sheet.cell(columns + 2, 0)
+    return sheet.pivot_tables.add("bench", rng, target, row_fields=["col0"], data_fields=["col1"])
+
+
+_CELLS = tuple(CELL_SIZES)
+_SHAPES = tuple(SHAPE_SIZES)
+_TABLES = ("1k", "100k")
+
+SCENARIOS: Tuple[Scenario, ...] = (
+    Scenario("value_set", _CELLS, _value_set, lambda doc, sheet, st: setattr(st[0], "value", st[1])),
+    Scenario("value_get", _CELLS, lambda doc, sheet, size: _block(sheet, size, fill=True),
+             lambda doc, sheet, rng: rng.value),
+    Scenario("writer_stream", _CELLS, lambda doc, sheet, size: size, lambda doc, sheet, size: _stream(sheet, size)),
+    Scenario("iter_rows", _CELLS, lambda doc, sheet, size: _block(sheet, size, fill=True),
+             lambda doc, sheet, rng: sum(1 for _ in sheet.iter_rows())),
+    Scenario("read_columns", _CELLS, lambda doc, sheet, size: _block(sheet, size, fill=True),
+             lambda doc, sheet, rng: rng.read_columns(header=False)),
+    Scenario("dates_write", _CELLS, _timeseries, lambda doc, sheet, st: setattr(st[0], "value", st[1])),
+    Scenario("dates_read", _CELLS, _timeseries_filled, lambda doc, sheet, rng: rng.read_columns(header=False)),
+    Scenario("font_broadcast", _CELLS, lambda doc, sheet, size: _block(sheet, size),
+             lambda doc, sheet, rng: setattr(rng, "font", Font(bold=True, size=12, color=0xC9211E))),
+    Scenario("border_broadcast", _CELLS, lambda doc, sheet, size: _block(sheet, size),
+             lambda doc, sheet, rng: setattr(rng, "borders", Borders(all=BorderLine2(Color=0, LineWidth=26)))),
+    Scenario("backcolor_broadcast", _CELLS, lambda doc, sheet, size: _block(sheet, size),
+             lambda doc, sheet, rng: setattr(rng, "backcolor", 0xFFCC00)),
+    Scenario("shapes_add", _SHAPES, lambda doc, sheet, size: SHAPE_SIZES[size],
+             lambda doc, sheet, count: _add_shapes(sheet, count)),
+    Scenario("shapes_enumerate", _SHAPES, _with_shapes, lambda doc, sheet, st: sheet.shapes()),
+    Scenario("chart_create", _TABLES, lambda doc, sheet, size: _table(sheet, size),
+             lambda doc, sheet, rng: sheet.charts.add_bar_diagram("bench", rng)),
+    Scenario("pivot_create", _TABLES, lambda doc, sheet, size: _table(sheet, size), _pivot),
+)
@@ -1,47 +1,111 @@
-from .connection import (
-    ActiveCalcDocument,
-    ActiveSheet,
-    ThisDesktop,
-    active_document,
-    active_sheet,
-    add_calc_document,
-    connect_calc,
-    connect_calc_script,
-    connect_writer,
-    get_active_calc_document,
-    get_desktop,
-    new_calc_document,
-    open_calc_document,
-    this_desktop,
-    this_document,
-    this_sheet,
-    wrap_sheet,
-)
-from .core import UnoObject
-from .core.calc_document import CalcDocument
-from .core.writer_document import WriterDocument
-from .typing import InterfaceNames
-from .drawing import (
-    ClosedBezierShape,
-    ConnectorShape,
-    ControlShape,
-    CustomShape,
-    EllipseShape,
-    GroupShape,
-    LineShape,
-    MeasureShape,
-    OpenBezierShape,
-    PageShape,
-    PolyLineShape,
-    PolyPolygonBezierShape,
-    PolyPolygonShape,
-    RectangleShape,
-    Shape,
-    TextShape,
-)
-from .table import PivotTable, PivotTables
-from .sheet import Spreadsheet, SheetCell, SheetCellRange
-from .chart import Chart, ChartCollection
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .connection import (
+        ActiveCalcDocument,
+        ActiveSheet,
+        ConnectionSettings,
+        ThisDesktop,
+        active_document,
+        active_sheet,
+        add_calc_document,
+        connect_calc,
+        connect_calc_script,
+        connect_writer,
+        get_active_calc_document,
+        get_desktop,
+        new_calc_document,
+        open_calc_document,
+        this_desktop,
+        this_document,
+        this_sheet,
+        wrap_sheet,
+    )
+    from .core import UnoObject
+    from .core.calc_document import CalcDocument
+    from .core.writer_document import WriterDocument
+    from .typing import InterfaceNames
+    from .drawing import (
+        ClosedBezierShape,
+        ConnectorShape,
+        ControlShape,
+        CustomShape,
+        EllipseShape,
+        GroupShape,
+        LineShape,
+        MeasureShape,
+        OpenBezierShape,
+        PageShape,
+        PolyLineShape,
+        PolyPolygonBezierShape,
+        PolyPolygonShape,
+        RectangleShape,
+        Shape,
+        TextShape,
+    )
+    from .table import (
+        PivotTable,
+        PivotTables,
+    )
+    from .sheet import (
+        Spreadsheet,
+        SheetCell,
+        SheetCellRange,
+    )
+    from .chart import (
+        Chart,
+        ChartCollection,
+    )
+
+# 公開名は最初に使われたときに読み込む（マクロ起動ごとの import 時間を抑える）
+_LAZY = {
+    "ActiveCalcDocument": ".connection",
+    "ActiveSheet": ".connection",
+    "ConnectionSettings": ".connection",
+    "ThisDesktop": ".connection",
+    "active_document": ".connection",
+    "active_sheet": ".connection",
+    "add_calc_document": ".connection",
+    "connect_calc": ".connection",
+    "connect_calc_script": ".connection",
+    "connect_writer": ".connection",
+    "get_active_calc_document": ".connection",
+    "get_desktop": ".connection",
+    "new_calc_document": ".connection",
+    "open_calc_document": ".connection",
+    "this_desktop": ".connection",
+    "this_document": ".connection",
+    "this_sheet": ".connection",
+    "wrap_sheet": ".connection",
+    "UnoObject": ".core.base",
+    "CalcDocument": ".core.calc_document",
+    "WriterDocument": ".core.writer_document",
+    "InterfaceNames": ".typing.interfaces",
+    "ClosedBezierShape": ".drawing",
+    "ConnectorShape": ".drawing",
+    "ControlShape": ".drawing",
+    "CustomShape": ".drawing",
+    "EllipseShape": ".drawing",
+    "GroupShape": ".drawing",
+    "LineShape": ".drawing",
+    "MeasureShape": ".drawing",
+    "OpenBezierShape": ".drawing",
+    "PageShape": ".drawing",
+    "PolyLineShape": ".drawing",
+    "PolyPolygonBezierShape": ".drawing",
+    "PolyPolygonShape": ".drawing",
+    "RectangleShape": ".drawing",
+    "Shape": ".drawing",
+    "TextShape": ".drawing",
+    "PivotTable": ".table",
+    "PivotTables": ".table",
+    "Spreadsheet": ".sheet",
+    "SheetCell": ".sheet",
+    "SheetCellRange": ".sheet",
+    "Chart": ".chart",
+    "ChartCollection": ".chart",
+}
 
 __all__ = [
     "Chart",
@@ -69,6 +133,7 @@ __all__ = [
     "PageShape",
     "CalcDocument",
     "WriterDocument",
+    "ConnectionSettings",
     "connect_calc",
     "connect_writer",
     "open_calc_document",
@@ -90,18 +155,38 @@ __all__ = [
     "UnoObject",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def _forward(name: str) -> Any:
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(import_module(".connection", __name__), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
 # Provide uno.connect_calc convenience when UNO runtime is available.
+# The connection package is imported on the first call, not here.
 try:
     import uno  # type: ignore
 
-    if not hasattr(uno, "connect_calc"):
-        uno.connect_calc = connect_calc  # type: ignore[attr-defined]
-    if not hasattr(uno, "connect_calc_script"):
-        uno.connect_calc_script = connect_calc_script  # type: ignore[attr-defined]
-    if not hasattr(uno, "connect_writer"):
-        uno.connect_writer = connect_writer  # type: ignore[attr-defined]
+    for _name in ("connect_calc", "connect_calc_script", "connect_writer"):
+        if not hasattr(uno, _name):
+            setattr(uno, _name, _forward(_name))
     if not hasattr(uno, "WriterDocument"):
-        uno.WriterDocument = WriterDocument  # type: ignore[attr-defined]
+        uno.WriterDocument = __getattr__("WriterDocument")  # type: ignore[attr-defined]
 except Exception:
     # Ignore when UNO runtime is absent; normal imports still work.
     pass
@@ -0,0 +1,279 @@
+"""asyncio facade: UNO calls run on one bridge thread per office connection.
+
+Every awaitable below hands its work to the connection's bridge thread, so the
+event loop never blocks on URP socket/pipe I/O. Calls on one connection are
+serialized; different connections (e.g. OfficePool workers) run concurrently.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from .connection.bootstrap import _file_url, _load_calc_document, _requested_settings, _resolve_context
+from .connection.settings import ConnectionSettings
+from .core.calc_document import CalcDocument
+from .sheet import SheetCellRange, Spreadsheet
+
+T = TypeVar("T")
+
+# Connections shared by the module-level helpers, one per settings.
+_offices: Dict[ConnectionSettings, "AsyncOffice"] = {}
+
+
+class AsyncOffice:
+    """One office connection with its own bridge thread."""
+
+    def __init__(
+        self,
+        settings: ConnectionSettings | None = None,
+        *,
+        desktop: Any = None,
+        context: Any = None,
+    ) -> None:
+        self.settings = settings
+        self.desktop = desktop
+        self.context = context
+        name = f"excellikeuno-bridge-{settings.connection if settings is not None else id(self)}"
+        self._executor: ThreadPoolExecutor | None = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+    @classmethod
+    def from_worker(cls, worker: Any) -> "AsyncOffice":
+        """Drive an already started OfficeWorker from asyncio."""
+
+        return cls(worker.settings, desktop=worker.desktop, context=worker.context)
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` on the bridge thread and await its result."""
+
+        if self._executor is None:
+            raise RuntimeError("AsyncOffice is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _connect(self) -> Any:
+        if self.desktop is None:
+            settings = self.settings or ConnectionSettings()
+            ctx = _resolve_context(settings)
+            self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+            self.context = ctx
+        return self.desktop
+
+    async def connect(self) -> "AsyncOffice":
+        try:
+            await self.run(self._connect)
+        except RuntimeError:
+            raise
+        except Exception as exc:  # pragma: no cover - depends on runtime
+            raise RuntimeError("Failed to connect to LibreOffice desktop") from exc
+        return self
+
+    def _wrap(self, loaded: Tuple[CalcDocument, Spreadsheet]) -> Tuple["AsyncCalcDocument", "AsyncSpreadsheet"]:
+        document, sheet = loaded
+        return AsyncCalcDocument(self, document), AsyncSpreadsheet(self, sheet)
+
+    async def new_calc_document(self, hidden: bool = True) -> Tuple["AsyncCalcDocument", "AsyncSpreadsheet"]:
+        await self.connect()
+        loaded = await self.run(
+            _load_calc_document, self.desktop, "private:factory/scalc", {"Hidden": hidden}, self.context
+        )
+        return self._wrap(loaded)
+
+    async def open_calc_document(
+        self,
+        path: str,
+        *,
+        hidden: bool = True,
+        read_only: bool = False,
+        as_template: bool = False,
+        filter_name: str | None = None,
+    ) -> Tuple["AsyncCalcDocument", "AsyncSpreadsheet"]:
+        await self.connect()
+        options = {"Hidden": hidden, "ReadOnly": read_only, "AsTemplate": as_template, "FilterName": filter_name}
+        loaded = await self.run(_load_calc_document, self.desktop, _file_url(path), options, self.context)
+        return self._wrap(loaded)
+
+    def _active(self) -> Tuple[CalcDocument, Spreadsheet]:
+        doc = self.desktop.getCurrentComponent()
+        if doc is None:
+            raise RuntimeError("No active Calc document found")
+        document = CalcDocument(doc, self.context)
+        sheet = document.raw.getCurrentController().getActiveSheet()
+        return document, Spreadsheet(sheet, document=document)
+
+    async def active_document(self) -> Tuple["AsyncCalcDocument", "AsyncSpreadsheet"]:
+        """The desktop's current Calc document and its active sheet."""
+
+        await self.connect()
+        return self._wrap(await self.run(self._active))
+
+    def close(self) -> None:
+        """Stop the bridge thread (the office itself keeps running)."""
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def aclose(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncOffice":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        await self.aclose()
+
+
+class _AsyncWrapper:
+    """Base for awaitable proxies around a synchronous excellikeuno wrapper."""
+
+    def __init__(self, office: AsyncOffice, sync: Any) -> None:
+        self.office = office
+        self.sync = sync
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func(self.sync, *args, **kwargs)`` on the bridge thread."""
+
+        return await self.office.run(func, self.sync, *args, **kwargs)
+
+    async def _get(self, name: str) -> Any:
+        return await self.office.run(getattr, self.sync, name)
+
+    async def _set(self, name: str, value: Any) -> None:
+        await self.office.run(setattr, self.sync, name, value)
+
+
+class AsyncCalcDocument(_AsyncWrapper):
+    sync: CalcDocument
+
+    async def save(self) -> None:
+        await self.office.run(self.sync.save)
+
+    async def save_as(self, path: str, filter_name: str | None = None, overwrite: bool = True) -> None:
+        await self.office.run(self.sync.save_as, path, filter_name, overwrite)
+
+    async def save_copy(self, path: str, filter_name: str | None = None, overwrite: bool = True) -> None:
+        await self.office.run(self.sync.save_copy, path, filter_name, overwrite)
+
+    async def close(self, deliver_ownership: bool = True) -> None:
+        await self.office.run(self.sync.close, deliver_ownership)
+
+    async def sheet(self, index: int) -> "AsyncSpreadsheet":
+        return AsyncSpreadsheet(self.office, await self.office.run(self.sync.sheet, index))
+
+    async def sheet_by_name(self, name: str) -> "AsyncSpreadsheet":
+        return AsyncSpreadsheet(self.office, await self.office.run(self.sync.sheet_by_name, name))
+
+    async def add_sheet(self, name: str, index: int | None = None) -> "AsyncSpreadsheet":
+        return AsyncSpreadsheet(self.office, await self.office.run(self.sync.add_sheet, name, index))
+
+
+class AsyncSpreadsheet(_AsyncWrapper):
+    sync: Spreadsheet
+
+    async def cell(self, column: int | str, row: int | None = None) -> "AsyncRange":
+        return AsyncRange(self.office, await self.office.run(self.sync.cell, column, row))
+
+    async def range(self, *args: Any) -> "AsyncRange":
+        return AsyncRange(self.office, await self.office.run(self.sync.range, *args))
+
+    async def get_name(self) -> str:
+        return await self._get("name")
+
+    async def set_name(self, value: str) -> None:
+        await self._set("name", value)
+
+
+class AsyncRange(_AsyncWrapper):
+    """Awaitable value/data/formula/text access for a SheetCellRange or SheetCell."""
+
+    async def get_value(self) -> Any:
+        return await self._get("value")
+
+    async def set_value(self, value: Any) -> None:
+        await self._set("value", value)
+
+    async def get_data(self) -> Any:
+        return await self._get("data")
+
+    async def set_data(self, value: Any) -> None:
+        await self._set("data", value)
+
+    async def get_formula(self) -> Any:
+        return await self._get("formula")
+
+    async def set_formula(self, value: Any) -> None:
+        await self._set("formula", value)
+
+    async def get_text(self) -> Any:
+        return await self._get("text")
+
+    async def set_text(self, value: Any) -> None:
+        await self._set("text", value)
+
+    async def read(self, typed: bool = False) -> list[list[Any]]:
+        if not isinstance(self.sync, SheetCellRange):
+            raise TypeError("read() is only available on ranges")
+        return await self.office.run(self.sync.read, typed)
+
+    async def write(self, value: Any) -> None:
+        if not isinstance(self.sync, SheetCellRange):
+            raise TypeError("write() is only available on ranges")
+        await self.office.run(self.sync.write, value)
+
+
+def _office_for(settings: ConnectionSettings | None) -> AsyncOffice:
+    resolved = _requested_settings(settings) or ConnectionSettings()
+    office = _offices.get(resolved)
+    if office is None or office._executor is None:
+        office = AsyncOffice(resolved)
+        _offices[resolved] = office
+    return office
+
+
+async def connect_calc(
+    settings: ConnectionSettings | None = None,
+) -> Tuple[AsyncOffice, AsyncCalcDocument, AsyncSpreadsheet]:
+    """Awaitable connect_calc: (office, active document, active sheet)."""
+
+    office = _office_for(settings)
+    document, sheet = await office.active_document()
+    return office, document, sheet
+
+
+async def new_calc_document(
+    hidden: bool = True, *, settings: ConnectionSettings | None = None
+) -> Tuple[AsyncOffice, AsyncCalcDocument, AsyncSpreadsheet]:
+    office = _office_for(settings)
+    document, sheet = await office.new_calc_document(hidden)
+    return office, document, sheet
+
+
+async def open_calc_document(
+    path: str,
+    *,
+    hidden: bool = True,
+    read_only: bool = False,
+    as_template: bool = False,
+    filter_name: str | None = None,
+    settings: ConnectionSettings | None = None,
+) -> Tuple[AsyncOffice, AsyncCalcDocument, AsyncSpreadsheet]:
+    """Awaitable open_calc_document: (office, document, first sheet)."""
+
+    office = _office_for(settings)
+    document, sheet = await office.open_calc_document(
+        path, hidden=hidden, read_only=read_only, as_template=as_template, filter_name=filter_name
+    )
+    return office, document, sheet
+
+
+async def close_all() -> None:
+    """Stop the bridge threads started by the module-level helpers."""
+
+    offices = list(_offices.values())
+    _offices.clear()
+    for office in offices:
+        await office.aclose()
@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .bootstrap import (
 	ActiveCalcDocument,
 	ActiveSheet,
@@ -17,8 +20,33 @@ from .bootstrap import (
 	this_sheet,
 	wrap_sheet,
 )
+from .settings import ConnectionSettings
+
+if TYPE_CHECKING:
+	from .executor import DocumentResult, map_documents
+	from .pool import OfficePool, OfficeWorker
+	from .pushdown import PushdownError, ScriptPushdown, run_in_office
+
+# プロセスプールとスクリプト転送は subprocess / hashlib などを読み込むため、使うときまで遅延する
+_LAZY = {
+	"DocumentResult": ".executor",
+	"map_documents": ".executor",
+	"OfficePool": ".pool",
+	"OfficeWorker": ".pool",
+	"PushdownError": ".pushdown",
+	"ScriptPushdown": ".pushdown",
+	"run_in_office": ".pushdown",
+}
 
 __all__ = [
+	"ConnectionSettings",
+	"DocumentResult",
+	"map_documents",
+	"OfficePool",
+	"OfficeWorker",
+	"PushdownError",
+	"ScriptPushdown",
+	"run_in_office",
 	"open_calc_document",
 	"new_calc_document",
 	"add_calc_document",
@@ -37,3 +65,16 @@ __all__ = [
 	"ActiveSheet",
 	"ThisDesktop",
 ]
+
+
+def __getattr__(name: str) -> Any:
+	module = _LAZY.get(name)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(import_module(module, __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted(set(globals()) | set(_LAZY))
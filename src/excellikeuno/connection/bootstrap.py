@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import time
 from typing import Any, Tuple
 
 from ..core.calc_document import CalcDocument
 from ..core.writer_document import WriterDocument
 from ..typing import InterfaceNames
 from ..sheet import Spreadsheet
+from .settings import ConnectionSettings
 
 current_desktop: Any = None
+# Remote component context current_desktop was created from (for office-side services).
+current_context: Any = None
+# Settings current_desktop was resolved with (None when bootstrapped or given by a script).
+current_settings: ConnectionSettings | None = None
+
+# A successful health check is trusted for this many seconds before probing again.
+ALIVE_CHECK_INTERVAL = 2.0
+_alive_checked: Tuple[Any, float] = (None, 0.0)
 
 
 class _LazyAlias:
@@ -37,7 +47,40 @@ def _make_properties(options: dict[str, Any]) -> tuple[Any, ...]:
     return tuple(PropertyValue(name, 0, value, 0) for name, value in options.items() if value is not None)
 
 
-def _bootstrap_desktop() -> Any:
+def _requested_settings(settings: ConnectionSettings | None) -> ConnectionSettings | None:
+    """Explicit settings win; otherwise EXCELLIKEUNO_* variables when any is set."""
+
+    if settings is not None:
+        return settings
+    if ConnectionSettings.in_env():
+        return ConnectionSettings.from_env()
+    return None
+
+
+def _resolve_context(settings: ConnectionSettings) -> Any:
+    """Resolve the remote component context, retrying until settings.timeout expires."""
+
+    try:
+        import uno  # type: ignore
+    except ImportError as exc:  # pragma: no cover - depends on LibreOffice runtime
+        raise RuntimeError("UNO runtime is not available") from exc
+
+    local_ctx = uno.getComponentContext()
+    resolver = local_ctx.ServiceManager.createInstanceWithContext(
+        "com.sun.star.bridge.UnoUrlResolver", local_ctx
+    )
+    url = settings.to_uno_url()
+    deadline = time.monotonic() + max(0.0, settings.timeout)
+    while True:
+        try:
+            return resolver.resolve(url)
+        except Exception:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+
+
+def _bootstrap_desktop(settings: ConnectionSettings | None = None) -> Any:
     try:
         import uno  # type: ignore
         import unohelper  # type: ignore
@@ -46,85 +89,168 @@ def _bootstrap_desktop() -> Any:
 
     ctx = None
     boot_exc = None
-    try:
-        ctx = unohelper.Bootstrap.bootstrap()
-    except Exception as exc:  # pragma: no cover - defensive guard
-        boot_exc = exc
+    if settings is None:
+        try:
+            ctx = unohelper.Bootstrap.bootstrap()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            boot_exc = exc
 
     if ctx is None:
         try:
-            local_ctx = uno.getComponentContext()
-            resolver = local_ctx.ServiceManager.createInstanceWithContext(
-                "com.sun.star.bridge.UnoUrlResolver", local_ctx
-            )
-            ctx = resolver.resolve("uno:socket,host=localhost,port=2002;urp;StarOffice.ComponentContext")
-        except Exception:
-            pass
+            ctx = _resolve_context(settings or ConnectionSettings())
+        except Exception as exc:
+            boot_exc = boot_exc or exc
 
     if ctx is None:  # pragma: no cover - depends on runtime
         raise RuntimeError("Failed to bootstrap or connect to LibreOffice UNO") from boot_exc
 
+    global current_context
     smgr = ctx.getServiceManager()
     desktop = smgr.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+    current_context = ctx
+    return desktop
+
+
+def _desktop_is_alive(desktop: Any) -> bool:
+    """Cheap health check: a single bridge call that fails once the office is gone."""
+
+    global _alive_checked
+    if desktop is None:
+        return False
+    checked, at = _alive_checked
+    now = time.monotonic()
+    if checked is desktop and now - at < ALIVE_CHECK_INTERVAL:
+        return True
+    try:
+        desktop.getImplementationName()
+    except Exception:
+        _alive_checked = (None, 0.0)
+        return False
+    _alive_checked = (desktop, now)
+    return True
+
+
+def _reusable(settings: ConnectionSettings | None) -> bool:
+    """The cached desktop is alive and was reached the way the caller asks for."""
+
+    if settings is not None and settings != current_settings:
+        return False
+    return _desktop_is_alive(current_desktop)
+
+
+def _shared_desktop(settings: ConnectionSettings | None = None) -> Any:
+    """Return the cached desktop while its bridge is alive; bootstrap a new one otherwise."""
+
+    global current_desktop, current_settings
+    settings = _requested_settings(settings)
+    if _reusable(settings):
+        return current_desktop
+    current_desktop = None
+    desktop = _bootstrap_desktop(settings)
+    current_desktop = desktop
+    current_settings = settings
     return desktop
 
 
-def this_desktop() -> Any:
+def this_desktop(settings: ConnectionSettings | None = None) -> Any:
     """Alias that returns the current desktop (connects if needed)."""
 
-    return get_desktop()
+    return get_desktop(settings)
+
 
+def get_desktop(settings: ConnectionSettings | None = None) -> Any:
+    """Connect to a running LibreOffice desktop over URP.
 
-def get_desktop() -> Any:
-    """Connect to a running LibreOffice desktop via UNO socket."""
+    ``settings`` selects socket or pipe transport; by default EXCELLIKEUNO_*
+    environment variables are used, falling back to ``socket,host=localhost,port=2002``.
+    """
 
-    global current_desktop
-    if current_desktop is not None:
+    global current_desktop, current_settings, current_context
+    requested = _requested_settings(settings)
+    if _reusable(requested):
         return current_desktop
+    current_desktop = None
 
     try:
-        import uno  # type: ignore
+        import uno  # type: ignore  # noqa: F401
     except ImportError as exc:  # pragma: no cover - depends on LibreOffice runtime
         raise RuntimeError("UNO runtime is not available") from exc
 
+    resolved = requested or ConnectionSettings()
     try:
-        local_ctx = uno.getComponentContext()
-        resolver = local_ctx.ServiceManager.createInstanceWithContext(
-            "com.sun.star.bridge.UnoUrlResolver", local_ctx
-        )
-        ctx = resolver.resolve("uno:socket,host=localhost,port=2002;urp;StarOffice.ComponentContext")
+        ctx = _resolve_context(resolved)
         smgr = ctx.ServiceManager
         desktop = smgr.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
         current_desktop = desktop
+        current_settings = resolved
+        current_context = ctx
         return desktop
     except Exception as exc:  # pragma: no cover - depends on runtime
         raise RuntimeError("Failed to connect to LibreOffice desktop") from exc
 
 
-def new_calc_document(hidden: bool = True) -> Tuple[Any, CalcDocument, Spreadsheet]:
-    desktop = _bootstrap_desktop()
-    global current_desktop
-    current_desktop = desktop
-
+def _file_url(path: str) -> str:
     try:
         import uno  # type: ignore
     except ImportError as exc:  # pragma: no cover - depends on runtime
         raise RuntimeError("UNO runtime is not available") from exc
 
-    properties = _make_properties({"Hidden": hidden})
-    document = desktop.loadComponentFromURL("private:factory/scalc", "_blank", 0, properties)
+    return uno.systemPathToFileUrl(path)
+
+
+def _load_calc_document(
+    desktop: Any, url: str, options: dict[str, Any], context: Any = None
+) -> Tuple[CalcDocument, Spreadsheet]:
+    """Load ``url`` on ``desktop`` and return the document wrapper and its first sheet.
 
-    doc_wrapper = CalcDocument(document)
+    ``context`` is the component context of the office behind ``desktop``; it is
+    kept on the CalcDocument so office-side helpers reach the same office.
+    """
+
+    document = desktop.loadComponentFromURL(url, "_blank", 0, _make_properties(options))
+    doc_wrapper = CalcDocument(document, context)
     spreadsheet_doc = doc_wrapper.iface(InterfaceNames.X_SPREADSHEET_DOCUMENT)
     sheets = spreadsheet_doc.getSheets()
     first_sheet = sheets.getByIndex(0)
-    return desktop, doc_wrapper, Spreadsheet(first_sheet, document=doc_wrapper)
+    return doc_wrapper, Spreadsheet(first_sheet, document=doc_wrapper)
+
+
+def _load_on_shared_desktop(
+    settings: ConnectionSettings | None, url: str, options: dict[str, Any]
+) -> Tuple[Any, CalcDocument, Spreadsheet]:
+    """Load ``url`` on the shared desktop, reconnecting once if its office has gone away.
+
+    A health check is trusted for ALIVE_CHECK_INTERVAL, so an office that died
+    within that window only shows up as a failing load. The desktop is then probed
+    again: a dead one is dropped and the load retried on a fresh connection, while
+    errors from a live office (a bad URL, say) are raised as they are.
+    """
 
+    global current_desktop, _alive_checked
+    desktop = _shared_desktop(settings)
+    try:
+        return (desktop, *_load_calc_document(desktop, url, options, current_context))
+    except Exception:
+        _alive_checked = (None, 0.0)
+        if _desktop_is_alive(desktop):
+            raise
+        current_desktop = None
+    desktop = _shared_desktop(settings)
+    return (desktop, *_load_calc_document(desktop, url, options, current_context))
+
+
+def new_calc_document(
+    hidden: bool = True, *, settings: ConnectionSettings | None = None
+) -> Tuple[Any, CalcDocument, Spreadsheet]:
+    return _load_on_shared_desktop(settings, "private:factory/scalc", {"Hidden": hidden})
 
-def add_calc_document(hidden: bool = True) -> Tuple[Any, CalcDocument, Spreadsheet]:
+
+def add_calc_document(
+    hidden: bool = True, *, settings: ConnectionSettings | None = None
+) -> Tuple[Any, CalcDocument, Spreadsheet]:
     """Alias for new_calc_document to match desktop-oriented naming."""
 
-    return new_calc_document(hidden=hidden)
+    return new_calc_document(hidden=hidden, settings=settings)
 
 
 def open_calc_document(
@@ -134,74 +260,62 @@ def open_calc_document(
     read_only: bool = False,
     as_template: bool = False,
     filter_name: str | None = None,
+    settings: ConnectionSettings | None = None,
 ) -> Tuple[Any, CalcDocument, Spreadsheet]:
     """Open a Calc document and return (desktop, document_wrapper, first_sheet)."""
 
-    desktop = _bootstrap_desktop()
-    global current_desktop
-    current_desktop = desktop
-
-    try:
-        import uno  # type: ignore
-    except ImportError as exc:  # pragma: no cover - depends on runtime
-        raise RuntimeError("UNO runtime is not available") from exc
-
-    url = uno.systemPathToFileUrl(path)
-    properties = _make_properties(
-        {"Hidden": hidden, "ReadOnly": read_only, "AsTemplate": as_template, "FilterName": filter_name}
+    return _load_on_shared_desktop(
+        settings,
+        _file_url(path),
+        {"Hidden": hidden, "ReadOnly": read_only, "AsTemplate": as_template, "FilterName": filter_name},
     )
-    document = desktop.loadComponentFromURL(url, "_blank", 0, properties)
-
-    doc_wrapper = CalcDocument(document)
-    spreadsheet_doc = doc_wrapper.iface(InterfaceNames.X_SPREADSHEET_DOCUMENT)
-    sheets = spreadsheet_doc.getSheets()
-    first_sheet = sheets.getByIndex(0)
-    return desktop, doc_wrapper, Spreadsheet(first_sheet, document=doc_wrapper)
 
 
-def connect_calc() -> Tuple[Any, CalcDocument, Spreadsheet]:
-    desktop = get_desktop()
+def connect_calc(settings: ConnectionSettings | None = None) -> Tuple[Any, CalcDocument, Spreadsheet]:
+    desktop = get_desktop(settings)
     doc = desktop.getCurrentComponent()
     if doc is None:
         raise RuntimeError("No active Calc document found")
 
-    doc_wrapper = CalcDocument(doc)
+    doc_wrapper = CalcDocument(doc, current_context)
     spreadsheet_doc = doc_wrapper.iface(InterfaceNames.X_SPREADSHEET_DOCUMENT)
     controller = spreadsheet_doc.getCurrentController()
     sheet = controller.getActiveSheet()
     return desktop, doc_wrapper, Spreadsheet(sheet, document=doc_wrapper)
 
 
-def active_document() -> CalcDocument:
-    desktop = get_desktop()
+def active_document(settings: ConnectionSettings | None = None) -> CalcDocument:
+    desktop = get_desktop(settings)
     doc = desktop.getCurrentComponent()
     if doc is None:
         raise RuntimeError("No active Calc document found")
-    return CalcDocument(doc)
+    return CalcDocument(doc, current_context)
 
 
-def get_active_calc_document() -> CalcDocument:
+def get_active_calc_document(settings: ConnectionSettings | None = None) -> CalcDocument:
     """Alias for active_document to mirror plan naming."""
 
-    return active_document()
+    return active_document(settings)
 
 
-def this_document() -> CalcDocument:
-    return active_document()
+def this_document(settings: ConnectionSettings | None = None) -> CalcDocument:
+    return active_document(settings)
 
 
 # XSCRIPTCONTEXT に接続する
 def connect_calc_script(xscriptcontext) -> Tuple[Any, CalcDocument, Spreadsheet]:
-    global current_desktop
+    global current_desktop, current_settings, current_context
     desktop = xscriptcontext.getDesktop()
-    doc = CalcDocument(desktop.getCurrentComponent())
+    doc = CalcDocument(desktop.getCurrentComponent(), xscriptcontext.getComponentContext())
     controller = doc.raw.getCurrentController()
     sheet = Spreadsheet(controller.getActiveSheet(), document=doc)
     current_desktop = desktop
+    current_settings = None
+    current_context = xscriptcontext.getComponentContext()
     return desktop, doc, sheet
 
 
-def connect_writer() -> Tuple[Any, WriterDocument]:
+def connect_writer(settings: ConnectionSettings | None = None) -> Tuple[Any, WriterDocument]:
     """Connect to an active Writer document.
 
     Returns:
@@ -211,7 +325,7 @@ def connect_writer() -> Tuple[Any, WriterDocument]:
         RuntimeError: when UNO runtime is unavailable or no Writer document is active.
     """
 
-    desktop = get_desktop()
+    desktop = get_desktop(settings)
     doc = desktop.getCurrentComponent()
     if doc is None or not doc.supportsService("com.sun.star.text.TextDocument"):
         raise RuntimeError("No active Writer document found")
@@ -219,8 +333,8 @@ def connect_writer() -> Tuple[Any, WriterDocument]:
     return desktop, WriterDocument(doc)
 
 
-def active_sheet() -> Spreadsheet:
-    doc = active_document()
+def active_sheet(settings: ConnectionSettings | None = None) -> Spreadsheet:
+    doc = active_document(settings)
     controller = doc.raw.getCurrentController()
     sheet = controller.getActiveSheet()
     return Spreadsheet(sheet, document=doc)
@@ -232,8 +346,8 @@ ActiveSheet = _LazyAlias(active_sheet)
 ThisDesktop = _LazyAlias(this_desktop)
 
 
-def this_sheet() -> Spreadsheet:
-    return active_sheet()
+def this_sheet(settings: ConnectionSettings | None = None) -> Spreadsheet:
+    return active_sheet(settings)
 
 
 def wrap_sheet(sheet_obj: Any) -> Spreadsheet:
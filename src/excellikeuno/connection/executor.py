@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from ..core.calc_document import CalcDocument
+from .pool import OfficePool, OfficeWorker
+
+
+@dataclass
+class DocumentResult:
+    """Outcome of one map_documents job."""
+
+    path: str
+    value: Any = None
+    error: BaseException | None = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_job(
+    pool: OfficePool,
+    func: Callable[[CalcDocument, str], Any],
+    path: str,
+    *,
+    timeout: float | None,
+    retries: int,
+    read_only: bool,
+    filter_name: str | None,
+) -> DocumentResult:
+    attempts = 0
+    while True:
+        attempts += 1
+        timed_out = threading.Event()
+        with pool.worker() as worker:
+            timer = None
+            if timeout is not None:
+                timer = threading.Timer(timeout, _expire, args=(worker, timed_out))
+                timer.daemon = True
+                timer.start()
+            try:
+                document = worker.open_document(path, read_only=read_only, filter_name=filter_name)
+                try:
+                    value = func(document, path)
+                finally:
+                    try:
+                        document.close(True)
+                    except Exception:
+                        pass
+                error: BaseException | None = None
+            except Exception as exc:
+                error = exc
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+            if error is None:
+                return DocumentResult(path, value=value, attempts=attempts)
+            if timed_out.is_set():
+                error = TimeoutError(f"{path}: job exceeded {timeout} seconds")
+            # Only bridge/office failures are worth retrying; errors raised by func on a
+            # healthy worker would fail the same way again.
+            bridge_failed = timed_out.is_set() or not worker.is_alive()
+
+        if not bridge_failed or attempts > retries:
+            return DocumentResult(path, error=error, attempts=attempts)
+
+
+def _expire(worker: OfficeWorker, timed_out: threading.Event) -> None:
+    timed_out.set()
+    # Killing the office makes the blocked bridge call fail; the pool restarts it.
+    worker.kill()
+
+
+def map_documents(
+    func: Callable[[CalcDocument, str], Any],
+    paths: Iterable[str],
+    workers: int | None = None,
+    *,
+    timeout: float | None = None,
+    retries: int = 1,
+    read_only: bool = False,
+    filter_name: str | None = None,
+    pool: OfficePool | None = None,
+    **pool_options: Any,
+) -> Iterator[DocumentResult]:
+    """Run ``func(document, path)`` for every path on a pool of office workers.
+
+    Results are yielded as jobs complete (not in input order). Every document is
+    closed after its job. A job that exceeds ``timeout`` seconds has its worker
+    killed and restarted; jobs failing because the office died or timed out are
+    retried up to ``retries`` times. Exceptions raised by ``func`` are reported in
+    the result instead of being raised.
+
+    Uses an existing ``pool`` when given; otherwise starts ``OfficePool(workers,
+    **pool_options)`` and closes it when the iteration ends.
+    """
+
+    paths = list(paths)
+    if not paths:
+        return
+    own_pool = pool is None
+    active = pool if pool is not None else OfficePool(workers, **pool_options)
+    active.start()
+
+    jobs: queue.Queue[str] = queue.Queue()
+    for path in paths:
+        jobs.put(path)
+    results: queue.Queue[DocumentResult] = queue.Queue()
+    cancelled = threading.Event()
+
+    def run() -> None:
+        while not cancelled.is_set():
+            try:
+                path = jobs.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result = _run_job(
+                    active,
+                    func,
+                    path,
+                    timeout=timeout,
+                    retries=retries,
+                    read_only=read_only,
+                    filter_name=filter_name,
+                )
+            except BaseException as exc:  # pool closed or worker could not restart
+                result = DocumentResult(path, error=exc, attempts=1)
+            results.put(result)
+
+    threads = [
+        threading.Thread(target=run, name=f"excellikeuno-job-{index}", daemon=True)
+        for index in range(min(active.size, len(paths)))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(len(paths)):
+            yield results.get()
+    finally:
+        cancelled.set()
+        if own_pool:
+            active.close()
+        for thread in threads:
+            thread.join(timeout=1.0)
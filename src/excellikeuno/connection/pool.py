@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Sequence, Tuple
+
+from ..core.calc_document import CalcDocument
+from .bootstrap import _file_url, _load_calc_document, _resolve_context
+from .settings import ConnectionSettings
+
+
+def _process_tree_rss_kb(pid: int) -> int:
+    """Resident memory (kB) of ``pid`` and its descendants, read from /proc (Linux only)."""
+
+    parents: dict[int, int] = {}
+    rss: dict[int, int] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status", encoding="ascii", errors="replace") as fh:
+                ppid = 0
+                vm_rss = 0
+                for line in fh:
+                    if line.startswith("PPid:"):
+                        ppid = int(line.split()[1])
+                    elif line.startswith("VmRSS:"):
+                        vm_rss = int(line.split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        parents[int(entry)] = ppid
+        rss[int(entry)] = vm_rss
+
+    total = 0
+    pending = [pid]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        total += rss.get(current, 0)
+        pending.extend(child for child, parent in parents.items() if parent == current)
+    return total
+
+
+class OfficeWorker:
+    """One headless soffice process with its own user profile and pipe."""
+
+    def __init__(
+        self,
+        index: int,
+        *,
+        soffice: str = "soffice",
+        profile_root: str | os.PathLike[str] | None = None,
+        startup_timeout: float = 30.0,
+        extra_args: Sequence[str] = (),
+    ) -> None:
+        self.index = index
+        self.soffice = soffice
+        self.startup_timeout = startup_timeout
+        self.extra_args = tuple(extra_args)
+        self.settings = ConnectionSettings.pipe(f"excellikeuno-{os.getpid()}-{index}-{uuid.uuid4().hex[:8]}")
+        root = Path(profile_root) if profile_root is not None else Path(tempfile.gettempdir())
+        self.profile_dir = root / f"excellikeuno-profile-{self.settings.pipe_name}"
+        self.process: subprocess.Popen[bytes] | None = None
+        self.desktop: Any = None
+        self.context: Any = None
+        self.jobs = 0
+
+    def command(self) -> List[str]:
+        return [
+            self.soffice,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nodefault",
+            "--norestore",
+            "--nolockcheck",
+            f"-env:UserInstallation={self.profile_dir.as_uri()}",
+            f"--accept={self.settings.accept_argument()}",
+            *self.extra_args,
+        ]
+
+    def launch(self) -> None:
+        """Spawn the soffice process without waiting for it to accept connections."""
+
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen(
+            self.command(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def start(self) -> Any:
+        """Launch soffice (unless already launched) and connect; returns the desktop."""
+
+        if self.process is None or self.process.poll() is not None:
+            self.launch()
+        settings = ConnectionSettings.pipe(self.settings.pipe_name, timeout=self.startup_timeout)
+        try:
+            ctx = _resolve_context(settings)
+            self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+            self.context = ctx
+        except Exception as exc:
+            self.stop()
+            raise RuntimeError(f"Failed to start office worker {self.index}") from exc
+        self.jobs = 0
+        return self.desktop
+
+    def is_alive(self) -> bool:
+        if self.process is None or self.process.poll() is not None or self.desktop is None:
+            return False
+        try:
+            self.desktop.getImplementationName()
+            return True
+        except Exception:
+            return False
+
+    def memory_kb(self) -> int:
+        if self.process is None:
+            return 0
+        return _process_tree_rss_kb(self.process.pid)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        desktop, process = self.desktop, self.process
+        self.desktop = None
+        self.context = None
+        self.process = None
+        if desktop is not None:
+            try:
+                desktop.terminate()
+            except Exception:
+                pass
+        if process is None:
+            return
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            pass
+        # soffice forks soffice.bin; signal the whole session so nothing is left behind.
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(process.pid, sig)
+            except (OSError, AttributeError):
+                break
+            try:
+                process.wait(timeout=timeout)
+                break
+            except subprocess.TimeoutExpired:
+                continue
+
+    def kill(self) -> None:
+        """Kill the process group at once, without talking to a possibly hung bridge."""
+
+        process = self.process
+        self.desktop = None
+        self.context = None
+        if process is None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (OSError, AttributeError):
+            process.kill()
+
+    def restart(self) -> Any:
+        self.stop()
+        return self.start()
+
+    def open_document(
+        self,
+        path: str | None = None,
+        *,
+        hidden: bool = True,
+        read_only: bool = False,
+        as_template: bool = False,
+        filter_name: str | None = None,
+    ) -> CalcDocument:
+        """Open ``path`` (or a new empty Calc document) on this worker's desktop."""
+
+        if path is None:
+            url = "private:factory/scalc"
+            options: dict[str, Any] = {"Hidden": hidden}
+        else:
+            url = _file_url(os.path.abspath(path))
+            options = {
+                "Hidden": hidden,
+                "ReadOnly": read_only,
+                "AsTemplate": as_template,
+                "FilterName": filter_name,
+            }
+        document, _ = _load_calc_document(self.desktop, url, options, self.context)
+        return document
+
+    def remove_profile(self) -> None:
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class OfficePool:
+    """Pool of headless soffice workers handing out ``(desktop, CalcDocument)`` leases.
+
+    Each worker has its own ``-env:UserInstallation`` profile and pipe, so N workers
+    use N cores. Workers that crashed, ran ``max_jobs`` leases or grew beyond
+    ``max_memory_mb`` are restarted before their next lease.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        *,
+        soffice: str = "soffice",
+        max_jobs: int | None = None,
+        max_memory_mb: int | None = None,
+        startup_timeout: float = 30.0,
+        profile_root: str | os.PathLike[str] | None = None,
+        extra_args: Sequence[str] = (),
+    ) -> None:
+        self.size = max(1, int(size if size is not None else (os.cpu_count() or 1)))
+        self.max_jobs = max_jobs
+        self.max_memory_mb = max_memory_mb
+        self._owns_profile_root = profile_root is None
+        self._profile_root = Path(profile_root) if profile_root is not None else Path(
+            tempfile.mkdtemp(prefix="excellikeuno-pool-")
+        )
+        self.workers = [
+            OfficeWorker(
+                index,
+                soffice=soffice,
+                profile_root=self._profile_root,
+                startup_timeout=startup_timeout,
+                extra_args=extra_args,
+            )
+            for index in range(self.size)
+        ]
+        self._idle: queue.Queue[OfficeWorker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    # lifecycle ------------------------------------------------------------
+    def start(self) -> "OfficePool":
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("OfficePool is closed")
+            if self._started:
+                return self
+            # Spawn every process first so their (slow) startups overlap.
+            for worker in self.workers:
+                worker.launch()
+            try:
+                for worker in self.workers:
+                    worker.start()
+            except Exception:
+                for worker in self.workers:
+                    worker.stop()
+                raise
+            for worker in self.workers:
+                self._idle.put(worker)
+            self._started = True
+        return self
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for worker in self.workers:
+            worker.stop()
+            worker.remove_profile()
+        if self._owns_profile_root:
+            shutil.rmtree(self._profile_root, ignore_errors=True)
+
+    def __enter__(self) -> "OfficePool":
+        return self.start()
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
+    # health ---------------------------------------------------------------
+    def _needs_restart(self, worker: OfficeWorker) -> bool:
+        if not worker.is_alive():
+            return True
+        if self.max_jobs is not None and worker.jobs >= self.max_jobs:
+            return True
+        if self.max_memory_mb is not None and worker.memory_kb() > self.max_memory_mb * 1024:
+            return True
+        return False
+
+    def _acquire(self, timeout: float | None) -> OfficeWorker:
+        if not self._started:
+            self.start()
+        if self._closed:
+            raise RuntimeError("OfficePool is closed")
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No office worker became available") from None
+        try:
+            if self._needs_restart(worker):
+                worker.restart()
+        except Exception:
+            self._idle.put(worker)
+            raise
+        return worker
+
+    def _release(self, worker: OfficeWorker) -> None:
+        worker.jobs += 1
+        if self._closed:
+            return
+        self._idle.put(worker)
+
+    # leases ---------------------------------------------------------------
+    @contextmanager
+    def worker(self, timeout: float | None = None) -> Iterator[OfficeWorker]:
+        """Borrow a healthy worker for the duration of the block."""
+
+        worker = self._acquire(timeout)
+        try:
+            yield worker
+        finally:
+            self._release(worker)
+
+    @contextmanager
+    def lease(
+        self,
+        path: str | None = None,
+        *,
+        hidden: bool = True,
+        read_only: bool = False,
+        as_template: bool = False,
+        filter_name: str | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[Tuple[Any, CalcDocument]]:
+        """Yield ``(desktop, document)`` on a free worker; the document is always closed.
+
+        Opens ``path`` when given, otherwise a new empty Calc document.
+        """
+
+        with self.worker(timeout) as worker:
+            document = worker.open_document(
+                path, hidden=hidden, read_only=read_only, as_template=as_template, filter_name=filter_name
+            )
+            try:
+                yield worker.desktop, document
+            finally:
+                try:
+                    document.close(True)
+                except Exception:
+                    pass
+
+    def stats(self) -> List[dict[str, Any]]:
+        """Per-worker job counts, memory use and liveness."""
+
+        return [
+            {
+                "index": worker.index,
+                "pipe": worker.settings.pipe_name,
+                "jobs": worker.jobs,
+                "memory_kb": worker.memory_kb(),
+                "alive": worker.process is not None and worker.process.poll() is None,
+            }
+            for worker in self.workers
+        ]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import textwrap
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from ..core.calc_document import CalcDocument
+from . import bootstrap
+
+ENTRY_POINT = "_excellikeuno_entry"
+SCRIPTS_FOLDER = "$(user)/Scripts/python"
+
+# (scripts folder URL, module name) pairs already written by this process.
+_installed: Set[Tuple[str, str]] = set()
+
+_ENTRY_SOURCE = '''
+def _excellikeuno_entry(model, payload):
+    import json
+    import traceback
+
+    from excellikeuno.core.calc_document import CalcDocument
+
+    request = json.loads(payload)
+    try:
+        func = globals()[request["func"]]
+        value = func(CalcDocument(model), *request["args"], **request["kwargs"])
+        return json.dumps({"ok": True, "value": value})
+    except Exception as exc:
+        return json.dumps(
+            {
+                "ok": False,
+                "type": type(exc).__name__,
+                "message": str(exc),
+                "traceback": traceback.format_exc(),
+            }
+        )
+
+
+g_exportedScripts = (_excellikeuno_entry,)
+'''
+
+
+class PushdownError(RuntimeError):
+    """An exception raised by a pushed-down function inside the office process."""
+
+    def __init__(self, type_name: str, message: str, remote_traceback: str = "") -> None:
+        super().__init__(f"{type_name}: {message}")
+        self.type_name = type_name
+        self.remote_traceback = remote_traceback
+
+
+def _function_source(func: Callable[..., Any]) -> str:
+    """Module-level source of ``func`` without decorators."""
+
+    name = getattr(func, "__name__", "")
+    if not inspect.isfunction(func) or name == "<lambda>":
+        raise ValueError("Only named functions can be pushed down")
+    if func.__code__.co_freevars:
+        raise ValueError(f"{name} uses closure variables; pushed-down functions must be self-contained")
+    lines = textwrap.dedent(inspect.getsource(func)).splitlines()
+    while lines and not lines[0].lstrip().startswith(("def ", "async def ")):
+        lines.pop(0)
+    if not lines:
+        raise ValueError(f"Cannot find the definition of {name}")
+    return "\n".join(lines) + "\n"
+
+
+def _module_source(functions: List[Callable[..., Any]]) -> str:
+    parts = ['"""Generated by excellikeuno.connection.pushdown; do not edit."""\n']
+    parts.extend(_function_source(func) for func in functions)
+    parts.append(_ENTRY_SOURCE)
+    return "\n\n".join(parts)
+
+
+class ScriptPushdown:
+    """Run registered Python functions inside the office next to ``document``.
+
+    The functions are written as one module into the office user's
+    ``Scripts/python`` folder and invoked through XScriptProvider, so a loop over
+    thousands of cells costs a single bridge round trip. Each function is called as
+    ``func(document, *args, **kwargs)`` with a CalcDocument wrapping the same
+    document; arguments and the return value must be JSON serializable.
+
+    Functions must be self-contained (imports inside the body, no closures) and
+    excellikeuno must be importable by the office's Python.
+
+    The module is written through the component context of the office that runs
+    the script: ``context`` when given, else the one the document was opened with
+    (``CalcDocument.context``), else the last context connected by this process.
+    """
+
+    def __init__(self, document: CalcDocument, *functions: Callable[..., Any], context: Any = None) -> None:
+        self.document = document
+        self.context = context
+        self._functions: Dict[str, Callable[..., Any]] = {}
+        self._module: str | None = None
+        for func in functions:
+            self.register(func)
+
+    def register(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Add ``func`` to the pushed-down module; usable as a decorator."""
+
+        _function_source(func)
+        self._functions[func.__name__] = func
+        self._module = None
+        return func
+
+    def _context(self) -> Any:
+        ctx = self.context
+        if ctx is None:
+            ctx = getattr(self.document, "context", None)
+        if ctx is None:
+            ctx = bootstrap.current_context
+        if ctx is None:
+            raise RuntimeError("No office component context; connect first or pass context=")
+        return ctx
+
+    def _create(self, service: str) -> Any:
+        ctx = self._context()
+        return ctx.ServiceManager.createInstanceWithContext(service, ctx)
+
+    def _write_module(self, folder: str, name: str, source: str) -> None:
+        try:
+            import uno  # type: ignore
+        except ImportError as exc:  # pragma: no cover - depends on LibreOffice runtime
+            raise RuntimeError("UNO runtime is not available") from exc
+
+        files = self._create("com.sun.star.ucb.SimpleFileAccess")
+        if not files.exists(folder):
+            files.createFolder(folder)
+        url = f"{folder}/{name}.py"
+        if files.exists(url):
+            files.kill(url)
+        stream = files.openFileWrite(url)
+        try:
+            stream.writeBytes(uno.ByteSequence(source.encode("utf-8")))
+        finally:
+            stream.closeOutput()
+
+    def install(self) -> str:
+        """Write the module into the office (once per content) and return its name."""
+
+        if self._module is not None:
+            return self._module
+        if not self._functions:
+            raise ValueError("No functions registered")
+        source = _module_source(list(self._functions.values()))
+        # Content-addressed name: the office never runs a stale cached module.
+        name = "excellikeuno_pushdown_" + hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+        folder = self._create("com.sun.star.util.PathSubstitution").substituteVariables(SCRIPTS_FOLDER, True)
+        if (folder, name) not in _installed:
+            self._write_module(folder, name, source)
+            _installed.add((folder, name))
+        self._module = name
+        return name
+
+    def _script_provider(self) -> Any:
+        try:
+            return self.document.raw.getScriptProvider()
+        except Exception:
+            factory = self._create("com.sun.star.script.provider.MasterScriptProviderFactory")
+            return factory.createScriptProvider("")
+
+    def call(self, func: Callable[..., Any] | str, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(document, *args, **kwargs)`` in the office and return its result."""
+
+        name = func if isinstance(func, str) else func.__name__
+        if name not in self._functions:
+            if isinstance(func, str):
+                raise KeyError(f"Function not registered: {name}")
+            self.register(func)
+        module = self.install()
+        uri = f"vnd.sun.star.script:{module}.py${ENTRY_POINT}?language=Python&location=user"
+        script = self._script_provider().getScript(uri)
+        payload = json.dumps({"func": name, "args": list(args), "kwargs": kwargs})
+        result = script.invoke((self.document.raw, payload), (), ())
+        # pyuno returns (value, out_param_index, out_params).
+        if isinstance(result, tuple):
+            result = result[0]
+        response = json.loads(result)
+        if not response.get("ok"):
+            raise PushdownError(response.get("type", "Error"), response.get("message", ""), response.get("traceback", ""))
+        return response.get("value")
+
+
+def run_in_office(
+    document: CalcDocument, func: Callable[..., Any], *args: Any, context: Any = None, **kwargs: Any
+) -> Any:
+    """Run ``func(document, *args, **kwargs)`` inside the office in one round trip.
+
+    ``context`` (keyword-only, not passed to ``func``) overrides the component
+    context used to install the module; see ScriptPushdown.
+    """
+
+    return ScriptPushdown(document, func, context=context).call(func, *args, **kwargs)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Mapping
+
+# Environment variables read by ConnectionSettings.from_env().
+ENV_TRANSPORT = "EXCELLIKEUNO_TRANSPORT"
+ENV_HOST = "EXCELLIKEUNO_HOST"
+ENV_PORT = "EXCELLIKEUNO_PORT"
+ENV_PIPE_NAME = "EXCELLIKEUNO_PIPE_NAME"
+ENV_TIMEOUT = "EXCELLIKEUNO_TIMEOUT"
+ENV_VARS = (ENV_TRANSPORT, ENV_HOST, ENV_PORT, ENV_PIPE_NAME, ENV_TIMEOUT)
+
+TRANSPORTS = ("socket", "pipe")
+
+
+@dataclass(frozen=True)
+class ConnectionSettings:
+    """Where and how to reach a running office over URP.
+
+    ``transport`` is ``"socket"`` (host/port) or ``"pipe"`` (pipe_name; local only,
+    avoids TCP overhead). ``timeout`` is how many seconds to keep retrying while the
+    office is still starting; 0 means a single attempt.
+    """
+
+    transport: str = "socket"
+    host: str = "localhost"
+    port: int = 2002
+    pipe_name: str = "excellikeuno"
+    timeout: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.transport not in TRANSPORTS:
+            raise ValueError(f"transport must be one of {TRANSPORTS}, not {self.transport!r}")
+
+    @classmethod
+    def socket(cls, host: str = "localhost", port: int = 2002, timeout: float = 0.0) -> "ConnectionSettings":
+        return cls(transport="socket", host=host, port=int(port), timeout=float(timeout))
+
+    @classmethod
+    def pipe(cls, name: str = "excellikeuno", timeout: float = 0.0) -> "ConnectionSettings":
+        return cls(transport="pipe", pipe_name=name, timeout=float(timeout))
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "ConnectionSettings":
+        """Build settings from EXCELLIKEUNO_* variables; unset ones keep their defaults."""
+
+        env = os.environ if environ is None else environ
+        default = cls()
+        return cls(
+            transport=env.get(ENV_TRANSPORT, default.transport).strip().lower(),
+            host=env.get(ENV_HOST, default.host),
+            port=int(env.get(ENV_PORT, default.port)),
+            pipe_name=env.get(ENV_PIPE_NAME, default.pipe_name),
+            timeout=float(env.get(ENV_TIMEOUT, default.timeout)),
+        )
+
+    @staticmethod
+    def in_env(environ: Mapping[str, str] | None = None) -> bool:
+        """True when any EXCELLIKEUNO_* connection variable is set."""
+
+        env = os.environ if environ is None else environ
+        return any(name in env for name in ENV_VARS)
+
+    @property
+    def connection(self) -> str:
+        """Connection part of a UNO URL / ``soffice --accept`` argument."""
+
+        if self.transport == "pipe":
+            return f"pipe,name={self.pipe_name}"
+        return f"socket,host={self.host},port={self.port}"
+
+    def to_uno_url(self, object_name: str = "StarOffice.ComponentContext") -> str:
+        return f"uno:{self.connection};urp;{object_name}"
+
+    def accept_argument(self) -> str:
+        """Value for ``soffice --accept=...`` that matches this connection."""
+
+        return f"{self.connection};urp;StarOffice.ComponentContext"
@@ -1,5 +1,34 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import UnoObject
-from ..typing import InterfaceNames
-from .calc_document import CalcDocument
+from ..typing.interfaces import InterfaceNames
+
+if TYPE_CHECKING:
+    from .calc_document import CalcDocument
+    from .recording import Recorder, Replayer, replay
+    from .tracing import Tracer
+
+# CalcDocument はシート・図形まで読み込むため、使うときまで遅延する
+_LAZY = {
+    "CalcDocument": ".calc_document",
+    "Tracer": ".tracing",
+    "Recorder": ".recording",
+    "Replayer": ".recording",
+    "replay": ".recording",
+}
+
+__all__ = ["UnoObject", "InterfaceNames", "CalcDocument", "Tracer", "Recorder", "Replayer", "replay"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["UnoObject", "InterfaceNames", "CalcDocument"]
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
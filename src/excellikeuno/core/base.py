@@ -1,18 +1,67 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import sys
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from . import tracing
+from .properties import PropertySetInfo, property_set_info
+
+# Process-wide cache of resolved UNO types keyed by interface name (None for unknown names).
+_UNO_TYPES: Dict[str, Any] = {}
+# sys.path at the last failed ``import uno``; retried once the path changes.
+_NO_RUNTIME_PATH: Optional[Tuple[str, ...]] = None
+
+
+def resolve_uno_type(name: str) -> Any:
+    """Resolve a UNO type by name once per process; return None without a UNO runtime.
+
+    A missing runtime is not cached per name: ``uno`` is imported again once it
+    shows up in sys.modules or sys.path changes (e.g. after bootstrapping).
+    """
+    global _NO_RUNTIME_PATH
+    try:
+        return _UNO_TYPES[name]
+    except KeyError:
+        pass
+    uno = sys.modules.get("uno")
+    if uno is None:
+        path = tuple(sys.path)
+        if path == _NO_RUNTIME_PATH:
+            return None
+        try:
+            import uno  # type: ignore
+        except ImportError:
+            _NO_RUNTIME_PATH = path
+            return None
+        _NO_RUNTIME_PATH = None
+    try:
+        iface_type = uno.getTypeByName(name)
+    except Exception:
+        iface_type = None
+    _UNO_TYPES[name] = iface_type
+    return iface_type
 
 
 class UnoObject:
     """Holds a UNO object and caches queried interfaces."""
 
+    # Interfaces the wrapped object is known to implement directly (e.g. Calc cells
+    # are XCell and XPropertySet). iface() returns the object itself for these
+    # without a type lookup or a queryInterface round trip.
+    _direct_interfaces: FrozenSet[str] = frozenset()
+
+    # UNO service every instance of this wrapper belongs to. When set, one cached
+    # XPropertySetInfo is shared by all instances (see _property_set_info).
+    _property_info_key: Optional[str] = None
+
     def __init__(self, obj: Any) -> None:
-        self._obj = obj
+        # Keep the raw object even when built from a traced proxy (see tracing.Tracer).
+        self._obj = tracing.unwrap(obj)
         self._iface_cache: Dict[str, Any] = {}
 
     def __getattr__(self, name: str) -> Any:  # pragma: no cover - passthrough
         # Wrapperで未定義の属性は生のUNOオブジェクトへ委譲する。
-        return getattr(self._obj, name)
+        return getattr(self.raw, name)
 
     def __setattr__(self, name: str, value: Any) -> None:  # pragma: no cover - passthrough
         if name.startswith("_"):
@@ -29,45 +78,56 @@ class UnoObject:
             return
         # それ以外は UNO オブジェクトへ委譲
         try:
-            setattr(self._obj, name, value)
+            setattr(self.raw, name, value)
         except AttributeError as exc:
             raise AttributeError(name) from exc
 
     def iface(self, name: str) -> Any:
         """Query and memoize a UNO interface by name."""
+        if name in self._direct_interfaces:
+            return self.raw
         if name not in self._iface_cache:
-            query = getattr(self._obj, "queryInterface", None)
+            query = getattr(self.raw, "queryInterface", None)
             if query is None:
                 raise AttributeError("UNO object missing queryInterface")
             iface_obj: Any = None
 
             # Prefer UNO type resolution when available (real UNO objects),
             # but fall back to the provided name for lightweight test doubles.
-            try:
-                import uno  # type: ignore
-
+            iface_type = resolve_uno_type(name)
+            if iface_type is not None:
                 try:
-                    iface_type = uno.getTypeByName(name)
                     iface_obj = query(iface_type)
                 except Exception:
                     iface_obj = None
-            except Exception:
-                iface_obj = None
 
             if iface_obj is None:
                 iface_obj = query(name)
 
-            self._iface_cache[name] = iface_obj
-        return self._iface_cache[name]
+            self._iface_cache[name] = tracing.unwrap(iface_obj)
+        iface_obj = self._iface_cache[name]
+        if tracing.active_tracer is not None:
+            return tracing.active_tracer.wrap(iface_obj)
+        return iface_obj
+
+    def _property_set_info(self) -> Optional[PropertySetInfo]:
+        """Return the shared property info for this wrapper's service, if it has one."""
+        key = self._property_info_key
+        if key is None:
+            return None
+        return property_set_info(self.iface("com.sun.star.beans.XPropertySet"), key)
 
     @property
     def raw(self) -> Any:
         """Expose the wrapped UNO object when direct access is needed."""
+        # While a tracing.Tracer is active, calls through this object are recorded.
+        if tracing.active_tracer is not None:
+            return tracing.active_tracer.wrap(self._obj)
         return self._obj
 
     def queryInterface(self, iface: Any) -> Any:
         """Delegate queryInterface to the wrapped UNO object when present."""
-        target = getattr(self._obj, "queryInterface", None)
+        target = getattr(self.raw, "queryInterface", None)
         if target is None:
             raise AttributeError("UNO object missing queryInterface")
         return target(iface)
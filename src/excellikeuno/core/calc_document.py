@@ -1,15 +1,32 @@
 from __future__ import annotations
 
-from typing import Any, List, cast
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Iterator, List, cast
 
 from ..sheet import Spreadsheet
+from ..sheet.dates import null_date_from_struct
 from ..typing import InterfaceNames, XSpreadsheet, XSpreadsheetDocument, XStorable
+from ..typing.interfaces import StructNames
 from .base import UnoObject
 
 
 class CalcDocument(UnoObject):
     """Wraps a Calc XSpreadsheetDocument."""
 
+    _direct_interfaces = frozenset({InterfaceNames.X_SPREADSHEET_DOCUMENT, InterfaceNames.X_STORABLE})
+
+    def __init__(self, obj: Any, context: Any = None) -> None:
+        super().__init__(obj)
+        # このドキュメントを開いた office のコンポーネントコンテキスト（分からなければ None）
+        self._context = context
+
+    @property
+    def context(self) -> Any:
+        """Component context of the office that owns this document, when known."""
+
+        return self._context
+
     @property
     def storable(self) -> XStorable:
         return cast(XStorable, self.iface(InterfaceNames.X_STORABLE))
@@ -20,6 +37,17 @@ class CalcDocument(UnoObject):
 
         return uno.systemPathToFileUrl(path)
 
+    @staticmethod
+    def _default_locale() -> Any:
+        """Empty com.sun.star.lang.Locale (the office default locale)."""
+
+        try:
+            import uno  # type: ignore
+
+            return uno.createUnoStruct(StructNames.LOCALE)
+        except ImportError:
+            return None
+
     @staticmethod
     def _make_properties(options: dict[str, Any]) -> tuple[Any, ...]:
         from com.sun.star.beans import PropertyValue  # type: ignore
@@ -39,6 +67,18 @@ class CalcDocument(UnoObject):
         options: dict[str, Any] = {"FilterName": filter_name, "Overwrite": overwrite}
         self.storable.storeToURL(self._to_url(path), self._make_properties(options))
 
+    def close(self, deliver_ownership: bool = True) -> None:
+        """Close the document (XCloseable), falling back to dispose()."""
+
+        closer = getattr(self.raw, "close", None)
+        if callable(closer):
+            try:
+                closer(deliver_ownership)
+                return
+            except Exception:
+                pass
+        self.raw.dispose()
+
     @property
     def is_modified(self) -> bool:
         return bool(self.storable.isModified())
@@ -71,6 +111,77 @@ class CalcDocument(UnoObject):
             raise AttributeError("Document frame does not support activate")
         activate()
 
+    @contextmanager
+    def batch(self, undo_title: str = "Batch") -> Iterator["CalcDocument"]:
+        """Suspend repaint and automatic recalculation while doing bulk edits.
+
+        Locks the controllers, adds an action lock, disables automatic calculation
+        and groups every change into one undo action named ``undo_title``. On exit
+        (also on error) all of this is restored and, when automatic calculation was
+        enabled, the document is recalculated once. Nested batches are no-ops.
+        """
+
+        depth = self.__dict__.get("_batch_depth", 0)
+        self._batch_depth = depth + 1
+        if depth:
+            try:
+                yield self
+            finally:
+                self._batch_depth = depth
+            return
+
+        doc = self.raw
+        undo = None
+        auto_calc = False
+        locked_controllers = False
+        action_locked = False
+        try:
+            try:
+                doc.lockControllers()
+                locked_controllers = True
+            except Exception:
+                pass
+            try:
+                doc.addActionLock()
+                action_locked = True
+            except Exception:
+                pass
+            try:
+                auto_calc = bool(doc.isAutomaticCalculationEnabled())
+                if auto_calc:
+                    doc.enableAutomaticCalculation(False)
+            except Exception:
+                auto_calc = False
+            try:
+                undo = doc.getUndoManager()
+                undo.enterUndoContext(undo_title)
+            except Exception:
+                undo = None
+            yield self
+        finally:
+            self._batch_depth = depth
+            if undo is not None:
+                try:
+                    undo.leaveUndoContext()
+                except Exception:
+                    pass
+            if auto_calc:
+                try:
+                    doc.enableAutomaticCalculation(True)
+                    doc.calculateAll()
+                except Exception:
+                    pass
+            if action_locked:
+                try:
+                    doc.removeActionLock()
+                except Exception:
+                    pass
+            if locked_controllers:
+                try:
+                    doc.unlockControllers()
+                except Exception:
+                    pass
+
     def _sheets(self):
         doc = cast(XSpreadsheetDocument, self.iface(InterfaceNames.X_SPREADSHEET_DOCUMENT))
         return doc.getSheets()
@@ -164,6 +275,49 @@ class CalcDocument(UnoObject):
     def this_sheet(self) -> Spreadsheet:
         return self.active_sheet
 
+    # dates / number formats
+    # NullDate と表示形式の種類は一度読んだらキャッシュする（範囲の読み書きごとに
+    # UNO を往復しないため）。ドキュメント側で変えたときは refresh_number_formats() を呼ぶ
+    @property
+    def null_date(self) -> date:
+        """Day 0 of the document's date serial numbers (the NullDate setting, cached)."""
+
+        cached = self.__dict__.get("_null_date")
+        if cached is None:
+            cached = self._null_date = null_date_from_struct(self.raw.getPropertyValue("NullDate"))
+        return cached
+
+    def _number_formats(self) -> Any:
+        formats = self.__dict__.get("_formats")
+        if formats is None:
+            formats = self._formats = self.raw.getNumberFormats()
+        return formats
+
+    def number_format_type(self, key: int) -> int:
+        """com.sun.star.util.NumberFormat type bits of number format ``key`` (cached)."""
+
+        types: dict[int, int] = self.__dict__.setdefault("_format_types", {})
+        key = int(key)
+        if key not in types:
+            types[key] = int(self._number_formats().getByKey(key).Type)
+        return types[key]
+
+    def standard_format(self, format_type: int) -> int:
+        """Key of the default-locale standard format for ``format_type`` (e.g. dates.DATE, cached)."""
+
+        standards: dict[int, int] = self.__dict__.setdefault("_standard_formats", {})
+        if format_type not in standards:
+            key = int(self._number_formats().getStandardFormat(format_type, self._default_locale()))
+            standards[format_type] = key
+            self.__dict__.setdefault("_format_types", {})[key] = format_type
+        return standards[format_type]
+
+    def refresh_number_formats(self) -> None:
+        """Forget the cached NullDate and number format types."""
+
+        for name in ("_null_date", "_formats", "_format_types", "_standard_formats"):
+            self.__dict__.pop(name, None)
+
 
     # XModel interface methods
     @property
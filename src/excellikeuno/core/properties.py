@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from . import tracing
+
+# XPropertySetInfo snapshots shared by every wrapper of the same UNO service, keyed
+# by (service key, Python type of the object) so fakes and pyuno objects in one
+# process do not share handles. None records an object that cannot describe itself.
+_PROPERTY_INFO: Dict[Tuple[str, type], Optional["PropertySetInfo"]] = {}
+
+
+class PropertySetInfo:
+    """Property names and handles of one UNO service, fetched once per process.
+
+    When the object implements XFastPropertySet, properties in the snapshot are
+    read and written through their handles. Names missing from the snapshot (an
+    optional property of another instance, say) still go to the object by name.
+    """
+
+    __slots__ = ("_handles", "fast")
+
+    def __init__(self, handles: Mapping[str, int], fast: bool = False) -> None:
+        self._handles = dict(handles)
+        self.fast = fast
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._handles
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def _fast_handle(self, name: str) -> int:
+        """Handle to use with XFastPropertySet, or -1 to go by name."""
+        if not self.fast:
+            return -1
+        return self._handles.get(name, -1)
+
+    def get_value(self, props: Any, name: str) -> Any:
+        handle = self._fast_handle(name)
+        if handle >= 0:
+            return props.getFastPropertyValue(handle)
+        return props.getPropertyValue(name)
+
+    def set_value(self, props: Any, name: str, value: Any) -> None:
+        handle = self._fast_handle(name)
+        if handle >= 0:
+            props.setFastPropertyValue(handle, value)
+            return
+        props.setPropertyValue(name, value)
+
+
+def property_set_info(props: Any, key: str) -> PropertySetInfo | None:
+    """Return the PropertySetInfo cached under ``key``, fetching it from ``props`` once.
+
+    Returns None when the object cannot describe its properties (e.g. test doubles);
+    that answer is cached too, so the failing call is not repeated on every access.
+    """
+    cache_key = (key, type(tracing.unwrap(props)))
+    try:
+        return _PROPERTY_INFO[cache_key]
+    except KeyError:
+        pass
+    try:
+        described = props.getPropertySetInfo().getProperties()
+        handles = {prop.Name: int(prop.Handle) for prop in described}
+    except Exception:
+        _PROPERTY_INFO[cache_key] = None
+        return None
+    fast = callable(getattr(props, "getFastPropertyValue", None)) and callable(
+        getattr(props, "setFastPropertyValue", None)
+    )
+    info = PropertySetInfo(handles, fast=fast)
+    _PROPERTY_INFO[cache_key] = info
+    return info
+
+
+def get_property_values(props: Any, names: Iterable[str]) -> Dict[str, Any]:
+    """Read several properties with one XMultiPropertySet.getPropertyValues call.
+
+    Falls back to getPropertyValue per name when the batched call is unavailable or
+    rejects a name. Names that cannot be read are left out of the result.
+    """
+    # XMultiPropertySet expects names in ascending order.
+    ordered = sorted(set(names))
+    if not ordered:
+        return {}
+
+    multi = getattr(props, "getPropertyValues", None)
+    if multi is not None:
+        try:
+            values = multi(tuple(ordered))
+            if len(values) == len(ordered):
+                return dict(zip(ordered, values))
+        except Exception:
+            pass
+
+    result: Dict[str, Any] = {}
+    for name in ordered:
+        try:
+            result[name] = props.getPropertyValue(name)
+        except Exception:
+            continue
+    return result
+
+
+def set_property_values(props: Any, values: Mapping[str, Any]) -> List[str]:
+    """Write several properties with one XMultiPropertySet.setPropertyValues call.
+
+    Falls back to setPropertyValue per name when the batched call fails, and returns
+    the names that could not be written.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return []
+
+    multi = getattr(props, "setPropertyValues", None)
+    if multi is not None:
+        try:
+            multi(tuple(ordered), tuple(values[name] for name in ordered))
+            return []
+        except Exception:
+            pass
+
+    failed: List[str] = []
+    for name in ordered:
+        try:
+            props.setPropertyValue(name, values[name])
+        except Exception:
+            failed.append(name)
+    return failed
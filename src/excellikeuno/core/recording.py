@@ -0,0 +1,457 @@
+"""Record UNO bridge traffic to a file and replay it elsewhere.
+
+A Recorder is a Tracer that also writes every call (target object, member,
+arguments, result shape, timing) as JSON lines, gzip-compressed when the path
+ends in ``.gz``::
+
+    with Recorder("job.uno.jsonl.gz"):
+        run_the_slow_job(doc)
+
+    report = Replayer("job.uno.jsonl.gz", document=other_doc).run()
+    print(report.format_summary())
+
+Objects are numbered as they appear. Objects that were already in hand when
+recording started (the document, a sheet, a range...) are written as roots with
+a description the Replayer uses to find the matching object in the target
+office. Large arrays are stored as their shape only unless ``capture_values`` is
+set; the Replayer then sends arrays of the same shape filled with 0.0 or "".
+"""
+from __future__ import annotations
+
+import base64
+import enum
+import gzip
+import json
+import sys
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+from .tracing import CallRecord, Tracer, unwrap
+
+FORMAT = "excellikeuno-uno-trace"
+VERSION = 1
+
+
+class ReplayError(RuntimeError):
+    """A recording cannot be replayed against the given objects."""
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def _scalar_kind(values: Any) -> str:
+    kinds = {type(value) for value in values}
+    if kinds and kinds <= {int, float, bool}:
+        return "n"
+    if kinds == {str}:
+        return "s"
+    return "x"
+
+
+def _shape(value: Any) -> Tuple[List[int], int, Any]:
+    """(shape, item count, sample row) of a 1-D or rectangular 2-D sequence."""
+
+    if value and isinstance(value[0], (tuple, list)):
+        first = value[0]
+        return [len(value), len(first)], len(value) * len(first), first
+    return [len(value)], len(value), value
+
+
+class _Encoder:
+    """Turns call arguments/results into JSON values, numbering UNO objects."""
+
+    def __init__(self, recorder: "Recorder") -> None:
+        self._recorder = recorder
+
+    def __call__(self, value: Any) -> Any:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        value = unwrap(value)
+        if self._recorder.should_wrap(value):
+            return {"$o": self._recorder._object_id(value)}
+        if isinstance(value, (tuple, list)):
+            shape, count, sample = _shape(value)
+            if not self._recorder.capture_values and count > self._recorder.max_items:
+                return {"$shape": shape, "$kind": _scalar_kind(sample[:16])}
+            return [self(item) for item in value]
+        if isinstance(value, bytes):
+            return {"$b": base64.b64encode(value).decode("ascii")}
+        if isinstance(value, enum.Enum):
+            return self(value.value)
+        cls = type(value).__name__
+        if cls == "Enum" and hasattr(value, "typeName"):
+            return {"$e": value.typeName, "v": value.value}
+        if cls == "Type" and hasattr(value, "typeClass"):
+            return {"$t": value.typeName}
+        if cls == "ByteSequence":
+            return {"$b": base64.b64encode(bytes(value.value)).decode("ascii")}
+        if cls in ("Char", "Any") and hasattr(value, "value"):
+            return self(value.value)
+        return self._struct(value)
+
+    def _struct(self, value: Any) -> Any:
+        name = getattr(type(value), "__pyunostruct__", None) or getattr(value, "typeName", None)
+        try:
+            if name:
+                fields = {n: getattr(value, n) for n in dir(value) if not n.startswith("_") and n != "typeName"}
+            else:
+                fields = {n: v for n, v in vars(value).items() if not n.startswith("_")}
+                name = type(value).__name__
+        except Exception:
+            return {"$r": repr(value)}
+        return {"$s": str(name), "f": {n: self(v) for n, v in fields.items() if not callable(v)}}
+
+
+class Recorder(Tracer):
+    """Tracer that also writes every call to ``path`` for later replay.
+
+    ``max_items`` is the largest array stored with its values when
+    ``capture_values`` is False (the default, which keeps cell contents out of
+    the file).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        capture_values: bool = False,
+        max_items: int = 64,
+        should_wrap: Callable[[Any], bool] | None = None,
+    ) -> None:
+        super().__init__(should_wrap)
+        self.path = path
+        self.capture_values = capture_values
+        self.max_items = max_items
+        self._file: Optional[IO[str]] = None
+        self._ids: Dict[Any, int] = {}
+        self._unhashable: Dict[int, Tuple[Any, int]] = {}
+        self._produced: set[int] = set()
+        self._lock = threading.RLock()
+        self._encode = _Encoder(self)
+        self._sequence = 0
+
+    # activation -------------------------------------------------------------
+    def __enter__(self) -> "Recorder":
+        self._file = _open(self.path, "w")
+        self._write({"format": FORMAT, "version": VERSION, "python": sys.version.split()[0], "time": time.time()})
+        super().__enter__()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        super().__exit__(exc_type, exc, tb)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # object numbering -------------------------------------------------------
+    def _lookup(self, obj: Any) -> Optional[int]:
+        try:
+            return self._ids.get(obj)
+        except TypeError:
+            entry = self._unhashable.get(id(obj))
+            return entry[1] if entry else None
+
+    def _object_id(self, obj: Any) -> int:
+        """Number of ``obj``; objects first seen outside a call result become roots."""
+
+        found = self._lookup(obj)
+        if found is not None:
+            return found
+        number = len(self._ids) + len(self._unhashable) + 1
+        try:
+            self._ids[obj] = number
+        except TypeError:
+            self._unhashable[id(obj)] = (obj, number)
+        return number
+
+    def _root(self, obj: Any) -> int:
+        known = self._lookup(obj)
+        if known is not None:
+            return known
+        number = self._object_id(obj)
+        self._write({"root": number, **describe_root(obj)})
+        return number
+
+    # collection -------------------------------------------------------------
+    def _write(self, event: Dict[str, Any]) -> None:
+        if self._file is not None:
+            self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def _collect(self, rec: CallRecord, target: Any, args: Tuple[Any, ...], result: Any, error: BaseException | None) -> None:
+        super()._collect(rec, target, args, result, error)
+        with self._lock:
+            if self._file is None or target is None:
+                return
+            event: Dict[str, Any] = {
+                "i": self._sequence,
+                "o": self._root(target),
+                "m": rec.member,
+                "k": rec.kind,
+                "t": round(rec.start, 6),
+                "d": round(rec.seconds, 7),
+                "api": rec.api,
+            }
+            self._sequence += 1
+            encoded_args = []
+            for arg in args:
+                if self.should_wrap(arg):
+                    self._root(arg)
+                encoded_args.append(self._encode(arg))
+            if encoded_args:
+                event["a"] = encoded_args
+            if error is not None:
+                event["x"] = type(error).__name__
+            elif rec.kind != "set":
+                event["r"] = self._encode(result)
+            self._write(event)
+
+
+def describe_root(obj: Any) -> Dict[str, Any]:
+    """How to find ``obj`` again in another office (used for recording roots)."""
+
+    try:
+        if hasattr(obj, "loadComponentFromURL"):
+            return {"kind": "desktop"}
+        if hasattr(obj, "getSheets"):
+            return {"kind": "document"}
+        if hasattr(obj, "getCellAddress"):
+            addr = obj.getCellAddress()
+            return {"kind": "cell", "sheet": int(addr.Sheet), "at": [int(addr.Column), int(addr.Row)]}
+        if hasattr(obj, "getRangeAddress"):
+            addr = obj.getRangeAddress()
+            if hasattr(obj, "getDrawPage") and hasattr(obj, "getName"):
+                return {"kind": "sheet", "sheet": int(addr.Sheet)}
+            bounds = [int(addr.StartColumn), int(addr.StartRow), int(addr.EndColumn), int(addr.EndRow)]
+            return {"kind": "range", "sheet": int(addr.Sheet), "at": bounds}
+        return {"kind": "unknown", "impl": str(obj.getImplementationName())}
+    except Exception as exc:
+        return {"kind": "unknown", "error": repr(exc)}
+
+
+class ReplayReport:
+    """Outcome of a replay: per-call timings next to the recorded ones."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.recorded_seconds = 0.0
+        self.replayed_seconds = 0.0
+        self.mismatches: List[str] = []
+        self._groups: Dict[Tuple[str, str], List[float]] = {}
+
+    def add(self, api: str, member: str, recorded: float, replayed: float) -> None:
+        self.calls += 1
+        self.recorded_seconds += recorded
+        self.replayed_seconds += replayed
+        group = self._groups.setdefault((api, member), [0, 0.0, 0.0])
+        group[0] += 1
+        group[1] += recorded
+        group[2] += replayed
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per (api, member) call counts with recorded and replayed time, slowest replay first."""
+
+        rows = [
+            {"api": api, "member": member, "calls": int(calls),
+             "recorded_ms": recorded * 1000.0, "replayed_ms": replayed * 1000.0}
+            for (api, member), (calls, recorded, replayed) in self._groups.items()
+        ]
+        rows.sort(key=lambda row: row["replayed_ms"], reverse=True)
+        return rows
+
+    def format_summary(self, limit: int | None = None) -> str:
+        header = f"{'api':<40} {'member':<28} {'calls':>7} {'recorded ms':>12} {'replayed ms':>12}"
+        lines = [header, "-" * len(header)]
+        for row in self.summary()[:limit]:
+            lines.append(
+                f"{row['api']:<40} {row['member']:<28} {row['calls']:>7} "
+                f"{row['recorded_ms']:>12.3f} {row['replayed_ms']:>12.3f}"
+            )
+        lines.append(
+            f"{self.calls} calls, recorded {self.recorded_seconds * 1000.0:.3f} ms, "
+            f"replayed {self.replayed_seconds * 1000.0:.3f} ms, {len(self.mismatches)} mismatches"
+        )
+        return "\n".join(lines)
+
+
+class Replayer:
+    """Drives a recorded call sequence against other UNO objects.
+
+    Roots are resolved from ``document`` / ``desktop`` (wrappers or raw UNO
+    objects) by their recorded description; ``roots`` maps root numbers to
+    objects explicitly. Calls whose outcome differs from the recording (an
+    exception where none was recorded or the other way round) are listed in
+    ``ReplayReport.mismatches``; ``strict=True`` raises ReplayError instead.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        document: Any = None,
+        desktop: Any = None,
+        roots: Optional[Dict[int, Any]] = None,
+        strict: bool = False,
+    ) -> None:
+        self.path = path
+        self.document = _raw(document)
+        self.desktop = _raw(desktop)
+        self.strict = strict
+        self._objects: Dict[int, Any] = {int(k): _raw(v) for k, v in (roots or {}).items()}
+
+    # roots ------------------------------------------------------------------
+    def _resolve_root(self, event: Dict[str, Any]) -> Any:
+        kind = event.get("kind")
+        if kind == "desktop" and self.desktop is not None:
+            return self.desktop
+        if self.document is None:
+            raise ReplayError(f"no document to resolve root {event}")
+        if kind == "document":
+            return self.document
+        sheet = self.document.getSheets().getByIndex(int(event.get("sheet", 0)))
+        if kind == "sheet":
+            return sheet
+        if kind == "cell":
+            return sheet.getCellByPosition(*event["at"])
+        if kind == "range":
+            return sheet.getCellRangeByPosition(*event["at"])
+        raise ReplayError(f"cannot resolve root {event}; pass it in roots=")
+
+    # values -----------------------------------------------------------------
+    def _decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return tuple(self._decode(item) for item in value)
+        if not isinstance(value, dict):
+            return value
+        if "$o" in value:
+            try:
+                return self._objects[value["$o"]]
+            except KeyError:
+                raise ReplayError(f"object {value['$o']} is not available") from None
+        if "$shape" in value:
+            fill: Any = "" if value.get("$kind") == "s" else 0.0
+            shape = value["$shape"]
+            if len(shape) == 2:
+                return tuple((fill,) * shape[1] for _ in range(shape[0]))
+            return (fill,) * shape[0]
+        if "$b" in value:
+            data = base64.b64decode(value["$b"])
+            try:
+                import uno  # type: ignore
+
+                return uno.ByteSequence(data)
+            except ImportError:
+                return data
+        if "$e" in value:
+            try:
+                import uno  # type: ignore
+
+                return uno.Enum(value["$e"], value["v"])
+            except ImportError:
+                return value["v"]
+        if "$t" in value:
+            try:
+                import uno  # type: ignore
+
+                return uno.getTypeByName(value["$t"])
+            except ImportError:
+                return value["$t"]
+        if "$s" in value:
+            return self._struct(value["$s"], {k: self._decode(v) for k, v in value["f"].items()})
+        return value.get("$r")
+
+    @staticmethod
+    def _struct(name: str, fields: Dict[str, Any]) -> Any:
+        try:
+            import uno  # type: ignore
+
+            struct = uno.createUnoStruct(name)
+        except Exception:
+            struct = type(name.rsplit(".", 1)[-1], (), {})()
+        for field, value in fields.items():
+            setattr(struct, field, value)
+        return struct
+
+    def _bind(self, recorded: Any, actual: Any) -> None:
+        """Number the objects in ``actual`` like their counterparts in the recording."""
+
+        if isinstance(recorded, dict) and "$o" in recorded:
+            self._objects[recorded["$o"]] = actual
+        elif isinstance(recorded, list) and isinstance(actual, (tuple, list)):
+            for rec_item, item in zip(recorded, actual):
+                self._bind(rec_item, item)
+
+    # replay -----------------------------------------------------------------
+    def _mismatch(self, report: ReplayReport, message: str) -> None:
+        if self.strict:
+            raise ReplayError(message)
+        report.mismatches.append(message)
+
+    def _play(self, event: Dict[str, Any], report: ReplayReport) -> None:
+        try:
+            target = self._objects.get(event["o"])
+            if target is None:
+                raise ReplayError(f"object {event['o']} is not available")
+            args = self._decode(event.get("a", []))
+        except ReplayError as exc:
+            self._mismatch(report, f"#{event['i']} {event['m']}: {exc}")
+            return
+        member, kind = event["m"], event["k"]
+        error: BaseException | None = None
+        result: Any = None
+        start = time.perf_counter()
+        try:
+            if kind == "call":
+                result = getattr(target, member)(*args)
+            elif kind == "get":
+                result = getattr(target, member)
+            else:
+                setattr(target, member, args[0])
+        except Exception as exc:
+            error = exc
+        seconds = time.perf_counter() - start
+        report.add(event.get("api", "<user>"), member, float(event.get("d", 0.0)), seconds)
+        expected = event.get("x")
+        if error is not None and expected is None:
+            self._mismatch(report, f"#{event['i']} {member} raised {type(error).__name__}: {error}")
+        elif error is None and expected is not None:
+            self._mismatch(report, f"#{event['i']} {member} did not raise {expected}")
+        elif error is None and "r" in event:
+            self._bind(event["r"], result)
+
+    def run(self) -> ReplayReport:
+        report = ReplayReport()
+        with _open(self.path, "r") as fh:
+            header = json.loads(fh.readline() or "{}")
+            if header.get("format") != FORMAT:
+                raise ReplayError(f"{self.path} is not an excellikeuno UNO trace")
+            for line in fh:
+                event = json.loads(line)
+                if "root" in event:
+                    if event["root"] not in self._objects:
+                        try:
+                            self._objects[event["root"]] = self._resolve_root(event)
+                        except ReplayError as exc:
+                            self._mismatch(report, str(exc))
+                    continue
+                self._play(event, report)
+        return report
+
+
+def _raw(value: Any) -> Any:
+    # Accept excellikeuno wrappers as well as raw UNO objects.
+    from .base import UnoObject
+
+    if isinstance(value, UnoObject):
+        return value._obj
+    return unwrap(value)
+
+
+def replay(path: str, **kwargs: Any) -> ReplayReport:
+    """Shortcut for ``Replayer(path, **kwargs).run()``."""
+
+    return Replayer(path, **kwargs).run()
@@ -0,0 +1,302 @@
+"""Opt-in instrumentation of UNO bridge calls.
+
+While a Tracer is active, UnoObject hands out traced proxies instead of the raw
+UNO objects. Every method call and attribute access on them is counted, timed and
+tagged with the excellikeuno API that caused it::
+
+    with Tracer() as tracer:
+        sheet.range("A1:C3").font.bold = True
+    print(tracer.format_summary())
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Tracer receiving calls right now (None: tracing disabled, raw objects are used).
+active_tracer: Optional["Tracer"] = None
+
+_PACKAGE = __name__.split(".")[0] + "."
+# Attribute plumbing that only forwards to the property/method doing the real work.
+_PLUMBING = frozenset({"__getattr__", "__setattr__", "__getattribute__"})
+
+
+# Extra classes traced like pyuno objects (see register_uno_type).
+_uno_types: Tuple[type, ...] = ()
+
+
+def register_uno_type(cls: type) -> None:
+    """Have the default Tracer treat instances of ``cls`` as UNO objects (e.g. fakes)."""
+
+    global _uno_types
+    if cls not in _uno_types:
+        _uno_types = (*_uno_types, cls)
+
+
+def _is_uno_object(value: Any) -> bool:
+    # Interfaces come back from pyuno as instances of its "pyuno" type; structs,
+    # enums and sequences are plain values and are left alone.
+    return type(value).__name__ == "pyuno" or isinstance(value, _uno_types)
+
+
+def _api_stack(frame: Any) -> Tuple[str, ...]:
+    """excellikeuno functions on the call stack, outermost (the public API) first."""
+
+    stack: List[str] = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        code = frame.f_code
+        if module.startswith(_PACKAGE) and module != __name__ and code.co_name not in _PLUMBING:
+            stack.append(getattr(code, "co_qualname", code.co_name))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def _sink(own: "Tracer") -> "Tracer":
+    # Proxies report to the innermost active tracer, whichever one created them.
+    tracer = active_tracer
+    return own if tracer is None else tracer
+
+
+def unwrap(value: Any) -> Any:
+    """Return the raw UNO object behind a traced proxy (recursing into tuples/lists)."""
+
+    if isinstance(value, TracedObject):
+        return object.__getattribute__(value, "_target")
+    if isinstance(value, tuple):
+        return tuple(unwrap(item) for item in value)
+    if isinstance(value, list):
+        return [unwrap(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """One traced bridge call."""
+
+    api: str
+    member: str
+    kind: str  # "call", "get" or "set"
+    start: float
+    seconds: float
+    stack: Tuple[str, ...]
+    thread: int
+
+
+class TracedObject:
+    """Proxy that reports every call and attribute access on a UNO object."""
+
+    __slots__ = ("_target", "_tracer")
+
+    def __init__(self, target: Any, tracer: "Tracer") -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_tracer", tracer)
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, "_target")
+        tracer = _sink(object.__getattribute__(self, "_tracer"))
+        start = time.perf_counter()
+        value = getattr(target, name)
+        if callable(value) and not tracer.should_wrap(value):
+            return _TracedMethod(value, name, tracer, target)
+        tracer.record(name, "get", start, time.perf_counter() - start, target=target, result=value)
+        return tracer.wrap(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        target = object.__getattribute__(self, "_target")
+        tracer = _sink(object.__getattribute__(self, "_tracer"))
+        value = unwrap(value)
+        start = time.perf_counter()
+        setattr(target, name, value)
+        tracer.record(name, "set", start, time.perf_counter() - start, target=target, args=(value,))
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(object.__getattribute__(self, "_target") == unwrap(other))
+
+    def __hash__(self) -> int:
+        return hash(object.__getattribute__(self, "_target"))
+
+    def __len__(self) -> int:
+        return self.__getattr__("__len__")()
+
+    def __iter__(self) -> Any:
+        return iter(self.__getattr__("__iter__")())
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.__getattr__("__getitem__")(key)
+
+    def __repr__(self) -> str:
+        return f"<traced {object.__getattribute__(self, '_target')!r}>"
+
+
+class _TracedMethod:
+    __slots__ = ("_func", "_name", "_tracer", "_target")
+
+    def __init__(self, func: Callable[..., Any], name: str, tracer: "Tracer", target: Any = None) -> None:
+        self._func = func
+        self._name = name
+        self._tracer = tracer
+        self._target = target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        args = tuple(unwrap(arg) for arg in args)
+        start = time.perf_counter()
+        tracer = _sink(self._tracer)
+        try:
+            result = self._func(*args, **kwargs)
+        except BaseException as exc:
+            tracer.record(self._name, "call", start, time.perf_counter() - start, target=self._target, args=args, error=exc)
+            raise
+        tracer.record(self._name, "call", start, time.perf_counter() - start, target=self._target, args=args, result=result)
+        return tracer.wrap(result)
+
+
+class Tracer:
+    """Collects CallRecords while active (``with Tracer() as tracer: ...``).
+
+    ``should_wrap`` decides which returned values are UNO objects worth tracing;
+    the default recognises pyuno interfaces.
+    """
+
+    def __init__(self, should_wrap: Callable[[Any], bool] | None = None) -> None:
+        self.should_wrap = should_wrap or _is_uno_object
+        self.records: List[CallRecord] = []
+        self._previous: List[Optional[Tracer]] = []
+        self._origin = time.perf_counter()
+
+    # activation -------------------------------------------------------------
+    def __enter__(self) -> "Tracer":
+        global active_tracer
+        self._previous.append(active_tracer)
+        active_tracer = self
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        global active_tracer
+        active_tracer = self._previous.pop()
+
+    # collection -------------------------------------------------------------
+    def wrap(self, value: Any) -> Any:
+        """Return a traced proxy for a UNO object; other values pass through."""
+
+        if isinstance(value, TracedObject) or not self.should_wrap(value):
+            return value
+        return TracedObject(value, self)
+
+    def record(
+        self,
+        member: str,
+        kind: str,
+        start: float,
+        seconds: float,
+        *,
+        target: Any = None,
+        args: Tuple[Any, ...] = (),
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record one call; ``target``/``args``/``result``/``error`` are the raw objects involved."""
+
+        stack = _api_stack(sys._getframe(1))
+        api = stack[0] if stack else "<user>"
+        rec = CallRecord(api, member, kind, start - self._origin, seconds, stack, threading.get_ident())
+        self._collect(rec, target, args, result, error)
+        # Nested tracers: enclosing ones see the calls made inside too.
+        outer = self._previous[-1] if self._previous else None
+        while outer is not None:
+            outer._collect(rec, target, args, result, error)
+            outer = outer._previous[-1] if outer._previous else None
+
+    def _collect(self, rec: CallRecord, target: Any, args: Tuple[Any, ...], result: Any, error: BaseException | None) -> None:
+        # Subclasses (recording.Recorder) also look at the objects involved.
+        self.records.append(rec)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    @property
+    def calls(self) -> int:
+        """Number of bridge calls recorded so far."""
+
+        return len(self.records)
+
+    # export -----------------------------------------------------------------
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per (api, member) call counts and timings, slowest first."""
+
+        groups: Dict[Tuple[str, str, str], List[float]] = {}
+        for rec in self.records:
+            groups.setdefault((rec.api, rec.member, rec.kind), []).append(rec.seconds)
+        rows = [
+            {
+                "api": api,
+                "member": member,
+                "kind": kind,
+                "calls": len(times),
+                "total_ms": sum(times) * 1000.0,
+                "mean_ms": sum(times) * 1000.0 / len(times),
+            }
+            for (api, member, kind), times in groups.items()
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def format_summary(self, limit: int | None = None) -> str:
+        rows = self.summary()[:limit]
+        header = f"{'api':<40} {'member':<28} {'kind':<4} {'calls':>7} {'total ms':>10} {'mean ms':>9}"
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            lines.append(
+                f"{row['api']:<40} {row['member']:<28} {row['kind']:<4} "
+                f"{row['calls']:>7} {row['total_ms']:>10.3f} {row['mean_ms']:>9.3f}"
+            )
+        lines.append(f"{len(self.records)} calls, {sum(r.seconds for r in self.records) * 1000.0:.3f} ms")
+        return "\n".join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Chrome/Perfetto trace-event document (also carries the summary)."""
+
+        events = [
+            {
+                "name": rec.member,
+                "cat": rec.api,
+                "ph": "X",
+                "ts": rec.start * 1e6,
+                "dur": rec.seconds * 1e6,
+                "pid": 0,
+                "tid": rec.thread,
+                "args": {"kind": rec.kind, "stack": list(rec.stack)},
+            }
+            for rec in self.records
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "summary": self.summary()}
+
+    def dump_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_json(), fh)
+
+    def collapsed_stacks(self, weight: str = "time") -> List[str]:
+        """Lines for flamegraph.pl / speedscope: ``api;...;member value``.
+
+        ``weight`` is ``"time"`` (microseconds) or ``"count"``.
+        """
+
+        totals: Dict[str, float] = {}
+        for rec in self.records:
+            key = ";".join((*rec.stack, rec.member)) if rec.stack else f"<user>;{rec.member}"
+            totals[key] = totals.get(key, 0.0) + (rec.seconds * 1e6 if weight == "time" else 1)
+        return [f"{key} {int(round(value))}" for key, value in sorted(totals.items())]
+
+
+def traced(value: Any) -> Any:
+    """Wrap ``value`` for the active tracer; returns it unchanged when tracing is off."""
+
+    tracer = active_tracer
+    if tracer is None:
+        return value
+    return tracer.wrap(value)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class ClosedBezierShape(Shape):
     """Wraps com.sun.star.drawing.ClosedBezierShape service."""
 
+    _property_info_key = InterfaceNames.CLOSED_BEZIER_SHAPE
+
     @property
     def poly_polygon_bezier(self) -> Any:
         return self._get_prop("PolyPolygonBezier")
@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import Any, Union
 
 from .shape import Shape
-from ..typing import LineDash, LineStyle
+from ..typing import InterfaceNames, LineDash, LineStyle
 
 
 class ConnectorShape(Shape):
     """Wraps com.sun.star.drawing.ConnectorShape service."""
 
+    _property_info_key = InterfaceNames.CONNECTOR_SHAPE
+
     @property
     def start_shape(self) -> Any:
         return self._get_prop("StartShape")
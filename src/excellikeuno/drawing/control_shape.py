@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class ControlShape(Shape):
     """Wraps com.sun.star.drawing.ControlShape service."""
 
+    _property_info_key = InterfaceNames.CONTROL_SHAPE
+
     @property
     def control(self) -> Any:
         return self._get_prop("Control")
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class CustomShape(Shape):
     """Wraps com.sun.star.drawing.CustomShape service."""
 
+    _property_info_key = InterfaceNames.CUSTOM_SHAPE
+
     @property
     def custom_shape_engine(self) -> str:
         value = self._get_prop("CustomShapeEngine")
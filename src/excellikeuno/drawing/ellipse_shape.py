@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class EllipseShape(Shape):
     """Wraps com.sun.star.drawing.EllipseShape service."""
 
+    _property_info_key = InterfaceNames.ELLIPSE_SHAPE
+
     @property
     def circle_kind(self) -> int:
         return int(self._get_prop("CircleKind"))
@@ -10,6 +10,8 @@ from .shape import Shape
 class GroupShape(Shape):
     """Wraps com.sun.star.drawing.GroupShape service."""
 
+    _property_info_key = InterfaceNames.GROUP_SHAPE
+
     def _shapes(self) -> XShapes:
         return cast(XShapes, self.iface(InterfaceNames.X_SHAPES))
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import Any, Dict, Iterable, List, Mapping, cast
 
 from excellikeuno.typing.calc import Color
 
 from ..core import UnoObject
+from ..core.properties import get_property_values, set_property_values
 from ..typing import LineDash, LineStyle, XPropertySet
 
 
@@ -36,6 +37,21 @@ class LineProperties(UnoObject):
             # Best-effort; swallow when the line interface is missing
             pass
 
+    def get_properties(self, names: Iterable[str]) -> Dict[str, Any]:
+        """Read several properties in one round trip, falling back per name."""
+        names = list(names)
+        values = get_property_values(self._props(), names)
+        for name in names:
+            if name not in values:
+                values[name] = self.get_property(name)
+        return values
+
+    def set_properties(self, values: Mapping[str, Any]) -> List[str]:
+        """Write several properties in one round trip, falling back per name."""
+        for name in set_property_values(self._props(), values):
+            self.set_property(name, values[name])
+        return []
+
     # Common LineProperties for convenience
     @property
     def LineColor(self) -> Color:
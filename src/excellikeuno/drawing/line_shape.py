@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from excellikeuno.typing.structs import Point, Size
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class LineShape(Shape):
     """Wraps com.sun.star.drawing.LineShape service."""
 
+    _property_info_key = InterfaceNames.LINE_SHAPE
+
     @property
     def start_position(self) -> Point:
         return self.Position
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class PolyPolygonShape(Shape):
     """Wraps com.sun.star.drawing.PolyPolygonShape service."""
 
+    _property_info_key = InterfaceNames.POLYPOLYGON_SHAPE
+
     @property
     def poly_polygon(self) -> Any:
         return self._get_prop("PolyPolygon")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class RectangleShape(Shape):
     """Wraps com.sun.star.drawing.RectangleShape service."""
 
+    _property_info_key = InterfaceNames.RECTANGLE_SHAPE
+
     @property
     def corner_radius(self) -> int:
         return int(self._get_prop("CornerRadius"))
@@ -16,15 +16,43 @@ from ..style.font import Font
 from ..style.line import Line
 from ..style.fill import Fill
 
+# Property names read for Font/Line snapshots (each fetched in one batched call).
+_FONT_PROPERTIES = (
+	"CharBackColor",
+	"CharColor",
+	"CharEscapement",
+	"CharFontName",
+	"CharHeight",
+	"CharPosture",
+	"CharStrikeout",
+	"CharUnderline",
+	"CharWeight",
+)
+_LINE_PROPERTIES = (
+	"LineColor",
+	"LineDash",
+	"LineDashName",
+	"LineStyle",
+	"LineTransparence",
+	"LineWidth",
+)
+
 class Shape(UnoObject):
 	"""Wraps a drawing Shape from Calc draw page."""
 
 	def _get_prop(self, name: str) -> Any:
 		props = cast(XPropertySet, self.iface(InterfaceNames.X_PROPERTY_SET))
+		info = self._property_set_info()
+		if info is not None:
+			return info.get_value(props, name)
 		return props.getPropertyValue(name)
 
 	def _set_prop(self, name: str, value: Any) -> None:
 		props = cast(XPropertySet, self.iface(InterfaceNames.X_PROPERTY_SET))
+		info = self._property_set_info()
+		if info is not None:
+			info.set_value(props, name, value)
+			return
 		props.setPropertyValue(name, value)
 
 	@property
@@ -273,11 +301,13 @@ class Shape(UnoObject):
 	# Font helper for CharacterProperties access
 	def _font_getter(self) -> dict[str, Any]:
 		cp = self.character_properties
+		try:
+			values = cp.get_properties(_FONT_PROPERTIES)
+		except Exception:
+			values = {}
+
 		def _get(name: str, default: Any = None) -> Any:
-			try:
-				return cp.get_property(name)
-			except Exception:
-				return default
+			return values.get(name, default)
 
 		def _as_float(val: Any) -> float:
 			try:
@@ -310,12 +340,11 @@ class Shape(UnoObject):
 
 	def _font_setter(self, **updates: Any) -> None:
 		cp = self.character_properties
+		# Collect everything first so it is written with one batched call.
+		props: dict[str, Any] = {}
 
 		def _set(name: str, value: Any) -> None:
-			try:
-				cp.set_property(name, value)
-			except Exception:
-				pass
+			props[name] = value
 
 		if "name" in updates:
 			_set("CharFontName", updates["name"])
@@ -357,6 +386,10 @@ class Shape(UnoObject):
 				_set("CharStrikeout", 1 if updates["strikthrough"] else 0)
 			except Exception:
 				pass
+		try:
+			cp.set_properties(props)
+		except Exception:
+			pass
 
 	# Line proxy (Font/Borders style)
 	@property
@@ -447,32 +480,44 @@ class Shape(UnoObject):
 
 	# internal line getters/setters for Line proxy
 	def _line_getter(self) -> dict[str, Any]:
-		lp = self.line_properties
+		values = self.line_properties.get_properties(_LINE_PROPERTIES)
+
+		def _as_int(val: Any) -> int:
+			try:
+				return int(val)
+			except Exception:
+				return 0
+
+		try:
+			line_style = LineStyle(int(values.get("LineStyle")))
+		except Exception:
+			line_style = LineStyle(0)
 		return {
-			"color": lp.LineColor,
-			"line_style": lp.LineStyle,
-			"dash": lp.LineDash,
-			"dash_name": lp.LineDashName,
-			"transparence": lp.LineTransparence,
-			"width": lp.LineWidth,
+			"color": Color(_as_int(values.get("LineColor"))),
+			"line_style": line_style,
+			"dash": values.get("LineDash"),
+			"dash_name": values.get("LineDashName") or "",
+			"transparence": _as_int(values.get("LineTransparence")),
+			"width": _as_int(values.get("LineWidth")),
 		}
 
 	def _line_setter(self, **updates: Any) -> None:
-		lp = self.line_properties
+		props: dict[str, Any] = {}
 		if "color" in updates:
-			lp.LineColor = int(updates["color"])
+			props["LineColor"] = int(updates["color"])
 		if "line_style" in updates:
-			lp.LineStyle = int(updates["line_style"])
+			props["LineStyle"] = int(updates["line_style"])
 		if "dash" in updates:
-			lp.LineDash = updates["dash"]
+			props["LineDash"] = updates["dash"]
 		if "dash_name" in updates:
-			lp.LineDashName = updates["dash_name"]
+			props["LineDashName"] = updates["dash_name"]
 		if "transparence" in updates:
-			lp.LineTransparence = int(updates["transparence"])
+			props["LineTransparence"] = int(updates["transparence"])
 		if "width" in updates:
-			lp.LineWidth = int(updates["width"])
+			props["LineWidth"] = int(updates["width"])
 		if "weight" in updates:
-			lp.LineWidth = int(updates["weight"])
+			props["LineWidth"] = int(updates["weight"])
+		self.line_properties.set_properties(props)
 
 	# ShadowProperties implementation
 	@property
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from ..typing import InterfaceNames
 from .shape import Shape
 
 
 class TextShape(Shape):
     """Wraps com.sun.star.drawing.TextShape service."""
 
+    _property_info_key = InterfaceNames.TEXT_SHAPE
+
     @property
     def string(self) -> str:
         try:
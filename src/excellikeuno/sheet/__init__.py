@@ -1,7 +1,7 @@
 from .spreadsheet import Spreadsheet
 from .sheet_cell import SheetCell
 from .sheet_cell_range import SheetCellRange
-from ..chart import Chart, ChartCollection
+from .sheet_writer import SheetWriter
 
 # 互換性のため
 Cell = SheetCell
@@ -12,7 +12,17 @@ __all__ = [
     "Spreadsheet",
     "SheetCell",
     "SheetCellRange",
+    "SheetWriter",
     "Cell",
     "Range",
     "Sheet",
 ]
+
+
+def __getattr__(name: str):
+    # グラフは sheet.charts を使うまで読み込まない
+    if name in ("Chart", "ChartCollection"):
+        from .. import chart
+
+        return getattr(chart, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
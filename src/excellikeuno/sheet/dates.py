@@ -0,0 +1,72 @@
+"""Calc date serial numbers <-> Python dates.
+
+Calc stores dates as days since the document's NullDate (1899-12-30 unless the
+document says otherwise); the fraction is the time of day. Whether a number is
+a date is decided by its number format type. Conversions work on whole columns
+so a range read or write costs one comprehension per date column.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, List, Sequence
+
+# com.sun.star.util.NumberFormat bits used here
+DATE = 2
+TIME = 4
+DATETIME = DATE | TIME
+
+DEFAULT_NULL_DATE = date(1899, 12, 30)
+_MS_PER_DAY = 86400000
+_ONE_DAY = timedelta(days=1)
+
+
+def null_date_from_struct(value: Any) -> date:
+    """com.sun.star.util.Date (Year/Month/Day) -> date; missing values give the Calc default."""
+
+    try:
+        return date(int(value.Year), int(value.Month), int(value.Day))
+    except Exception:
+        return DEFAULT_NULL_DATE
+
+
+def is_date_format(format_type: int) -> bool:
+    return bool(format_type & DATE)
+
+
+def serial_converter(null_date: date) -> Callable[[date], float]:
+    """Return a ``date``/``datetime`` -> serial function for one NullDate (timezone info is dropped)."""
+
+    base = datetime(null_date.year, null_date.month, null_date.day)
+    origin = null_date.toordinal()
+
+    def convert(value: date) -> float:
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.replace(tzinfo=None)
+            return (value - base) / _ONE_DAY
+        return float(value.toordinal() - origin)
+
+    return convert
+
+
+def to_serial(value: date, null_date: date) -> float:
+    return serial_converter(null_date)(value)
+
+
+def from_serials(values: Sequence[Any], null_date: date, with_time: bool = True, blank: Any = None) -> List[Any]:
+    """Convert date serials to ``datetime`` (``date`` when ``with_time`` is False).
+
+    Empty cells (read as ``""``) become ``blank``; other non-numbers are kept.
+    Times are rounded to the millisecond.
+    """
+
+    if not with_time:
+        origin = null_date.toordinal()
+        fromordinal = date.fromordinal
+        return [fromordinal(origin + int(v // 1)) if type(v) is float else (blank if v == "" else v) for v in values]
+    base = datetime(null_date.year, null_date.month, null_date.day)
+    delta = timedelta  # positional (days, seconds, microseconds, milliseconds) is the fastest form
+    return [
+        base + delta(0, 0, 0, round(v * _MS_PER_DAY)) if type(v) is float else (blank if v == "" else v)
+        for v in values
+    ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Mapping, TYPE_CHECKING
 
 from ..core import UnoObject
+from ..core.properties import PropertySetInfo, get_property_values, set_property_values
 from ..typing import (
     InterfaceNames,
     BorderLine,
@@ -29,12 +30,34 @@ class RawProps:
     def _props(self) -> "XPropertySet":
         return self._owner.iface(InterfaceNames.X_PROPERTY_SET)  # type: ignore[return-value]
 
+    def _info(self) -> PropertySetInfo | None:
+        # 同じサービスの全インスタンスで共有される XPropertySetInfo（ハンドルで読み書きするために使う）
+        try:
+            return self._owner._property_set_info()
+        except Exception:
+            return None
+
     def get_property(self, name: str) -> Any:
+        info = self._info()
+        if info is not None:
+            return info.get_value(self._props(), name)
         return self._props().getPropertyValue(name)
 
     def set_property(self, name: str, value: Any) -> None:
+        info = self._info()
+        if info is not None:
+            info.set_value(self._props(), name, value)
+            return
         self._props().setPropertyValue(name, value)
 
+    def get_properties(self, names: Iterable[str]) -> Dict[str, Any]:
+        """Read several properties in one round trip; unreadable names are omitted."""
+        return get_property_values(self._props(), names)
+
+    def set_properties(self, values: Mapping[str, Any]) -> List[str]:
+        """Write several properties in one round trip; returns names that failed."""
+        return set_property_values(self._props(), values)
+
     # UNO-style helpers
     def getPropertyValue(self, name: str) -> Any:  # noqa: N802 - UNO naming
         return self.get_property(name)
@@ -61,10 +84,16 @@ class RawProps:
 class SheetCell(UnoObject):
     """VBAライクな Cell ラッパー。CellProperties ではなく RawProps を利用する。"""
 
+    _direct_interfaces = frozenset({InterfaceNames.X_CELL, InterfaceNames.X_PROPERTY_SET})
+    _property_info_key = "com.sun.star.sheet.SheetCell"
+
     def __init__(self, cell_obj: Any) -> None:
         super().__init__(cell_obj)
 
     def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Private hooks (_font_getter etc.) are never UNO properties; skip the bridge.
+            raise AttributeError(name)
         try:
             return getattr(self.props, name)
         except Exception:
@@ -179,14 +208,14 @@ class SheetCell(UnoObject):
             raise AttributeError("row_height") from exc
 
     def _border_getter(self) -> dict[str, BorderLine]:
+        names = ("TopBorder", "BottomBorder", "LeftBorder", "RightBorder")
+        values = self.props.get_properties(names + tuple(f"{name}2" for name in names))
+
         def prefer_line2(name: str) -> BorderLine:
-            try:
-                val2 = self._get_prop(f"{name}2")
-                if hasattr(val2, "LineStyle"):
-                    return val2
-            except Exception:
-                pass
-            return self._as_border_line(self._get_prop(name))
+            val2 = values.get(f"{name}2")
+            if hasattr(val2, "LineStyle"):
+                return val2
+            return self._as_border_line(values.get(name))
 
         return {
             "top": prefer_line2("TopBorder"),
@@ -197,9 +226,10 @@ class SheetCell(UnoObject):
 
     def _border_setter(self, **updates: BorderLine) -> None:
         try:
-            current_table = self.TableBorder
+            current = self.props.get_properties(("TableBorder", "TableBorder2"))
         except Exception:
-            current_table = None
+            current = {}
+        current_table = current.get("TableBorder")
         table_border = TableBorder(
             TopLine=self._as_border_line(getattr(current_table, "TopLine", None)),
             IsTopLineValid=bool(getattr(current_table, "IsTopLineValid", False)),
@@ -217,10 +247,7 @@ class SheetCell(UnoObject):
             IsDistanceValid=bool(getattr(current_table, "IsDistanceValid", False)),
         )
 
-        try:
-            current_table2 = self.TableBorder2
-        except Exception:
-            current_table2 = None
+        current_table2 = current.get("TableBorder2")
 
         table_border2 = TableBorder2(
             TopLine=self._as_border_line2(getattr(current_table2, "TopLine", None)),
@@ -257,18 +284,16 @@ class SheetCell(UnoObject):
             "left": "LeftLine",
             "right": "RightLine",
         }
+        # 全ての書き込みを集めて setPropertyValues 1 回で反映する
+        writes: dict[str, Any] = {}
         for side, line in updates.items():
             attr = mapping.get(side)
             if attr is None:
                 continue
-            line_struct = line.to_raw() if hasattr(line, "to_raw") else line
-            try:
-                self._set_prop(attr, line_struct)
-            except Exception:
-                setattr(self, attr, line)
+            writes[attr] = line.to_raw() if hasattr(line, "to_raw") else line
             try:
                 line2 = self._as_border_line2(line, self._as_border_line(line))
-                self._set_prop(f"{attr}2", line2.to_raw())
+                writes[f"{attr}2"] = line2.to_raw()
             except Exception:
                 pass
             valid_attr = valid_flags.get(side)
@@ -296,18 +321,17 @@ class SheetCell(UnoObject):
                 continue
 
         try:
-            self.TableBorder = table_border.to_raw()
+            writes["TableBorder"] = table_border.to_raw()
         except Exception:
-            try:
-                self.TableBorder = table_border
-            except Exception:
-                pass
-
+            writes["TableBorder"] = table_border
         try:
-            self.TableBorder2 = table_border2.to_raw()
+            writes["TableBorder2"] = table_border2.to_raw()
         except Exception:
+            writes["TableBorder2"] = table_border2
+
+        for name in self.props.set_properties(writes):
             try:
-                self.TableBorder2 = table_border2
+                setattr(self, name, writes[name])
             except Exception:
                 pass
 
@@ -352,6 +376,11 @@ class SheetCell(UnoObject):
             object.__setattr__(self, "_raw_props", existing)
         return existing  # type: ignore[return-value]
 
+    @property
+    def character_properties(self) -> RawProps:
+        # Font proxy は Char* プロパティをここからまとめて読み書きする
+        return self.props
+
     @property
     def borders(self) -> Borders:
         existing = self.__dict__.get("_borders")
@@ -1,18 +1,62 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, cast
+from array import array
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, TYPE_CHECKING, cast
 
 from ..core import UnoObject
-from ..typing import InterfaceNames, XCell, XSheetCellRange, XCellRangeAddressable
+from ..typing import (
+    BorderLine2,
+    InterfaceNames,
+    TableBorder2,
+    XCellRangeAddressable,
+    XCellRangeData,
+    XCellRangeFormula,
+    XPropertySet,
+    XSheetCellRange,
+)
 from ..style.font import Font
 from ..style.border import Borders
-from .sheet_cell import SheetCell
+from .sheet_cell import RawProps, SheetCell
 from ..table.rows import TableRows
 from ..table.columns import TableColumns
+from ..typing.calc import CellFlags, XCellRangesQuery
+from .dates import DATE, DATETIME, DEFAULT_NULL_DATE, TIME, from_serials, is_date_format, serial_converter
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from ..core.calc_document import CalcDocument
+
+_NAN = float("nan")
+
+_BORDER_PROPS = {
+    "top": "TopBorder",
+    "bottom": "BottomBorder",
+    "left": "LeftBorder",
+    "right": "RightBorder",
+}
+
 
 class SheetCellRange(UnoObject):
     """SheetCell ベースの範囲ラッパー。Range と同等の API で SheetCell を返す。"""
 
+    _direct_interfaces = frozenset(
+        {
+            InterfaceNames.X_SHEET_CELL_RANGE,
+            InterfaceNames.X_CELL_RANGE_ADDRESSABLE,
+            InterfaceNames.X_CELL_RANGE_DATA,
+            InterfaceNames.X_CELL_RANGE_FORMULA,
+            InterfaceNames.X_CELL_RANGES_QUERY,
+            InterfaceNames.X_COLUMN_ROW_RANGE,
+            InterfaceNames.X_PROPERTY_SET,
+        }
+    )
+    _property_info_key = "com.sun.star.sheet.SheetCellRange"
+
+    def __init__(self, range_obj: Any, document: "CalcDocument | None" = None) -> None:
+        super().__init__(range_obj)
+        # 日付の変換（NullDate・表示形式）に使う。Spreadsheet.range から渡される
+        self._document = document
+
     # navigation
     def cell(self, column: int, row: int) -> SheetCell:
         rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
@@ -21,7 +65,7 @@ class SheetCellRange(UnoObject):
     def subrange(self, start_column: int, start_row: int, end_column: int, end_row: int) -> "SheetCellRange":
         rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
         sub = rng.getCellRangeByPosition(int(start_column), int(start_row), int(end_column), int(end_row))
-        return SheetCellRange(sub)
+        return SheetCellRange(sub, self._document)
 
     getCellByPosition = cell  # noqa: N815 - UNO alias
     getCellRangeByPosition = subrange  # noqa: N815 - UNO alias
@@ -44,15 +88,11 @@ class SheetCellRange(UnoObject):
     @property
     def rows(self) -> TableRows:
         colrow = self.iface(InterfaceNames.X_COLUMN_ROW_RANGE)
-        if colrow is None:
-            raise AttributeError("XColumnRowRange not available on this range")
         return TableRows(colrow.getRows())  # type: ignore[arg-type]
 
     @property
     def columns(self) -> TableColumns:
         colrow = self.iface(InterfaceNames.X_COLUMN_ROW_RANGE)
-        if colrow is None:
-            raise AttributeError("XColumnRowRange not available on this range")
         return TableColumns(colrow.getColumns())  # type: ignore[arg-type]
 
     # font
@@ -75,8 +115,36 @@ class SheetCellRange(UnoObject):
         self._font_broadcast(**current)
 
     def _font_broadcast(self, **updates: Any) -> None:
+        updates = {k: v for k, v in updates.items() if v is not None}
+        self._apply_properties(Font._to_properties(**updates))
+
+    # range-level properties
+    @property
+    def props(self) -> RawProps:
+        existing = self.__dict__.get("_raw_props")
+        if existing is None:
+            existing = RawProps(self)
+            object.__setattr__(self, "_raw_props", existing)
+        return existing  # type: ignore[return-value]
+
+    def _apply_properties(self, values: dict[str, Any]) -> None:
+        """Set cell properties once on the whole range.
+
+        Properties the range refuses are retried per cell, but only when the
+        first cell accepts them; properties no cell supports are skipped.
+        """
+
+        failed = self.props.set_properties(values)
+        if not failed:
+            return
+
+        first = self._first_cell()
+        refused = first.props.set_properties({name: values[name] for name in failed})
+        per_cell = {name: values[name] for name in failed if name not in refused}
+        if not per_cell:
+            return
         for cell in self:
-            Font(owner=cell).apply(**updates)
+            cell.props.set_properties(per_cell)
 
     # borders
     @property
@@ -105,15 +173,74 @@ class SheetCellRange(UnoObject):
     def _border_broadcast(self, **updates: Any) -> None:
         around = updates.pop("around", None)
         inner = updates.pop("inner", None)
+        if around is not None and inner is not None and self._set_table_border(outer=around, inner=inner):
+            around = inner = None
         if around is not None:
             self._apply_around(around)
         if inner is not None:
             self._apply_inner(inner)
         if updates:
-            for cell in self:
-                cell.borders.apply(**updates)
+            self._apply_sides(updates)
+
+    def _apply_sides(self, updates: dict[str, Any]) -> None:
+        sides = {k: v for k, v in updates.items() if k in _BORDER_PROPS}
+        if not sides:
+            return
+        lines = [_border_line2(line) for line in sides.values()]
+        if len(sides) == len(_BORDER_PROPS) and all(line == lines[0] for line in lines):
+            # Every side of every cell: outer frame plus inner grid in one TableBorder2.
+            if self._set_table_border(outer=lines[0], inner=lines[0]):
+                return
+        if self._borders_uniform():
+            values: dict[str, Any] = {}
+            for side, line in sides.items():
+                name = _BORDER_PROPS[side]
+                values[name] = line.to_raw() if hasattr(line, "to_raw") else line
+                values[f"{name}2"] = _border_line2(line).to_raw()
+            self._apply_properties(values)
+            return
+        for cell in self:
+            cell.borders.apply(**sides)
+
+    def _borders_uniform(self) -> bool:
+        """True when all cells share one frame.
+
+        Calc sets a single side on a range by rewriting the whole frame item, so
+        ranges whose cells have different frames must be updated per cell.
+        """
+
+        getter = getattr(self.raw, "getPropertyState", None)
+        if not callable(getter):
+            return False
+        try:
+            state = getter("TopBorder")
+        except Exception:
+            return False
+        return getattr(state, "value", state) != "AMBIGUOUS_VALUE"
+
+    def _set_table_border(self, outer: Any | None = None, inner: Any | None = None) -> bool:
+        """Apply outer and/or inner lines to the whole range in one TableBorder2 assignment."""
+        border = TableBorder2()
+        if outer is not None:
+            line = _border_line2(outer)
+            border.TopLine, border.IsTopLineValid = line, True
+            border.BottomLine, border.IsBottomLineValid = line, True
+            border.LeftLine, border.IsLeftLineValid = line, True
+            border.RightLine, border.IsRightLineValid = line, True
+        if inner is not None:
+            line = _border_line2(inner)
+            border.HorizontalLine, border.IsHorizontalLineValid = line, True
+            border.VerticalLine, border.IsVerticalLineValid = line, True
+        try:
+            self.props.set_property("TableBorder2", border.to_raw())
+            return True
+        except Exception:
+            return False
 
     def _apply_around(self, line: Any) -> None:
+        if self._set_table_border(outer=line):
+            return
+        # Fallback: edge cells one by one.
         rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
         addr = cast(XCellRangeAddressable, self.iface(InterfaceNames.X_CELL_RANGE_ADDRESSABLE)).getRangeAddress()
         row_count = addr.EndRow - addr.StartRow + 1
@@ -146,6 +273,9 @@ class SheetCellRange(UnoObject):
                 bproxy.apply(**updates)
 
     def _apply_inner(self, line: Any) -> None:
+        if self._set_table_border(inner=line):
+            return
+        # Fallback: every cell one by one.
         rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
         addr = cast(XCellRangeAddressable, self.iface(InterfaceNames.X_CELL_RANGE_ADDRESSABLE)).getRangeAddress()
         row_count = addr.EndRow - addr.StartRow + 1
@@ -176,38 +306,252 @@ class SheetCellRange(UnoObject):
                 bproxy.apply(**updates)
 
     # values
-    @property
-    def value(self) -> Any:
+    def read(self, typed: bool = False, dates: bool = False) -> list[list[Any]]:
+        """Read the whole block in a single UNO call.
+
+        With ``typed=False`` each cell's formula text is returned (``getFormulaArray``),
+        which matches ``value``. With ``typed=True`` the cell contents are returned
+        as ``float`` for numbers and ``str`` for text (``getDataArray``); empty
+        cells come back as ``""``. ``typed=True, dates=True`` also turns the numbers
+        of date-formatted columns into ``datetime``/``date`` (see ``read_columns``).
+        """
+
+        if typed:
+            data = cast(XCellRangeData, self.iface(InterfaceNames.X_CELL_RANGE_DATA))
+            rows = [list(row) for row in data.getDataArray()]
+            if dates and rows and self._document is not None:
+                null_date = self._document.null_date
+                for c, with_time in self._date_columns(0).items():
+                    converted = from_serials([row[c] for row in rows], null_date, with_time, blank="")
+                    for row, value in zip(rows, converted):
+                        row[c] = value
+            return rows
+
+        formulas = cast(XCellRangeFormula, self.iface(InterfaceNames.X_CELL_RANGE_FORMULA))
+        return [list(row) for row in formulas.getFormulaArray()]
+
+    def _size(self) -> tuple[int, int]:
+        addr = cast(XCellRangeAddressable, self.iface(InterfaceNames.X_CELL_RANGE_ADDRESSABLE)).getRangeAddress()
+        return addr.EndRow - addr.StartRow + 1, addr.EndColumn - addr.StartColumn + 1
+
+    def write(self, value: Any, typed: bool = False) -> None:
+        """Write a scalar, a row or a 2-D matrix with bulk array calls.
+
+        Rows are padded (and truncated) to the range size; missing cells are cleared.
+        Numbers and dates go through ``setDataArray``. With ``typed=False`` strings
+        are formula-mode input, like typing into a cell, so ``"1.25"`` becomes a
+        number again and ``write(read())`` keeps every cell as it was (``value``).
+        With ``typed=True`` strings are text and only those starting with ``=`` are
+        formulas, so ``"00123"`` or ``"TRUE"`` stay text (``data``). Formula-mode
+        cells are written with one ``setFormulaArray`` per rectangle made only of
+        such cells.
+        """
+
+        matrix = _to_matrix(value)
+        data = cast(XCellRangeData, self.iface(InterfaceNames.X_CELL_RANGE_DATA))
+        formulas = cast(XCellRangeFormula, self.iface(InterfaceNames.X_CELL_RANGE_FORMULA))
+        row_count, col_count = self._size()
+        block, formula_cells, dated = _build_data_array(matrix, row_count, col_count, self._null_date, typed)
+        blocks = _formula_blocks(formula_cells)
+        whole = (0, 0, row_count - 1, col_count - 1)
+        if blocks != [whole]:
+            data.setDataArray(block)
+        rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
+        for top, left, bottom, right in blocks:
+            formula_block = tuple(
+                tuple(formula_cells[(r, c)] for c in range(left, right + 1)) for r in range(top, bottom + 1)
+            )
+            if (top, left, bottom, right) == whole:
+                formulas.setFormulaArray(formula_block)
+                continue
+            sub = SheetCellRange(rng.getCellRangeByPosition(left, top, right, bottom))
+            cast(XCellRangeFormula, sub.iface(InterfaceNames.X_CELL_RANGE_FORMULA)).setFormulaArray(formula_block)
+        self._format_dates(dated)
+
+    def _null_date(self) -> date:
+        return self._document.null_date if self._document is not None else DEFAULT_NULL_DATE
+
+    def _format_dates(self, dated: dict[int, list[Any]]) -> None:
+        """Give columns that received dates a date format unless they already have one.
+
+        ``dated`` maps a range column to ``[top, bottom, has_time]`` of the written dates.
+        """
+
+        document = self._document
+        if not dated or document is None:
+            return
         rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
+        for c, (top, bottom, with_time) in dated.items():
+            if is_date_format(document.number_format_type(self._number_format(c, top))):
+                continue
+            cells = SheetCellRange(rng.getCellRangeByPosition(c, top, c, bottom))
+            key = document.standard_format(DATETIME if with_time else DATE)
+            cast(XPropertySet, cells.iface(InterfaceNames.X_PROPERTY_SET)).setPropertyValue("NumberFormat", key)
+
+    def read_columns(self, header: bool = True, dates: bool = True) -> dict[str, Any]:
+        """Read a table in one ``getDataArray`` call and return it column by column.
+
+        Column names come from the first row when ``header`` is True, otherwise
+        they are the sheet column letters. Each column's type is decided once:
+        numbers (empty cells as NaN) become ``array('d')``; other columns are lists
+        with ``None`` for empty cells. When the range came from a sheet of a
+        CalcDocument and ``dates`` is True, numeric columns holding date values
+        become lists of ``datetime`` (``date`` for date-only formats), counted from
+        the document's NullDate; each such column is converted in one pass.
+        """
+
+        data = cast(XCellRangeData, self.iface(InterfaceNames.X_CELL_RANGE_DATA))
+        rows = data.getDataArray()
+        width = len(rows[0]) if rows else 0
+        if header:
+            names = _column_names(rows[0]) if rows else []
+            body = rows[1:]
+        else:
+            addr = cast(XCellRangeAddressable, self.iface(InterfaceNames.X_CELL_RANGE_ADDRESSABLE)).getRangeAddress()
+            names = [_column_letter(addr.StartColumn + c) for c in range(width)]
+            body = rows
+        columns = list(zip(*body)) if body else [() for _ in range(width)]
+        skip = 1 if header else 0
+        date_columns = self._date_columns(skip) if dates and body else {}
+
+        result: dict[str, Any] = {}
+        for index, (name, values) in enumerate(zip(names, columns)):
+            kinds = set(map(type, values))
+            numeric = float in kinds and (kinds == {float} or (kinds == {float, str} and all(
+                v == "" for v in values if type(v) is str)))
+            if not numeric:
+                result[name] = [None if v == "" else v for v in values]
+                continue
+            if index in date_columns:
+                result[name] = from_serials(values, cast("CalcDocument", self._document).null_date, date_columns[index])
+                continue
+            if kinds == {float}:
+                result[name] = array("d", values)
+            else:
+                result[name] = array("d", [_NAN if v == "" else v for v in values])
+        return result
+
+    def _date_columns(self, first_row: int) -> dict[int, bool]:
+        """Range columns holding dates from ``first_row`` down -> whether the format shows a time.
+
+        One ``queryContentCells(DATETIME)`` finds the date/time cells of the whole
+        range; only the columns it reports get a NumberFormat lookup, and the format
+        types are cached by the document. Time-only columns are left as numbers.
+        """
+
+        document = self._document
+        if document is None:
+            return {}
+        query = cast(XCellRangesQuery, self.iface(InterfaceNames.X_CELL_RANGES_QUERY))
         addr = cast(XCellRangeAddressable, self.iface(InterfaceNames.X_CELL_RANGE_ADDRESSABLE)).getRangeAddress()
-        row_count = addr.EndRow - addr.StartRow + 1
-        col_count = addr.EndColumn - addr.StartColumn + 1
-        values: list[list[Any]] = []
-        for r in range(row_count):
-            row_vals: list[Any] = []
-            for c in range(col_count):
-                cell = cast(XCell, rng.getCellByPosition(c, r))
-                row_vals.append(cell.getFormula())
-            values.append(row_vals)
-        return values
+        top = addr.StartRow + first_row
+        types: dict[int, int] = {}
+        for found in query.queryContentCells(CellFlags.DATETIME).getRangeAddresses():
+            if found.EndRow < top:
+                continue
+            row = max(found.StartRow, top) - addr.StartRow
+            for col in range(found.StartColumn - addr.StartColumn, found.EndColumn - addr.StartColumn + 1):
+                if col not in types:
+                    types[col] = document.number_format_type(self._number_format(col, row))
+        return {col: bool(t & TIME) for col, t in types.items() if is_date_format(t)}
+
+    def _number_format(self, column: int, row: int) -> int:
+        """NumberFormat key of one cell of the range."""
 
-    @value.setter
-    def value(self, value: Any) -> None:
         rng = cast(XSheetCellRange, self.iface(InterfaceNames.X_SHEET_CELL_RANGE))
-        addr = cast(XCellRangeAddressable, self.iface(InterfaceNames.X_CELL_RANGE_ADDRESSABLE)).getRangeAddress()
-        row_count = addr.EndRow - addr.StartRow + 1
-        col_count = addr.EndColumn - addr.StartColumn + 1
-        if isinstance(value, (list, tuple)) and value and isinstance(value[0], (list, tuple)):
-            matrix = [list(row) for row in value]  # type: ignore[arg-type]
-        elif isinstance(value, (list, tuple)):
-            matrix = [list(value)]  # type: ignore[list-item]
+        cell = SheetCell(rng.getCellByPosition(column, row))
+        return int(cast(XPropertySet, cell.iface(InterfaceNames.X_PROPERTY_SET)).getPropertyValue("NumberFormat"))
+
+    # NumPy（任意依存。呼ばれたときだけ import する）
+    def to_numpy(self, dtype: Any = float, empty: Any = _NAN) -> Any:
+        """Read the block into a 2-D NumPy array with one ``getDataArray`` call.
+
+        All-numeric blocks are converted in one step. Otherwise empty cells, text
+        and error cells become ``empty`` (NaN by default); with ``dtype=object``
+        text is kept and only empty and error cells are replaced.
+        """
+
+        np = _numpy()
+        data = cast(XCellRangeData, self.iface(InterfaceNames.X_CELL_RANGE_DATA))
+        rows = data.getDataArray()
+        values = np.array(rows)
+        if values.dtype.kind == "f" and dtype is not object:
+            return values.astype(dtype, copy=False)
+        values = np.array(rows, dtype=object).reshape(len(rows), -1)
+        if dtype is object:
+            values[np.frompyfunc(_is_blank, 1, 1)(values).astype(bool)] = empty
+            return values
+        numbers = np.frompyfunc(_is_number, 1, 1)(values).astype(bool)
+        out = np.full(values.shape, empty, dtype=dtype)
+        out[numbers] = values[numbers].astype(dtype)
+        return out
+
+    def from_numpy(self, array: Any) -> None:
+        """Write a 1-D (one row) or 2-D array that has exactly the shape of the range.
+
+        Numeric and boolean arrays go to ``setDataArray`` in one call with NaN as an
+        empty cell. Other arrays follow the rules of ``write`` (``None``/NaN clear
+        the cell, strings starting with ``=`` are formulas).
+        """
+
+        np = _numpy()
+        values = np.asarray(array)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        if values.ndim != 2:
+            raise ValueError("from_numpy expects a 1-D or 2-D array")
+        row_count, col_count = self._size()
+        if values.shape != (row_count, col_count):
+            raise ValueError(f"array shape {values.shape} does not match the {row_count}x{col_count} range")
+
+        if values.dtype.kind not in "biuf":
+            self.write([[None if _is_nan(v) else v for v in row] for row in values.tolist()], typed=True)
+            return
+        data = cast(XCellRangeData, self.iface(InterfaceNames.X_CELL_RANGE_DATA))
+        numbers = values.astype(float)
+        missing = np.isnan(numbers)
+        if missing.any():
+            block = numbers.astype(object)
+            block[missing] = ""
+            rows = block.tolist()
         else:
-            matrix = [[value]]
-        for r_idx in range(row_count):
-            for c_idx in range(col_count):
-                v = matrix[r_idx][c_idx] if r_idx < len(matrix) and c_idx < len(matrix[r_idx]) else None
-                cell = cast(XCell, rng.getCellByPosition(c_idx, r_idx))
-                cell.setFormula("" if v is None else str(v))
+            rows = numbers.tolist()
+        data.setDataArray(tuple(map(tuple, rows)))
+
+    @property
+    def formula(self) -> list[list[str]]:
+        return self.read(typed=False)
+
+    @formula.setter
+    def formula(self, value: Any) -> None:
+        formulas = cast(XCellRangeFormula, self.iface(InterfaceNames.X_CELL_RANGE_FORMULA))
+        matrix = _to_matrix(value)
+        row_count, col_count = self._size()
+        formulas.setFormulaArray(
+            tuple(
+                tuple(
+                    "" if _cell_at(matrix, r, c) is None else _formula_text(matrix[r][c])
+                    for c in range(col_count)
+                )
+                for r in range(row_count)
+            )
+        )
+
+    @property
+    def data(self) -> list[list[Any]]:
+        return self.read(typed=True)
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self.write(value, typed=True)
+
+    @property
+    def value(self) -> Any:
+        return self.read(typed=False)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self.write(value)
 
     @property
     def text(self) -> Any:
@@ -224,8 +568,7 @@ class SheetCellRange(UnoObject):
 
     @backcolor.setter
     def backcolor(self, value: int) -> None:
-        for cell in self:
-            cell.backcolor = value
+        self._apply_properties({"CellBackColor": value})
 
     # row/column sizing
     @property
@@ -287,3 +630,196 @@ class SheetCellRange(UnoObject):
     @property
     def cells(self) -> list[list[SheetCell]]:
         return self.getCells()
+
+
+def _column_letter(index: int) -> str:
+    label = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        label = chr(ord("A") + rem) + label
+    return label
+
+
+def _column_names(row: Any) -> list[str]:
+    """Header cells as unique column names (blank headers become column1, column2, ...)."""
+
+    names: list[str] = []
+    seen: set[str] = set()
+    for index, value in enumerate(row):
+        name = _formula_text(value) if value not in ("", None) else f"column{index + 1}"
+        unique, n = name, 2
+        while unique in seen:
+            unique, n = f"{name}_{n}", n + 1
+        seen.add(unique)
+        names.append(unique)
+    return names
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except ImportError as exc:
+        raise ImportError("numpy is required for to_numpy/from_numpy (pip install numpy)") from exc
+    return numpy
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, float)
+
+
+def _is_blank(value: Any) -> bool:
+    # getDataArray returns "" for empty cells and nothing (None) for error cells
+    return value is None or value == ""
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and value != value
+
+
+def _border_line2(value: Any) -> BorderLine2:
+    def _as_int(val: Any, default: int = 0) -> int:
+        try:
+            return int(val)
+        except Exception:
+            return default
+
+    return BorderLine2(
+        Color=_as_int(getattr(value, "Color", 0)),
+        InnerLineWidth=_as_int(getattr(value, "InnerLineWidth", 0)),
+        OuterLineWidth=_as_int(getattr(value, "OuterLineWidth", 0)),
+        LineDistance=_as_int(getattr(value, "LineDistance", 0)),
+        LineStyle=_as_int(getattr(value, "LineStyle", 0)),
+        LineWidth=_as_int(getattr(value, "LineWidth", getattr(value, "OuterLineWidth", 0))),
+    )
+
+
+def _to_matrix(value: Any) -> list[list[Any]]:
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (list, tuple)):
+        return [list(row) for row in value]  # type: ignore[arg-type]
+    if isinstance(value, (list, tuple)):
+        return [list(value)]  # type: ignore[list-item]
+    return [[value]]
+
+
+def _cell_at(matrix: list[list[Any]], row: int, column: int) -> Any:
+    if row < len(matrix) and column < len(matrix[row]):
+        return matrix[row][column]
+    return None
+
+
+def _is_formula(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("=")
+
+
+def _data_value(value: Any) -> float | str:
+    """Convert a Python value into a setDataArray element (float or str)."""
+    if value is None:
+        return ""
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _formula_text(value: Any) -> str:
+    """Render a value as formula-mode input without locale-dependent formatting."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        number = float(value)
+        if number.is_integer() and abs(number) < 1e15:
+            return str(int(number))
+        return repr(number)
+    return str(value)
+
+
+def _build_data_array(
+    matrix: list[list[Any]],
+    row_count: int,
+    col_count: int,
+    null_date: Callable[[], date] = lambda: DEFAULT_NULL_DATE,
+    typed: bool = True,
+) -> tuple[tuple[tuple[float | str, ...], ...], dict[tuple[int, int], str], dict[int, list[Any]]]:
+    """Pad ``matrix`` to the range size, collect formula-mode cells and convert dates.
+
+    Formula-mode cells are strings starting with ``=``, or every string
+    when ``typed`` is False. Returns the data array (formula-mode cells left
+    empty, ``date``/``datetime`` as serial numbers from ``null_date()``, which is
+    only called when there are dates), the formula-mode cells as
+    ``{(row, column): text}`` in row-major order, and the date cells per column
+    as ``{column: [top, bottom, has_time]}``.
+    """
+
+    rows: list[tuple[float | str, ...]] = []
+    formulas: dict[tuple[int, int], str] = {}
+    dated: dict[int, list[Any]] = {}
+    to_serial: Callable[[date], float] | None = None
+    for r in range(row_count):
+        source = matrix[r] if r < len(matrix) else ()
+        row: list[float | str] = []
+        for c in range(col_count):
+            v = source[c] if c < len(source) else None
+            if _is_formula(v) or (not typed and isinstance(v, str)):
+                formulas[(r, c)] = v
+                row.append("")
+            elif isinstance(v, date):
+                if to_serial is None:
+                    to_serial = serial_converter(null_date())
+                row.append(to_serial(v))
+                span = dated.setdefault(c, [r, r, False])
+                span[1] = r
+                span[2] = span[2] or isinstance(v, datetime)
+            else:
+                row.append(_data_value(v))
+        rows.append(tuple(row))
+    return tuple(rows), formulas, dated
+
+
+def _formula_blocks(cells: dict[tuple[int, int], Any]) -> list[tuple[int, int, int, int]]:
+    """Cover ``cells`` (row-major ``(row, column)`` keys) with rectangles that hold only those cells.
+
+    Runs of adjacent columns in a row are merged downwards while the next row
+    has exactly the same run, so a column of formulas is one rectangle.
+    Returns ``(top, left, bottom, right)`` tuples.
+    """
+
+    blocks: list[tuple[int, int, int, int]] = []
+    open_runs: dict[tuple[int, int], int] = {}  # (left, right) -> top
+    previous = -1
+
+    def _close(keep: set[tuple[int, int]]) -> None:
+        for span in [span for span in open_runs if span not in keep]:
+            blocks.append((open_runs.pop(span), span[0], previous, span[1]))
+
+    for row, runs in _row_runs(cells):
+        _close(set(runs) if row == previous + 1 else set())
+        for span in runs:
+            open_runs.setdefault(span, row)
+        previous = row
+    _close(set())
+    return sorted(blocks)
+
+
+def _row_runs(cells: dict[tuple[int, int], Any]) -> Iterable[tuple[int, list[tuple[int, int]]]]:
+    """Yield ``(row, [(left, right), ...])`` runs of adjacent columns per row."""
+
+    row = -1
+    runs: list[tuple[int, int]] = []
+    for r, c in cells:
+        if r != row:
+            if runs:
+                yield row, runs
+            row, runs = r, []
+        if runs and runs[-1][1] == c - 1:
+            runs[-1] = (runs[-1][0], c)
+        else:
+            runs.append((c, c))
+    if runs:
+        yield row, runs
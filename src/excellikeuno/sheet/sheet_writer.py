@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Iterable, List, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .spreadsheet import Spreadsheet
+
+
+class SheetWriter:
+    """行を貯めてブロックごとに書き込むライター（Spreadsheet.writer で作成）。
+
+    ``append``/``extend`` で受け取った行は ``flush_rows`` 行たまるたびに
+    SheetCellRange.write(typed=True) でまとめて書き込む（数値は setDataArray 1 回、
+    ``=`` で始まる文字列だけ setFormulaArray）。保持するのは未書き込みの行だけなので、
+    ジェネレーターから何百万行流し込んでもメモリは増えない。
+    """
+
+    def __init__(self, sheet: "Spreadsheet", column: int, row: int, flush_rows: int = 10000) -> None:
+        if flush_rows < 1:
+            raise ValueError("flush_rows must be at least 1")
+        self.sheet = sheet
+        self.column = column
+        self.flush_rows = flush_rows
+        self.next_row = row
+        self.rows_written = 0
+        self.flushes = 0
+        self.seconds = 0.0  # time spent writing blocks
+        self._buffer: List[List[Any]] = []
+        self._width = 0
+
+    def append(self, row: Iterable[Any]) -> None:
+        values = list(row)
+        self._buffer.append(values)
+        if len(values) > self._width:
+            self._width = len(values)
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+
+    def extend(self, rows: Iterable[Iterable[Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        """Write the buffered rows (padded to the widest one) in one block."""
+
+        if not self._buffer:
+            return
+        start = time.perf_counter()
+        height, width = len(self._buffer), max(self._width, 1)
+        block = self.sheet.range(self.column, self.next_row, self.column + width - 1, self.next_row + height - 1)
+        block.write(self._buffer, typed=True)
+        self.seconds += time.perf_counter() - start
+        self.next_row += height
+        self.rows_written += height
+        self.flushes += 1
+        self._buffer = []
+        self._width = 0
+
+    def close(self) -> None:
+        self.flush()
+
+    @property
+    def pending_rows(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput of the block writes so far (0.0 before the first flush)."""
+
+        return self.rows_written / self.seconds if self.seconds > 0 else 0.0
+
+    def __enter__(self) -> "SheetWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        # 例外時は書きかけのブロックを捨てる（途中までの行は書き込み済み）
+        if exc_type is None:
+            self.flush()
+        else:
+            self._buffer = []
+
+    def __repr__(self) -> str:
+        return (
+            f"<SheetWriter rows_written={self.rows_written} pending={self.pending_rows} "
+            f"flushes={self.flushes} rows/s={self.rows_per_second:.0f}>"
+        )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import Any, Dict, Iterable, List, Mapping, cast
 
 from ..core import UnoObject
+from ..core.properties import get_property_values, set_property_values
 from ..typing import Color, FontSlant, FontStrikeout, FontUnderline, XPropertySet
 
 
@@ -19,6 +20,14 @@ class CharacterProperties(UnoObject):
     def set_property(self, name: str, value: Any) -> None:
         self._props().setPropertyValue(name, value)
 
+    def get_properties(self, names: Iterable[str]) -> Dict[str, Any]:
+        """Read several properties in one round trip; unreadable names are omitted."""
+        return get_property_values(self._props(), names)
+
+    def set_properties(self, values: Mapping[str, Any]) -> List[str]:
+        """Write several properties in one round trip; returns names that failed."""
+        return set_property_values(self._props(), values)
+
     def _as_int(self, value: Any, default: int = 0) -> int:
         if value is None:
             return default
@@ -5,6 +5,26 @@ from typing import Any, Callable, Dict
 from excellikeuno.typing.calc import BitmapMode, Color, FillStyle
 from excellikeuno.typing.structs import Gradient, Hatch
 
+# Fill* properties read for a full Fill snapshot (fetched in one batched call).
+_READ_PROPERTIES = (
+    "FillBackground",
+    "FillBitmapMode",
+    "FillBitmapName",
+    "FillBitmapOffsetX",
+    "FillBitmapOffsetY",
+    "FillBitmapPositionX",
+    "FillBitmapPositionY",
+    "FillBitmapSizeX",
+    "FillBitmapSizeY",
+    "FillColor",
+    "FillGradient",
+    "FillGradientName",
+    "FillHatch",
+    "FillHatchName",
+    "FillStyle",
+    "FillTransparence",
+)
+
 
 class Fill:
     """Fill-property proxy following the Line/Borders apply/buffer pattern."""
@@ -121,13 +141,16 @@ class Fill:
                 pass
 
         fp = getattr(owner, "fill_properties", None)
+        values: Dict[str, Any] = {}
+        if fp is not None:
+            try:
+                values = fp.get_properties(_READ_PROPERTIES)
+            except Exception:
+                values = {}
 
         def _get(name: str) -> Any:
-            if fp is not None:
-                try:
-                    return fp.get_property(name)
-                except Exception:
-                    pass
+            if name in values:
+                return values[name]
             try:
                 return getattr(owner, name)
             except Exception:
@@ -177,19 +200,11 @@ class Fill:
             return
 
         fp = getattr(owner, "fill_properties", None)
+        # Collect everything first so it is written with one batched call (last value wins).
+        props: Dict[str, Any] = {}
 
-        def _set(name: str, value: Any) -> bool:
-            if fp is not None:
-                try:
-                    fp.set_property(name, value)
-                    return True
-                except Exception:
-                    pass
-            try:
-                setattr(owner, name, value)
-                return True
-            except Exception:
-                return False
+        def _set(name: str, value: Any) -> None:
+            props[name] = value
 
         if "style" in updates:
             try:
@@ -251,6 +266,18 @@ class Fill:
         if "background" in updates:
             _set("FillBackground", bool(updates["background"]))
 
+        failed = list(props)
+        if fp is not None:
+            try:
+                failed = fp.set_properties(props)
+            except Exception:
+                failed = list(props)
+        for name in failed:
+            try:
+                setattr(owner, name, props[name])
+            except Exception:
+                pass
+
     # --- properties -------------------------------------------------------
     @property
     def style(self) -> FillStyle:
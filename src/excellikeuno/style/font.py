@@ -4,6 +4,20 @@ from typing import Any, Callable, Dict
 
 from excellikeuno.typing.calc import Color, FontSlant
 
+# Properties read for a full Font snapshot (fetched in one batched call).
+_READ_PROPERTIES = (
+    "CellBackColor",
+    "CharBackColor",
+    "CharColor",
+    "CharEscapement",
+    "CharFontName",
+    "CharHeight",
+    "CharPosture",
+    "CharStrikeout",
+    "CharUnderline",
+    "CharWeight",
+)
+
 
 class Font:
     """Proxy-style font wrapper.
@@ -163,14 +177,16 @@ class Font:
                 pass
 
         cp = getattr(owner, "character_properties", None)
+        values: Dict[str, Any] = {}
+        if cp is not None:
+            try:
+                values = cp.get_properties(_READ_PROPERTIES)
+            except Exception:
+                values = {}
 
         def _get(name: str) -> Any:
-            if cp is not None:
-                try:
-                    return cp.get_property(name)
-                except Exception:
-                    # fall through to owner
-                    pass
+            if name in values:
+                return values[name]
             try:
                 return getattr(owner, name)
             except Exception:
@@ -219,63 +235,61 @@ class Font:
             return
 
         cp = getattr(owner, "character_properties", None)
-
-        def _set(name: str, value: Any) -> bool:
-            if cp is not None:
-                try:
-                    cp.set_property(name, value)
-                    return True
-                except Exception:
-                    pass
+        props = self._to_properties(**updates)
+        failed = list(props)
+        if cp is not None:
             try:
-                setattr(owner, name, value)
-                return True
+                failed = cp.set_properties(props)
             except Exception:
-                return False
+                failed = list(props)
+        for name in failed:
+            try:
+                setattr(owner, name, props[name])
+            except Exception:
+                pass
 
+    @staticmethod
+    def _to_properties(**updates: Any) -> Dict[str, Any]:
+        """Translate Font fields into UNO character/cell property values."""
+        props: Dict[str, Any] = {}
         if "name" in updates:
-            _set("CharFontName", updates["name"])
+            props["CharFontName"] = updates["name"]
         if "size" in updates:
             size_val = float(updates["size"])
-            _set("CharHeight", size_val)
-            _set("CharHeightAsian", size_val)
-            _set("CharHeightComplex", size_val)
+            props["CharHeight"] = size_val
+            props["CharHeightAsian"] = size_val
+            props["CharHeightComplex"] = size_val
         if "bold" in updates:
-            _set("CharWeight", 150.0 if updates["bold"] else 100.0)
+            props["CharWeight"] = 150.0 if updates["bold"] else 100.0
         if "italic" in updates:
-            _set("CharPosture", 2 if updates["italic"] else 0)
+            props["CharPosture"] = 2 if updates["italic"] else 0
         if "font_style" in updates:
             try:
-                _set("CharPosture", int(updates["font_style"]))
+                props["CharPosture"] = int(updates["font_style"])
             except Exception:
                 pass
         if "underline" in updates:
-            _set("CharUnderline", int(updates["underline"]))
+            props["CharUnderline"] = int(updates["underline"])
         if "strikeout" in updates:
-            _set("CharStrikeout", int(updates["strikeout"]))
+            props["CharStrikeout"] = int(updates["strikeout"])
         if "color" in updates:
-            _set("CharColor", updates["color"])
+            props["CharColor"] = updates["color"]
         if "backcolor" in updates:
             value = updates["backcolor"]
             # Try character background first, fallback to cell background
-            try:
-                _set("CharBackTransparent", False)
-            except Exception:
-                pass
-            _set("CharBackColor", value)
-            _set("CellBackColor", value)
+            props["CharBackTransparent"] = False
+            props["CharBackColor"] = value
+            props["CellBackColor"] = value
         if "subscript" in updates or "superscript" in updates:
             if updates.get("superscript"):
-                _set("CharEscapement", 58)
+                props["CharEscapement"] = 58
             elif updates.get("subscript"):
-                _set("CharEscapement", -25)
+                props["CharEscapement"] = -25
             else:
-                _set("CharEscapement", 0)
+                props["CharEscapement"] = 0
         if "strikthrough" in updates:
-            try:
-                _set("CharStrikeout", 1 if updates["strikthrough"] else 0)
-            except Exception:
-                pass
+            props["CharStrikeout"] = 1 if updates["strikthrough"] else 0
+        return props
 
     # 型無しプロパティ設定の互換のため
     def __getattr__(self, name: str) -> Any:  # noqa: D401
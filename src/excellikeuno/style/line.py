@@ -5,6 +5,16 @@ from typing import Any, Callable, Dict
 from excellikeuno.typing import LineDash, LineStyle
 from excellikeuno.typing.calc import Color
 
+# Line* properties read for a full Line snapshot (fetched in one batched call).
+_READ_PROPERTIES = (
+    "LineColor",
+    "LineDash",
+    "LineDashName",
+    "LineStyle",
+    "LineTransparence",
+    "LineWidth",
+)
+
 
 class Line:
     """Line-property proxy following the Font/Borders apply/buffer pattern."""
@@ -124,13 +134,16 @@ class Line:
                 pass
 
         lp = getattr(owner, "line_properties", None)
+        values: Dict[str, Any] = {}
+        if lp is not None:
+            try:
+                values = lp.get_properties(_READ_PROPERTIES)
+            except Exception:
+                values = {}
 
         def _get(name: str) -> Any:
-            if lp is not None:
-                try:
-                    return lp.get_property(name)
-                except Exception:
-                    pass
+            if name in values:
+                return values[name]
             try:
                 return getattr(owner, name)
             except Exception:
@@ -167,19 +180,11 @@ class Line:
             return
 
         lp = getattr(owner, "line_properties", None)
+        # Collect everything first so it is written with one batched call (last value wins).
+        props: Dict[str, Any] = {}
 
-        def _set(name: str, value: Any) -> bool:
-            if lp is not None:
-                try:
-                    lp.set_property(name, value)
-                    return True
-                except Exception:
-                    pass
-            try:
-                setattr(owner, name, value)
-                return True
-            except Exception:
-                return False
+        def _set(name: str, value: Any) -> None:
+            props[name] = value
 
         if "color" in updates:
             _set("LineColor", int(updates["color"]))
@@ -196,6 +201,18 @@ class Line:
         if "weight" in updates:
             _set("LineWidth", int(updates["weight"]))
 
+        failed = list(props)
+        if lp is not None:
+            try:
+                failed = lp.set_properties(props)
+            except Exception:
+                failed = list(props)
+        for name in failed:
+            try:
+                setattr(owner, name, props[name])
+            except Exception:
+                pass
+
     @property
     def color(self) -> Color:
         cur = self._current()
@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING, Any
+
 from .columns import TableColumns, TableColumn
 from .rows import TableRows, TableRow
-from .pivot_table import PivotTable, PivotTables
+
+if TYPE_CHECKING:
+	from .pivot_table import PivotTable, PivotTables
 
 __all__ = [
 	"PivotTable",
@@ -10,3 +14,12 @@ __all__ = [
 	"TableRow",
 	"TableColumn",
 ]
+
+
+def __getattr__(name: str) -> Any:
+	# ピボットテーブルは sheet.pivot_tables を使うまで読み込まない
+	if name in ("PivotTable", "PivotTables"):
+		from . import pivot_table
+
+		return getattr(pivot_table, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,11 @@
+from .budget import UnoCallBudgetExceeded, max_uno_calls
+from .fake_uno import FakeOffice, FakeUnoException, LatencyModel, fake_calc
+
+__all__ = [
+    "FakeOffice",
+    "FakeUnoException",
+    "LatencyModel",
+    "UnoCallBudgetExceeded",
+    "fake_calc",
+    "max_uno_calls",
+]
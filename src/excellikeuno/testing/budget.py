@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from ..core.tracing import Tracer
+
+
+class UnoCallBudgetExceeded(AssertionError):
+    """Raised when a block makes more UNO bridge calls than allowed."""
+
+    def __init__(self, limit: int, tracer: Tracer) -> None:
+        super().__init__(
+            f"expected at most {limit} UNO calls, got {tracer.calls}\n{tracer.format_summary()}"
+        )
+        self.limit = limit
+        self.tracer = tracer
+
+
+@contextmanager
+def max_uno_calls(limit: int, *, should_wrap: Callable[[Any], bool] | None = None) -> Iterator[Tracer]:
+    """Fail when the block makes more than ``limit`` UNO calls::
+
+        with max_uno_calls(5):
+            rng.value = matrix
+
+    Calls are counted with a Tracer, so anything reached through excellikeuno
+    wrappers is included. The tracer is yielded for finer assertions.
+    """
+
+    with Tracer(should_wrap=should_wrap) as tracer:
+        yield tracer
+    if tracer.calls > limit:
+        raise UnoCallBudgetExceeded(limit, tracer)
@@ -0,0 +1,1677 @@
+"""In-memory stand-in for the LibreOffice UNO objects excellikeuno talks to.
+
+The fake implements the interfaces the wrappers use (cells, ranges, sheets,
+draw pages, charts, DataPilot tables, the document and the desktop) on plain
+Python data, so tests and benchmarks run without an office process::
+
+    office = FakeOffice(latency=LatencyModel.socket())
+    desktop, doc, sheet = office.connect_calc()
+    sheet.range("A1:B2").value = [[1, 2], [3, 4]]
+    print(office.latency.calls, office.latency.elapsed)
+
+Every method call and property access is charged to a LatencyModel that counts
+round trips and, optionally, sleeps to imitate a socket or pipe bridge. Formulas
+are stored but not evaluated; UNO exceptions are raised as FakeUnoException.
+"""
+from __future__ import annotations
+
+import copy
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..core import tracing
+from ..typing.structs import (
+    BorderLine2,
+    CellAddress,
+    CellRangeAddress,
+    Point,
+    Size,
+    TableBorder2,
+)
+
+MAX_COLUMN = 16383
+MAX_ROW = 1048575
+
+_SIDES = ("TopBorder", "BottomBorder", "LeftBorder", "RightBorder")
+# Calc keeps one frame item per side; the "...2" names are views on the same data.
+_ALIASES = {**{f"{side}2": side for side in _SIDES}, "TableBorder": "TableBorder2"}
+# side -> (line used on the range edge, line used inside the range)
+_BORDER_LINES = {
+    "TopBorder": ("TopLine", "HorizontalLine"),
+    "BottomBorder": ("BottomLine", "HorizontalLine"),
+    "LeftBorder": ("LeftLine", "VerticalLine"),
+    "RightBorder": ("RightLine", "VerticalLine"),
+}
+_MISSING = object()
+
+_CELL_DEFAULTS: Dict[str, Any] = {
+    "CellBackColor": -1,
+    "IsCellBackgroundTransparent": True,
+    "CharColor": -1,
+    "CharFontName": "Liberation Sans",
+    "CharHeight": 10.0,
+    "CharWeight": 100.0,
+    "CharPosture": 0,
+    "CharUnderline": 0,
+    "CharStrikeout": 0,
+    "CharEscapement": 0,
+    "CharBackColor": -1,
+    "CellStyle": "Default",
+    "HoriJustify": 0,
+    "VertJustify": 0,
+    "IsTextWrapped": False,
+    "NumberFormat": 0,
+    "RotateAngle": 0,
+    "ShrinkToFit": False,
+    "ParaIndent": 0,
+    **{side: BorderLine2() for side in _SIDES},
+}
+# Names a cell or range reports through XPropertySetInfo (read and written by
+# handle); other names still work through getPropertyValue/setPropertyValue.
+_CELL_PROPERTIES = {
+    *_CELL_DEFAULTS,
+    *_ALIASES,
+    *_ALIASES.values(),
+    "AbsoluteName",
+    "CellProtection",
+    "CharBackTransparent",
+    "CharFontNameAsian",
+    "CharFontNameComplex",
+    "CharHeightAsian",
+    "CharHeightComplex",
+    "CharPostureAsian",
+    "CharPostureComplex",
+    "CharWeightAsian",
+    "CharWeightComplex",
+    "ConditionalFormat",
+    "Orientation",
+    "Position",
+    "ShadowFormat",
+    "Size",
+    "Validation",
+}
+# name -> handle (position in sorted order)
+_CELL_HANDLES: Dict[str, int] = {name: handle for handle, name in enumerate(sorted(_CELL_PROPERTIES))}
+_CELL_NAMES: Dict[int, str] = {handle: name for name, handle in _CELL_HANDLES.items()}
+_SHEET_DEFAULTS: Dict[str, Any] = {
+    "IsVisible": True,
+    "PageStyle": "Default",
+    "TabColor": -1,
+    "TableLayout": 0,
+    "AutomaticPrintArea": True,
+    "ConditionalFormats": None,
+}
+_ROW_DEFAULTS: Dict[str, Any] = {"Height": 452, "OptimalHeight": True, "IsVisible": True, "IsStartOfNewPage": False}
+_COLUMN_DEFAULTS: Dict[str, Any] = {"Width": 2258, "OptimalWidth": True, "IsVisible": True, "IsStartOfNewPage": False}
+_SHAPE_DEFAULTS: Dict[str, Any] = {
+    "Name": "",
+    "FillColor": 0x729FCF,
+    "FillStyle": 1,
+    "FillTransparence": 0,
+    "LineColor": 0x3465A4,
+    "LineStyle": 1,
+    "LineWidth": 0,
+    "LineTransparence": 0,
+    "LineDashName": "",
+    "ZOrder": 0,
+    "Visible": True,
+    "MoveProtect": False,
+    "SizeProtect": False,
+    "RotateAngle": 0,
+    "CharColor": -1,
+    "CharFontName": "Liberation Sans",
+    "CharHeight": 18.0,
+    "CharWeight": 100.0,
+    "CharPosture": 0,
+    "CharUnderline": 0,
+    "CharStrikeout": 0,
+    "CharEscapement": 0,
+    "CharBackColor": -1,
+}
+
+
+class FakeDate:
+    """com.sun.star.util.Date stand-in."""
+
+    def __init__(self, Year: int = 0, Month: int = 0, Day: int = 0) -> None:  # noqa: N803 - UNO naming
+        self.Year, self.Month, self.Day = Year, Month, Day
+
+
+_DOCUMENT_DEFAULTS: Dict[str, Any] = {
+    "NullDate": FakeDate(1899, 12, 30),
+    "IsAdjustHeightEnabled": True,
+    "IsExecuteLinkEnabled": True,
+}
+# Built-in number formats: key -> (com.sun.star.util.NumberFormat type, format code), roughly en-US.
+_NUMBER_FORMATS: Dict[int, Tuple[int, str]] = {
+    0: (16, "General"),
+    36: (2, "MM/DD/YY"),
+    37: (2, "YYYY-MM-DD"),
+    40: (4, "HH:MM:SS"),
+    50: (6, "MM/DD/YY HH:MM"),
+    51: (6, "YYYY-MM-DD HH:MM:SS"),
+}
+
+
+class LatencyModel:
+    """Cost model for bridge calls: ``per_call`` seconds plus ``per_item`` per cell moved.
+
+    ``calls``, ``items`` and ``elapsed`` (virtual seconds) accumulate as the fake is
+    used; ``by_method`` counts calls per UNO member. With ``sleep=True`` the cost is
+    also spent in ``time.sleep`` so wall-clock measurements see it.
+    """
+
+    def __init__(self, per_call: float = 0.0, per_item: float = 0.0, *, sleep: bool = False) -> None:
+        self.per_call = per_call
+        self.per_item = per_item
+        self.sleep = sleep
+        self.calls = 0
+        self.items = 0
+        self.elapsed = 0.0
+        self.by_method: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # Rough orders of magnitude measured against a local soffice.
+    @classmethod
+    def socket(cls, *, sleep: bool = False) -> "LatencyModel":
+        """Local TCP bridge (``socket,host=localhost``)."""
+
+        return cls(per_call=150e-6, per_item=0.2e-6, sleep=sleep)
+
+    @classmethod
+    def pipe(cls, *, sleep: bool = False) -> "LatencyModel":
+        """Named pipe bridge (``pipe,name=...``)."""
+
+        return cls(per_call=60e-6, per_item=0.2e-6, sleep=sleep)
+
+    def charge(self, method: str, items: int = 0) -> float:
+        cost = self.per_call + self.per_item * items
+        with self._lock:
+            self.calls += 1
+            self.items += items
+            self.elapsed += cost
+            self.by_method[method] = self.by_method.get(method, 0) + 1
+        if self.sleep and cost > 0:
+            time.sleep(cost)
+        return cost
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.items = 0
+            self.elapsed = 0.0
+            self.by_method.clear()
+
+
+class FakeUnoException(Exception):
+    """UNO exception raised by the fake (``Message`` mirrors uno.Exception)."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.Message = message
+
+
+class FakeUnoObject:
+    """Base of every fake UNO object: latency accounting and XPropertySet.
+
+    Capitalised attributes read and write properties like pyuno does. Reading a
+    property that was never set and has no default raises; writes are accepted
+    for any name, so the fake does not need the full property list of a service.
+    """
+
+    _services: Tuple[str, ...] = ()
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, office: "FakeOffice") -> None:
+        object.__setattr__(self, "_office", office)
+        object.__setattr__(self, "_props", {})
+
+    def _charge(self, method: str, items: int = 0) -> None:
+        self._office.latency.charge(method, items)
+
+    # property storage (no charge; overridden by cells and ranges)
+    def _get_property(self, name: str) -> Any:
+        if name in self._props:
+            return self._props[name]
+        if name in self._defaults:
+            return copy.copy(self._defaults[name])
+        raise FakeUnoException(f"UnknownPropertyException: {name}")
+
+    def _set_property(self, name: str, value: Any) -> None:
+        self._props[name] = value
+
+    def _property_state(self, name: str) -> str:
+        return "DIRECT_VALUE" if name in self._props else "DEFAULT_VALUE"
+
+    # XInterface / XServiceInfo
+    def queryInterface(self, iface: Any) -> Any:  # noqa: N802 - UNO naming
+        self._charge("queryInterface")
+        return self
+
+    def supportsService(self, name: str) -> bool:  # noqa: N802 - UNO naming
+        self._charge("supportsService")
+        return name in self._services
+
+    def getSupportedServiceNames(self) -> Tuple[str, ...]:  # noqa: N802 - UNO naming
+        self._charge("getSupportedServiceNames")
+        return self._services
+
+    def getImplementationName(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getImplementationName")
+        return f"excellikeuno.fake.{type(self).__name__}"
+
+    # XPropertySet / XMultiPropertySet / XPropertyState
+    def getPropertyValue(self, name: str) -> Any:  # noqa: N802 - UNO naming
+        self._charge("getPropertyValue")
+        return self._get_property(name)
+
+    def setPropertyValue(self, name: str, value: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("setPropertyValue")
+        self._set_property(name, value)
+
+    def getPropertyValues(self, names: Sequence[str]) -> Tuple[Any, ...]:  # noqa: N802 - UNO naming
+        self._charge("getPropertyValues", len(names))
+        return tuple(self._get_property(name) for name in names)
+
+    def setPropertyValues(self, names: Sequence[str], values: Sequence[Any]) -> None:  # noqa: N802 - UNO naming
+        self._charge("setPropertyValues", len(names))
+        if len(names) != len(values):
+            raise FakeUnoException("IllegalArgumentException: names and values differ in length")
+        for name, value in zip(names, values):
+            self._set_property(name, value)
+
+    def getPropertyState(self, name: str) -> str:  # noqa: N802 - UNO naming
+        self._charge("getPropertyState")
+        return self._property_state(name)
+
+    # pyuno-style attribute access to properties
+    def __getattr__(self, name: str) -> Any:
+        if not name[:1].isupper():
+            raise AttributeError(name)
+        self._charge(name)
+        try:
+            return self._get_property(name)
+        except FakeUnoException as exc:
+            raise AttributeError(name) from exc
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        self._charge(name)
+        self._set_property(name, value)
+
+
+# The tracer treats fake objects like pyuno interfaces (max_uno_calls works unchanged).
+tracing.register_uno_type(FakeUnoObject)
+
+
+# -- cells ----------------------------------------------------------------------
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + (ord(ch) - 64)
+    return index - 1
+
+
+def _parse_range(ref: str) -> Tuple[int, int, int, int]:
+    parts = ref.replace("$", "").split(":")
+    coords = []
+    for part in parts:
+        match = re.fullmatch(r"([A-Za-z]+)([1-9][0-9]*)", part.strip())
+        if not match:
+            raise FakeUnoException(f"RuntimeException: invalid range '{ref}'")
+        coords.append((_column_index(match.group(1)), int(match.group(2)) - 1))
+    (sc, sr), (ec, er) = coords[0], coords[-1]
+    return min(sc, ec), min(sr, er), max(sc, ec), max(sr, er)
+
+
+def _same(a: Any, b: Any) -> bool:
+    # UNO structs compare by value; the plain stand-ins built without uno do not.
+    if a is b or a == b:
+        return True
+    try:
+        return type(a).__name__ == type(b).__name__ and vars(a) == vars(b)
+    except TypeError:
+        return False
+
+
+def _number_text(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _content(text: str) -> Optional[Tuple[str, Any]]:
+    """Cell content for formula-mode input (setFormula / setFormulaArray)."""
+
+    if text == "":
+        return None
+    if text.startswith("="):
+        return ("FORMULA", text)
+    try:
+        return ("VALUE", float(text))
+    except ValueError:
+        return ("TEXT", text)
+
+
+def _data_content(value: Any) -> Optional[Tuple[str, Any]]:
+    """Cell content for setDataArray input (strings are always text)."""
+
+    if isinstance(value, str):
+        return ("TEXT", value) if value else None
+    if value is None:
+        return None
+    return ("VALUE", float(value))
+
+
+class _CellAccess:
+    """Navigation shared by sheets and ranges (XCellRange, XCellRangeAddressable)."""
+
+    _sheet: "FakeSheet"
+    _bounds: Tuple[int, int, int, int]
+
+    def _absolute(self, column: int, row: int) -> Tuple[int, int]:
+        sc, sr, ec, er = self._bounds
+        col, r = sc + int(column), sr + int(row)
+        if column < 0 or row < 0 or col > ec or r > er:
+            raise FakeUnoException(f"IndexOutOfBoundsException: ({column}, {row})")
+        return col, r
+
+    def getCellByPosition(self, column: int, row: int) -> "FakeCell":  # noqa: N802 - UNO naming
+        self._charge("getCellByPosition")  # type: ignore[attr-defined]
+        col, r = self._absolute(column, row)
+        return FakeCell(self._sheet, col, r)
+
+    def getCellRangeByPosition(self, left: int, top: int, right: int, bottom: int) -> "FakeCellRange":  # noqa: N802
+        self._charge("getCellRangeByPosition")  # type: ignore[attr-defined]
+        if right < left or bottom < top:
+            raise FakeUnoException("IndexOutOfBoundsException: empty range")
+        sc, sr = self._absolute(left, top)
+        ec, er = self._absolute(right, bottom)
+        return FakeCellRange(self._sheet, (sc, sr, ec, er))
+
+    def getCellRangeByName(self, name: str) -> "FakeCellRange":  # noqa: N802 - UNO naming
+        self._charge("getCellRangeByName")  # type: ignore[attr-defined]
+        sc, sr, ec, er = _parse_range(name)
+        return FakeCellRange(self._sheet, (sc, sr, ec, er))
+
+    def getRangeAddress(self) -> CellRangeAddress:  # noqa: N802 - UNO naming
+        self._charge("getRangeAddress")  # type: ignore[attr-defined]
+        sc, sr, ec, er = self._bounds
+        return CellRangeAddress(self._sheet._index(), sc, sr, ec, er)
+
+    def getSpreadsheet(self) -> "FakeSheet":  # noqa: N802 - UNO naming
+        self._charge("getSpreadsheet")  # type: ignore[attr-defined]
+        return self._sheet
+
+    def getRows(self) -> "FakeTableRows":  # noqa: N802 - UNO naming
+        self._charge("getRows")  # type: ignore[attr-defined]
+        sc, sr, ec, er = self._bounds
+        return FakeTableRows(self._sheet, sr, er, rows=True)
+
+    def getColumns(self) -> "FakeTableRows":  # noqa: N802 - UNO naming
+        self._charge("getColumns")  # type: ignore[attr-defined]
+        sc, sr, ec, er = self._bounds
+        return FakeTableRows(self._sheet, sc, ec, rows=False)
+
+
+class FakeProperty:
+    """com.sun.star.beans.Property (only the fields the wrappers read)."""
+
+    def __init__(self, name: str, handle: int) -> None:
+        self.Name = name
+        self.Handle = handle
+
+
+class FakePropertySetInfo:
+    """com.sun.star.beans.XPropertySetInfo over a fixed name -> handle table."""
+
+    def __init__(self, handles: Dict[str, int]) -> None:
+        self._handles = handles
+
+    def getProperties(self) -> Tuple[FakeProperty, ...]:  # noqa: N802 - UNO naming
+        return tuple(FakeProperty(name, handle) for name, handle in self._handles.items())
+
+    def hasPropertyByName(self, name: str) -> bool:  # noqa: N802 - UNO naming
+        return name in self._handles
+
+
+class _CellPropertySet:
+    """XPropertySetInfo and XFastPropertySet of cells and ranges."""
+
+    def getPropertySetInfo(self) -> FakePropertySetInfo:  # noqa: N802 - UNO naming
+        self._charge("getPropertySetInfo")  # type: ignore[attr-defined]
+        return FakePropertySetInfo(_CELL_HANDLES)
+
+    def _property_name(self, handle: int) -> str:
+        try:
+            return _CELL_NAMES[handle]
+        except KeyError:
+            raise FakeUnoException(f"UnknownPropertyException: handle {handle}") from None
+
+    def getFastPropertyValue(self, handle: int) -> Any:  # noqa: N802 - UNO naming
+        self._charge("getFastPropertyValue")  # type: ignore[attr-defined]
+        return self._get_property(self._property_name(handle))  # type: ignore[attr-defined]
+
+    def setFastPropertyValue(self, handle: int, value: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("setFastPropertyValue")  # type: ignore[attr-defined]
+        self._set_property(self._property_name(handle), value)  # type: ignore[attr-defined]
+
+
+class FakeCell(_CellAccess, _CellPropertySet, FakeUnoObject):
+    """com.sun.star.sheet.SheetCell."""
+
+    _services = ("com.sun.star.sheet.SheetCell", "com.sun.star.table.Cell", "com.sun.star.table.CellProperties")
+    _defaults = _CELL_DEFAULTS
+
+    def __init__(self, sheet: "FakeSheet", column: int, row: int) -> None:
+        super().__init__(sheet._office)
+        object.__setattr__(self, "_sheet", sheet)
+        object.__setattr__(self, "_pos", (column, row))
+        object.__setattr__(self, "_bounds", (column, row, column, row))
+
+    def _get_property(self, name: str) -> Any:
+        name = _ALIASES.get(name, name)
+        if name == "TableBorder2":
+            return FakeCellRange(self._sheet, self._bounds)._table_border()
+        value = self._sheet._format(self._pos, name)
+        if value is _MISSING:
+            return super()._get_property(name)
+        return value
+
+    def _set_property(self, name: str, value: Any) -> None:
+        self._sheet._set_range_format(self._bounds, _ALIASES.get(name, name), value)
+
+    def _property_state(self, name: str) -> str:
+        return FakeCellRange(self._sheet, self._bounds)._property_state(name)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, FakeCell) and other._sheet is self._sheet and other._pos == self._pos
+
+    def __hash__(self) -> int:
+        return hash((id(self._sheet), self._pos))
+
+    # XCell
+    def getValue(self) -> float:  # noqa: N802 - UNO naming
+        self._charge("getValue")
+        kind, content = self._sheet._cells.get(self._pos, ("EMPTY", None))
+        return float(content) if kind == "VALUE" else 0.0
+
+    def setValue(self, value: float) -> None:  # noqa: N802 - UNO naming
+        self._charge("setValue")
+        self._sheet._put(self._pos, ("VALUE", float(value)))
+
+    def getFormula(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getFormula")
+        return self._sheet._formula(self._pos)
+
+    def setFormula(self, formula: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setFormula")
+        self._sheet._put(self._pos, _content(str(formula)))
+
+    def getType(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getType")
+        return self._sheet._cells.get(self._pos, ("EMPTY", None))[0]
+
+    def getError(self) -> int:  # noqa: N802 - UNO naming
+        self._charge("getError")
+        return 0
+
+    # XText (simple)
+    def getString(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getString")
+        return self._sheet._text(self._pos)
+
+    def setString(self, text: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setString")
+        self._sheet._put(self._pos, ("TEXT", str(text)) if text else None)
+
+    # XCellAddressable
+    def getCellAddress(self) -> CellAddress:  # noqa: N802 - UNO naming
+        self._charge("getCellAddress")
+        return CellAddress(self._sheet._index(), *self._pos)
+
+
+class FakeCellRange(_CellAccess, _CellPropertySet, FakeUnoObject):
+    """com.sun.star.sheet.SheetCellRange; properties apply to every cell.
+
+    Range-wide properties are stored once as a layer on the sheet (like Calc's
+    attribute runs), so setting them costs the same for 10 or 1M cells.
+    """
+
+    _services = ("com.sun.star.sheet.SheetCellRange", "com.sun.star.table.CellProperties")
+    _defaults = _CELL_DEFAULTS
+
+    def __init__(self, sheet: "FakeSheet", bounds: Tuple[int, int, int, int]) -> None:
+        super().__init__(sheet._office)
+        object.__setattr__(self, "_sheet", sheet)
+        object.__setattr__(self, "_bounds", bounds)
+
+    def _positions(self) -> Iterator[Tuple[int, int]]:
+        sc, sr, ec, er = self._bounds
+        for row in range(sr, er + 1):
+            for col in range(sc, ec + 1):
+                yield col, row
+
+    def _shape(self) -> Tuple[int, int]:
+        sc, sr, ec, er = self._bounds
+        return er - sr + 1, ec - sc + 1
+
+    def _get_property(self, name: str) -> Any:
+        if _ALIASES.get(name, name) == "TableBorder2":
+            return self._table_border()
+        sc, sr, _, _ = self._bounds
+        return FakeCell(self._sheet, sc, sr)._get_property(name)
+
+    def _set_property(self, name: str, value: Any) -> None:
+        self._sheet._set_range_format(self._bounds, _ALIASES.get(name, name), value)
+
+    def _property_state(self, name: str) -> str:
+        name = _ALIASES.get(name, name)
+        lookup = self._sheet._format
+        positions = self._positions()
+        first = lookup(next(positions), name)
+        for pos in positions:
+            if not _same(lookup(pos, name), first):
+                return "AMBIGUOUS_VALUE"
+        return "DEFAULT_VALUE" if first is _MISSING else "DIRECT_VALUE"
+
+    def _table_border(self) -> TableBorder2:
+        sc, sr, ec, er = self._bounds
+        lookup = self._sheet._format
+        border = TableBorder2()
+
+        def _line(pos: Tuple[int, int], side: str) -> Any:
+            line = lookup(pos, side)
+            return _CELL_DEFAULTS[side] if line is _MISSING else line
+
+        border.TopLine, border.IsTopLineValid = _line((sc, sr), "TopBorder"), True
+        border.BottomLine, border.IsBottomLineValid = _line((sc, er), "BottomBorder"), True
+        border.LeftLine, border.IsLeftLineValid = _line((sc, sr), "LeftBorder"), True
+        border.RightLine, border.IsRightLineValid = _line((ec, sr), "RightBorder"), True
+        border.HorizontalLine, border.IsHorizontalLineValid = _line((sc, sr), "BottomBorder"), er > sr
+        border.VerticalLine, border.IsVerticalLineValid = _line((sc, sr), "RightBorder"), ec > sc
+        return border
+
+    # XCellRangeData / XCellRangeFormula
+    def _check_shape(self, rows: Sequence[Sequence[Any]]) -> None:
+        height, width = self._shape()
+        if len(rows) != height or any(len(row) != width for row in rows):
+            raise FakeUnoException(f"RuntimeException: array does not match the {height}x{width} range")
+
+    def getDataArray(self) -> Tuple[Tuple[Any, ...], ...]:  # noqa: N802 - UNO naming
+        height, width = self._shape()
+        self._charge("getDataArray", height * width)
+        sc, sr, _, _ = self._bounds
+        data = self._sheet._data
+        return tuple(tuple(data((sc + c, sr + r)) for c in range(width)) for r in range(height))
+
+    def setDataArray(self, rows: Sequence[Sequence[Any]]) -> None:  # noqa: N802 - UNO naming
+        height, width = self._shape()
+        self._charge("setDataArray", height * width)
+        self._check_shape(rows)
+        sc, sr, _, _ = self._bounds
+        put = self._sheet._put
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                put((sc + c, sr + r), _data_content(value))
+
+    def getFormulaArray(self) -> Tuple[Tuple[str, ...], ...]:  # noqa: N802 - UNO naming
+        height, width = self._shape()
+        self._charge("getFormulaArray", height * width)
+        sc, sr, _, _ = self._bounds
+        formula = self._sheet._formula
+        return tuple(tuple(formula((sc + c, sr + r)) for c in range(width)) for r in range(height))
+
+    def setFormulaArray(self, rows: Sequence[Sequence[str]]) -> None:  # noqa: N802 - UNO naming
+        height, width = self._shape()
+        self._charge("setFormulaArray", height * width)
+        self._check_shape(rows)
+        sc, sr, _, _ = self._bounds
+        put = self._sheet._put
+        for r, row in enumerate(rows):
+            for c, text in enumerate(row):
+                put((sc + c, sr + r), _content(str(text)))
+
+    # XCellRangesQuery (DATETIME only: value cells whose number format is a date or time)
+    def queryContentCells(self, flags: int) -> "FakeSheetCellRanges":  # noqa: N802 - UNO naming
+        height, width = self._shape()
+        self._charge("queryContentCells", height * width)
+        sc, sr, ec, er = self._bounds
+        addresses: List[CellRangeAddress] = []
+        sheet, index = self._sheet, self._sheet._index()
+        formats = sheet._document._number_formats._formats
+        date_keys = {key for key, (format_type, _) in formats.items() if format_type & 6}
+        # no date format anywhere on the sheet: nothing to scan
+        used = any(name == "NumberFormat" and value in date_keys for _, _, name, value in sheet._layers) or any(
+            entry.get("NumberFormat", (0, 0))[1] in date_keys for entry in sheet._formats.values()
+        )
+        if flags & 2 and used:
+            for col in range(sc, ec + 1):
+                start = -1
+                for row in range(sr, er + 2):
+                    hit = False
+                    if row <= er and sheet._cells.get((col, row), ("EMPTY",))[0] == "VALUE":
+                        key = sheet._format((col, row), "NumberFormat")
+                        hit = bool(formats.get(0 if key is _MISSING else key, (0,))[0] & 6)
+                    if hit and start < 0:
+                        start = row
+                    elif not hit and start >= 0:
+                        addresses.append(CellRangeAddress(index, col, start, col, row - 1))
+                        start = -1
+        return FakeSheetCellRanges(self._office, addresses)
+
+    # XMergeable
+    def merge(self, merged: bool) -> None:
+        self._charge("merge")
+        if merged:
+            self._sheet._merged.add(self._bounds)
+        else:
+            self._sheet._merged.discard(self._bounds)
+
+    def getIsMerged(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("getIsMerged")
+        return self._bounds in self._sheet._merged
+
+    isMerged = getIsMerged  # noqa: N815 - UNO alias
+
+
+class FakeSheetCellRanges(FakeUnoObject):
+    """com.sun.star.sheet.SheetCellRanges returned by queries (addresses only)."""
+
+    def __init__(self, office: "FakeOffice", addresses: List[CellRangeAddress]) -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_addresses", addresses)
+
+    def getRangeAddresses(self) -> Tuple[CellRangeAddress, ...]:  # noqa: N802 - UNO naming
+        self._charge("getRangeAddresses")
+        return tuple(self._addresses)
+
+    def getCount(self) -> int:  # noqa: N802 - UNO naming
+        self._charge("getCount")
+        return len(self._addresses)
+
+
+class FakeSheetCellCursor(FakeCellRange):
+    """com.sun.star.sheet.SheetCellCursor (XUsedAreaCursor part only)."""
+
+    _services = ("com.sun.star.sheet.SheetCellCursor", *FakeCellRange._services)
+
+    def _goto(self, column: int, row: int, expand: bool) -> None:
+        if expand:
+            sc, sr, _, _ = self._bounds
+            bounds = (min(sc, column), min(sr, row), max(sc, column), max(sr, row))
+        else:
+            bounds = (column, row, column, row)
+        object.__setattr__(self, "_bounds", bounds)
+
+    def gotoStartOfUsedArea(self, expand: bool) -> None:  # noqa: N802 - UNO naming
+        self._charge("gotoStartOfUsedArea")
+        sc, sr, _, _ = self._sheet._used_area()
+        self._goto(sc, sr, expand)
+
+    def gotoEndOfUsedArea(self, expand: bool) -> None:  # noqa: N802 - UNO naming
+        self._charge("gotoEndOfUsedArea")
+        _, _, ec, er = self._sheet._used_area()
+        self._goto(ec, er, expand)
+
+
+class FakeTableRows(FakeUnoObject):
+    """XTableRows / XTableColumns over a slice of a sheet."""
+
+    def __init__(self, sheet: "FakeSheet", start: int, end: int, rows: bool) -> None:
+        super().__init__(sheet._office)
+        object.__setattr__(self, "_sheet", sheet)
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+        object.__setattr__(self, "_rows", rows)
+
+    def getCount(self) -> int:  # noqa: N802 - UNO naming
+        self._charge("getCount")
+        return self._end - self._start + 1
+
+    def hasElements(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("hasElements")
+        return True
+
+    def getByIndex(self, index: int) -> "FakeTableRow":  # noqa: N802 - UNO naming
+        self._charge("getByIndex")
+        if not 0 <= index <= self._end - self._start:
+            raise FakeUnoException(f"IndexOutOfBoundsException: {index}")
+        return FakeTableRow(self._sheet, self._start + int(index), self._rows)
+
+    def insertByIndex(self, index: int, count: int) -> None:  # noqa: N802 - UNO naming
+        self._charge("insertByIndex")
+        self._sheet._shift(self._start + int(index), int(count), self._rows)
+
+    def removeByIndex(self, index: int, count: int) -> None:  # noqa: N802 - UNO naming
+        self._charge("removeByIndex")
+        self._sheet._shift(self._start + int(index), -int(count), self._rows)
+
+
+class FakeTableRow(FakeUnoObject):
+    """com.sun.star.table.TableRow / TableColumn."""
+
+    def __init__(self, sheet: "FakeSheet", index: int, row: bool) -> None:
+        super().__init__(sheet._office)
+        store = sheet._row_props if row else sheet._column_props
+        object.__setattr__(self, "_props", store.setdefault(index, {}))
+        object.__setattr__(self, "_defaults", _ROW_DEFAULTS if row else _COLUMN_DEFAULTS)
+        object.__setattr__(self, "_services", ("com.sun.star.table.TableRow",) if row else ("com.sun.star.table.TableColumn",))
+
+
+# -- sheets ---------------------------------------------------------------------
+class FakeSheet(_CellAccess, FakeUnoObject):
+    """com.sun.star.sheet.Spreadsheet holding its cells in dictionaries."""
+
+    _services = ("com.sun.star.sheet.Spreadsheet", "com.sun.star.sheet.SheetCellRange")
+    _defaults = _SHEET_DEFAULTS
+
+    def __init__(self, document: "FakeCalcDocument", name: str) -> None:
+        super().__init__(document._office)
+        object.__setattr__(self, "_document", document)
+        object.__setattr__(self, "_sheet", self)
+        object.__setattr__(self, "_bounds", (0, 0, MAX_COLUMN, MAX_ROW))
+        object.__setattr__(self, "_name", name)
+        # (column, row) -> (kind, content); kind is VALUE, TEXT or FORMULA.
+        object.__setattr__(self, "_cells", {})
+        # Cell properties: per-cell {name: (stamp, value)} plus range-wide layers
+        # [(stamp, bounds, name, value)]; the most recent stamp wins.
+        object.__setattr__(self, "_formats", {})
+        object.__setattr__(self, "_layers", [])
+        object.__setattr__(self, "_stamp", 0)
+        object.__setattr__(self, "_row_props", {})
+        object.__setattr__(self, "_column_props", {})
+        object.__setattr__(self, "_merged", set())
+        object.__setattr__(self, "_draw_page", FakeDrawPage(self._office))
+        object.__setattr__(self, "_charts", FakeTableCharts(self))
+        object.__setattr__(self, "_pilots", FakeDataPilotTables(self))
+
+    def _index(self) -> int:
+        return self._document._sheets._items.index(self)
+
+    # storage helpers (no charge)
+    def _put(self, pos: Tuple[int, int], content: Optional[Tuple[str, Any]]) -> None:
+        if content is None:
+            self._cells.pop(pos, None)
+        else:
+            self._cells[pos] = content
+        self._document._modified = True
+
+    def _set_range_format(self, bounds: Tuple[int, int, int, int], name: str, value: Any) -> None:
+        self._stamp += 1
+        sc, sr, ec, er = bounds
+        if sc == ec and sr == er and name != "TableBorder2":
+            self._formats.setdefault((sc, sr), {})[name] = (self._stamp, value)
+        else:
+            # Layers hidden entirely by the new one are dropped.
+            self._layers[:] = [
+                layer for layer in self._layers
+                if layer[2] != name or not (sc <= layer[1][0] and sr <= layer[1][1] and layer[1][2] <= ec and layer[1][3] <= er)
+            ]
+            self._layers.append((self._stamp, bounds, name, value))
+        self._document._modified = True
+
+    def _format(self, pos: Tuple[int, int], name: str) -> Any:
+        """Effective cell property at ``pos`` (_MISSING when never set)."""
+
+        entry = (self._formats.get(pos) or {}).get(name)
+        floor = entry[0] if entry else -1
+        col, row = pos
+        for stamp, (sc, sr, ec, er), layer_name, value in reversed(self._layers):
+            if stamp < floor:
+                break
+            if not (sc <= col <= ec and sr <= row <= er):
+                continue
+            if layer_name == name:
+                return value
+            if layer_name == "TableBorder2" and name in _BORDER_LINES:
+                outer, inner = _BORDER_LINES[name]
+                edge = {"TopBorder": row == sr, "BottomBorder": row == er,
+                        "LeftBorder": col == sc, "RightBorder": col == ec}[name]
+                line = outer if edge else inner
+                if getattr(value, f"Is{line}Valid", False):
+                    return getattr(value, line)
+        return entry[1] if entry else _MISSING
+
+    def _used_area(self) -> Tuple[int, int, int, int]:
+        if not self._cells:
+            return 0, 0, 0, 0
+        columns = [col for col, _ in self._cells]
+        rows = [row for _, row in self._cells]
+        return min(columns), min(rows), max(columns), max(rows)
+
+    def _data(self, pos: Tuple[int, int]) -> Any:
+        kind, content = self._cells.get(pos, ("EMPTY", ""))
+        if kind == "FORMULA":
+            return 0.0  # formulas are not evaluated
+        return content
+
+    def _formula(self, pos: Tuple[int, int]) -> str:
+        kind, content = self._cells.get(pos, ("EMPTY", ""))
+        return _number_text(content) if kind == "VALUE" else content
+
+    def _text(self, pos: Tuple[int, int]) -> str:
+        kind, content = self._cells.get(pos, ("EMPTY", ""))
+        if kind == "VALUE":
+            return _number_text(content)
+        return "" if kind == "FORMULA" else content
+
+    def _shift(self, start: int, delta: int, rows: bool) -> None:
+        """Insert (delta > 0) or delete (delta < 0) rows/columns at ``start``."""
+
+        axis = 1 if rows else 0
+        layers = []
+        for stamp, bounds, name, value in self._layers:
+            lo, hi = bounds[axis], bounds[axis + 2]
+            if delta > 0:
+                lo, hi = (lo + delta if lo >= start else lo), (hi + delta if hi >= start else hi)
+            else:
+                lo = lo if lo < start else max(start, lo + delta)
+                hi = hi if hi < start else max(start - 1, hi + delta)
+                if hi < lo:
+                    continue
+            bounds = (bounds[0], lo, bounds[2], hi) if rows else (lo, bounds[1], hi, bounds[3])
+            layers.append((stamp, bounds, name, value))
+        self._layers[:] = layers
+        for store in (self._cells, self._formats):
+            moved = {}
+            for pos, item in store.items():
+                at = pos[axis]
+                if delta < 0 and start <= at < start - delta:
+                    continue
+                if at >= start:
+                    pos = (pos[0], at + delta) if rows else (at + delta, pos[1])
+                moved[pos] = item
+            store.clear()
+            store.update(moved)
+
+    # XNamed
+    def getName(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getName")
+        return self._name
+
+    def setName(self, name: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setName")
+        self._document._sheets._rename(self, str(name))
+
+    # XSpreadsheet
+    def createCursor(self) -> FakeSheetCellCursor:  # noqa: N802 - UNO naming
+        self._charge("createCursor")
+        return FakeSheetCellCursor(self, (0, 0, MAX_COLUMN, MAX_ROW))
+
+    # XDrawPageSupplier / XTableChartsSupplier / XDataPilotTablesSupplier
+    def getDrawPage(self) -> "FakeDrawPage":  # noqa: N802 - UNO naming
+        self._charge("getDrawPage")
+        return self._draw_page
+
+    def getCharts(self) -> "FakeTableCharts":  # noqa: N802 - UNO naming
+        self._charge("getCharts")
+        return self._charts
+
+    def getDataPilotTables(self) -> "FakeDataPilotTables":  # noqa: N802 - UNO naming
+        self._charge("getDataPilotTables")
+        return self._pilots
+
+
+class _NamedContainer(FakeUnoObject):
+    """XNameAccess / XIndexAccess over an ordered list of elements."""
+
+    def __init__(self, office: "FakeOffice") -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_items", [])
+
+    def _name_of(self, item: Any) -> str:
+        return item._name
+
+    def _find(self, name: str) -> Any:
+        for item in self._items:
+            if self._name_of(item) == name:
+                return item
+        raise FakeUnoException(f"NoSuchElementException: {name}")
+
+    def getByName(self, name: str) -> Any:  # noqa: N802 - UNO naming
+        self._charge("getByName")
+        return self._find(name)
+
+    def hasByName(self, name: str) -> bool:  # noqa: N802 - UNO naming
+        self._charge("hasByName")
+        return any(self._name_of(item) == name for item in self._items)
+
+    def getElementNames(self) -> Tuple[str, ...]:  # noqa: N802 - UNO naming
+        self._charge("getElementNames")
+        return tuple(self._name_of(item) for item in self._items)
+
+    def getByIndex(self, index: int) -> Any:  # noqa: N802 - UNO naming
+        self._charge("getByIndex")
+        if not 0 <= index < len(self._items):
+            raise FakeUnoException(f"IndexOutOfBoundsException: {index}")
+        return self._items[index]
+
+    def getCount(self) -> int:  # noqa: N802 - UNO naming
+        self._charge("getCount")
+        return len(self._items)
+
+    def hasElements(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("hasElements")
+        return bool(self._items)
+
+    def removeByName(self, name: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("removeByName")
+        self._items.remove(self._find(name))
+
+    def _check_new(self, name: str) -> None:
+        if any(self._name_of(item) == name for item in self._items):
+            raise FakeUnoException(f"ElementExistException: {name}")
+
+
+class FakeSheets(_NamedContainer):
+    """com.sun.star.sheet.Spreadsheets."""
+
+    def __init__(self, document: "FakeCalcDocument") -> None:
+        super().__init__(document._office)
+        object.__setattr__(self, "_document", document)
+
+    def _rename(self, sheet: FakeSheet, name: str) -> None:
+        if name != sheet._name:
+            self._check_new(name)
+        sheet._name = name
+
+    def _insert(self, sheet: FakeSheet, position: int) -> None:
+        self._items.insert(max(0, min(int(position), len(self._items))), sheet)
+        self._document._modified = True
+
+    def insertNewByName(self, name: str, position: int) -> None:  # noqa: N802 - UNO naming
+        self._charge("insertNewByName")
+        self._check_new(name)
+        self._insert(FakeSheet(self._document, name), position)
+
+    def copyByName(self, source: str, name: str, position: int) -> None:  # noqa: N802 - UNO naming
+        self._charge("copyByName")
+        self._check_new(name)
+        original = self._find(source)
+        clone = copy.deepcopy(original, {id(self._office): self._office, id(self._document): self._document})
+        clone._name = name
+        self._insert(clone, position)
+
+    def moveByName(self, name: str, position: int) -> None:  # noqa: N802 - UNO naming
+        self._charge("moveByName")
+        sheet = self._find(name)
+        self._items.remove(sheet)
+        self._insert(sheet, position)
+
+    def removeByName(self, name: str) -> None:  # noqa: N802 - UNO naming
+        if len(self._items) == 1:
+            self._charge("removeByName")
+            raise FakeUnoException("RuntimeException: cannot remove the last sheet")
+        super().removeByName(name)
+
+
+# -- drawing --------------------------------------------------------------------
+class FakeDrawPage(_NamedContainer):
+    """com.sun.star.drawing.DrawPage (XShapes)."""
+
+    def _name_of(self, item: Any) -> str:
+        return str(item._props.get("Name", ""))
+
+    def add(self, shape: "FakeShape") -> None:
+        self._charge("add")
+        if shape in self._items:
+            raise FakeUnoException("IllegalArgumentException: shape already on a page")
+        shape._props["ZOrder"] = len(self._items)
+        self._items.append(shape)
+
+    def remove(self, shape: "FakeShape") -> None:
+        self._charge("remove")
+        if shape not in self._items:
+            raise FakeUnoException("NoSuchElementException: shape is not on this page")
+        self._items.remove(shape)
+
+
+class FakeShape(FakeUnoObject):
+    """A drawing shape created by ``createInstance``; keeps its service name."""
+
+    _defaults = _SHAPE_DEFAULTS
+
+    def __init__(self, office: "FakeOffice", service: str) -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_services", (service, "com.sun.star.drawing.Shape"))
+        object.__setattr__(self, "_position", Point())
+        object.__setattr__(self, "_size", Size())
+        object.__setattr__(self, "_string", "")
+        object.__setattr__(self, "_shapes", None)
+
+    def getShapeType(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getShapeType")
+        return self._services[0]
+
+    def getPosition(self) -> Point:  # noqa: N802 - UNO naming
+        self._charge("getPosition")
+        return Point(self._position.X, self._position.Y)
+
+    def setPosition(self, position: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("setPosition")
+        self._position = Point(int(position.X), int(position.Y))
+
+    def getSize(self) -> Size:  # noqa: N802 - UNO naming
+        self._charge("getSize")
+        return Size(self._size.Width, self._size.Height)
+
+    def setSize(self, size: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("setSize")
+        self._size = Size(int(size.Width), int(size.Height))
+
+    def getName(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getName")
+        return str(self._props.get("Name", ""))
+
+    def setName(self, name: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setName")
+        self._props["Name"] = str(name)
+
+    # XText (the shape is its own text)
+    def getText(self) -> "FakeShape":  # noqa: N802 - UNO naming
+        self._charge("getText")
+        return self
+
+    def getString(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getString")
+        return self._string
+
+    def setString(self, text: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setString")
+        self._string = str(text)
+
+    # XConnectorShape
+    def connectStart(self, shape: "FakeShape", position: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("connectStart")
+        self._props["StartShape"] = shape
+
+    def connectEnd(self, shape: "FakeShape", position: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("connectEnd")
+        self._props["EndShape"] = shape
+
+    # XShapes of group shapes
+    def getDrawPage(self) -> FakeDrawPage:  # noqa: N802 - UNO naming
+        self._charge("getDrawPage")
+        if self._shapes is None:
+            self._shapes = FakeDrawPage(self._office)
+        return self._shapes
+
+    def add(self, shape: "FakeShape") -> None:
+        self.getDrawPage().add(shape)
+
+    def getCount(self) -> int:  # noqa: N802 - UNO naming
+        return self.getDrawPage().getCount()
+
+    def getByIndex(self, index: int) -> "FakeShape":  # noqa: N802 - UNO naming
+        return self.getDrawPage().getByIndex(index)
+
+
+# -- charts ---------------------------------------------------------------------
+class FakeChartDocument(FakeUnoObject):
+    """Embedded chart model (com.sun.star.chart.ChartDocument)."""
+
+    _services = ("com.sun.star.chart.ChartDocument",)
+    _defaults = {"HasLegend": True, "HasMainTitle": False, "HasSubTitle": False}
+
+    def __init__(self, office: "FakeOffice") -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_diagram", FakeShape(office, "com.sun.star.chart.BarDiagram"))
+        object.__setattr__(self, "_title", FakeShape(office, "com.sun.star.chart.ChartTitle"))
+        object.__setattr__(self, "_subtitle", FakeShape(office, "com.sun.star.chart.ChartTitle"))
+
+    def createInstance(self, service: str) -> FakeShape:  # noqa: N802 - UNO naming
+        self._charge("createInstance")
+        return FakeShape(self._office, service)
+
+    def getDiagram(self) -> FakeShape:  # noqa: N802 - UNO naming
+        self._charge("getDiagram")
+        return self._diagram
+
+    def setDiagram(self, diagram: FakeShape) -> None:  # noqa: N802 - UNO naming
+        self._charge("setDiagram")
+        self._diagram = diagram
+
+    def getTitle(self) -> FakeShape:  # noqa: N802 - UNO naming
+        self._charge("getTitle")
+        return self._title
+
+    def setTitle(self, title: FakeShape) -> None:  # noqa: N802 - UNO naming
+        self._charge("setTitle")
+        self._title = title
+
+    def getSubTitle(self) -> FakeShape:  # noqa: N802 - UNO naming
+        self._charge("getSubTitle")
+        return self._subtitle
+
+    def setSubTitle(self, title: FakeShape) -> None:  # noqa: N802 - UNO naming
+        self._charge("setSubTitle")
+        self._subtitle = title
+
+
+class FakeTableChart(FakeUnoObject):
+    """com.sun.star.table.TableChart."""
+
+    _services = ("com.sun.star.table.TableChart",)
+
+    def __init__(self, charts: "FakeTableCharts", name: str, rect: Any, ranges: Sequence[Any],
+                 column_headers: bool, row_headers: bool) -> None:
+        super().__init__(charts._office)
+        object.__setattr__(self, "_charts", charts)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_rect", rect)
+        object.__setattr__(self, "_ranges", tuple(ranges))
+        object.__setattr__(self, "_chart_doc", FakeChartDocument(charts._office))
+        self._props.update(HasColumnHeaders=bool(column_headers), HasRowHeaders=bool(row_headers))
+
+    def getName(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getName")
+        return self._name
+
+    def setName(self, name: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setName")
+        if name != self._name:
+            self._charts._check_new(name)
+        self._name = str(name)
+
+    def getRanges(self) -> Tuple[Any, ...]:  # noqa: N802 - UNO naming
+        self._charge("getRanges")
+        return self._ranges
+
+    def setRanges(self, ranges: Sequence[Any]) -> None:  # noqa: N802 - UNO naming
+        self._charge("setRanges")
+        self._ranges = tuple(ranges)
+
+    def getHasColumnHeaders(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("getHasColumnHeaders")
+        return bool(self._props["HasColumnHeaders"])
+
+    def setHasColumnHeaders(self, value: bool) -> None:  # noqa: N802 - UNO naming
+        self._charge("setHasColumnHeaders")
+        self._props["HasColumnHeaders"] = bool(value)
+
+    def getHasRowHeaders(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("getHasRowHeaders")
+        return bool(self._props["HasRowHeaders"])
+
+    def setHasRowHeaders(self, value: bool) -> None:  # noqa: N802 - UNO naming
+        self._charge("setHasRowHeaders")
+        self._props["HasRowHeaders"] = bool(value)
+
+    def getEmbeddedObject(self) -> FakeChartDocument:  # noqa: N802 - UNO naming
+        self._charge("getEmbeddedObject")
+        return self._chart_doc
+
+
+class FakeTableCharts(_NamedContainer):
+    """com.sun.star.table.TableCharts of one sheet."""
+
+    def __init__(self, sheet: FakeSheet) -> None:
+        super().__init__(sheet._office)
+
+    def addNewByName(self, name: str, rect: Any, ranges: Sequence[Any],  # noqa: N802 - UNO naming
+                     column_headers: bool, row_headers: bool) -> None:
+        self._charge("addNewByName")
+        self._check_new(name)
+        self._items.append(FakeTableChart(self, str(name), rect, ranges, column_headers, row_headers))
+
+
+# -- DataPilot ------------------------------------------------------------------
+class FakeDataPilotField(FakeUnoObject):
+    """com.sun.star.sheet.DataPilotField."""
+
+    _services = ("com.sun.star.sheet.DataPilotField",)
+    _defaults = {"Orientation": 0, "Function": 0}
+
+    def __init__(self, office: "FakeOffice", name: str) -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_name", name)
+
+    def getName(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getName")
+        return self._name
+
+    def getOrientation(self) -> int:  # noqa: N802 - UNO naming
+        self._charge("getOrientation")
+        return int(self._get_property("Orientation"))
+
+    def setOrientation(self, orientation: int) -> None:  # noqa: N802 - UNO naming
+        self._charge("setOrientation")
+        self._props["Orientation"] = int(orientation)
+
+
+class FakeDataPilotDescriptor(FakeUnoObject):
+    """com.sun.star.sheet.DataPilotDescriptor; fields come from the source header row."""
+
+    _services = ("com.sun.star.sheet.DataPilotDescriptor",)
+    _defaults = {"ColumnGrand": True, "RowGrand": True, "IgnoreEmptyRows": False}
+
+    def __init__(self, sheet: FakeSheet) -> None:
+        super().__init__(sheet._office)
+        object.__setattr__(self, "_sheet", sheet)
+        object.__setattr__(self, "_source", None)
+        object.__setattr__(self, "_tag", "")
+        object.__setattr__(self, "_fields", _NamedContainer(sheet._office))
+
+    def getSourceRange(self) -> Any:  # noqa: N802 - UNO naming
+        self._charge("getSourceRange")
+        return self._source
+
+    def setSourceRange(self, address: Any) -> None:  # noqa: N802 - UNO naming
+        self._charge("setSourceRange")
+        self._source = address
+        sheets = self._sheet._document._sheets._items
+        source = sheets[int(address.Sheet)] if 0 <= int(address.Sheet) < len(sheets) else self._sheet
+        names = [
+            source._text((col, int(address.StartRow))) or f"Column {col - int(address.StartColumn) + 1}"
+            for col in range(int(address.StartColumn), int(address.EndColumn) + 1)
+        ]
+        self._fields._items[:] = [FakeDataPilotField(self._office, name) for name in names]
+
+    def getDataPilotFields(self) -> _NamedContainer:  # noqa: N802 - UNO naming
+        self._charge("getDataPilotFields")
+        return self._fields
+
+    def getTag(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getTag")
+        return self._tag
+
+    def setTag(self, tag: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setTag")
+        self._tag = str(tag)
+
+
+class FakeDataPilotTable(FakeUnoObject):
+    """com.sun.star.sheet.DataPilotTable (XDataPilotTable2); the result is not computed."""
+
+    _services = ("com.sun.star.sheet.DataPilotTable",)
+
+    def __init__(self, tables: "FakeDataPilotTables", name: str, output: Any,
+                 descriptor: FakeDataPilotDescriptor) -> None:
+        super().__init__(tables._office)
+        object.__setattr__(self, "_tables", tables)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_output", output)
+        object.__setattr__(self, "_descriptor", descriptor)
+
+    def getName(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getName")
+        return self._name
+
+    def setName(self, name: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("setName")
+        if name != self._name:
+            self._tables._check_new(name)
+        self._name = str(name)
+
+    def getDataPilotDescriptor(self) -> FakeDataPilotDescriptor:  # noqa: N802 - UNO naming
+        self._charge("getDataPilotDescriptor")
+        return self._descriptor
+
+    def getSourceRange(self) -> Any:  # noqa: N802 - UNO naming
+        return self._descriptor.getSourceRange()
+
+    def getOutputRange(self) -> CellRangeAddress:  # noqa: N802 - UNO naming
+        self._charge("getOutputRange")
+        out = self._output
+        width = max(1, len(self._descriptor._fields._items))
+        return CellRangeAddress(int(out.Sheet), int(out.Column), int(out.Row), int(out.Column) + width - 1, int(out.Row))
+
+    def refresh(self) -> None:
+        self._charge("refresh")
+
+
+class FakeDataPilotTables(_NamedContainer):
+    """com.sun.star.sheet.DataPilotTables of one sheet."""
+
+    def __init__(self, sheet: FakeSheet) -> None:
+        super().__init__(sheet._office)
+        object.__setattr__(self, "_sheet", sheet)
+
+    def createDataPilotDescriptor(self) -> FakeDataPilotDescriptor:  # noqa: N802 - UNO naming
+        self._charge("createDataPilotDescriptor")
+        return FakeDataPilotDescriptor(self._sheet)
+
+    def insertNewByName(self, name: str, output: Any, descriptor: FakeDataPilotDescriptor) -> None:  # noqa: N802
+        self._charge("insertNewByName")
+        self._check_new(name)
+        if descriptor._source is None:
+            raise FakeUnoException("RuntimeException: DataPilot descriptor has no source range")
+        self._items.append(FakeDataPilotTable(self, str(name), output, descriptor))
+
+
+# -- document and desktop -------------------------------------------------------
+class FakeNumberFormat(FakeUnoObject):
+    """Properties of one number format (Type, FormatString)."""
+
+    def __init__(self, office: "FakeOffice", key: int, format_type: int, code: str) -> None:
+        super().__init__(office)
+        self._props.update({"Type": format_type, "FormatString": code, "Key": key})
+
+
+class FakeNumberFormats(FakeUnoObject):
+    """com.sun.star.util.NumberFormats (XNumberFormats / XNumberFormatTypes)."""
+
+    def __init__(self, office: "FakeOffice") -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_formats", dict(_NUMBER_FORMATS))
+
+    def getByKey(self, key: int) -> FakeNumberFormat:  # noqa: N802 - UNO naming
+        self._charge("getByKey")
+        try:
+            format_type, code = self._formats[int(key)]
+        except KeyError:
+            raise FakeUnoException(f"IllegalArgumentException: number format {key}") from None
+        return FakeNumberFormat(self._office, int(key), format_type, code)
+
+    def queryKey(self, code: str, locale: Any, scan: bool) -> int:  # noqa: N802 - UNO naming
+        self._charge("queryKey")
+        for key, (_, known) in self._formats.items():
+            if known == code:
+                return key
+        return -1
+
+    def addNew(self, code: str, locale: Any) -> int:  # noqa: N802 - UNO naming
+        self._charge("addNew")
+        key = max(self._formats) + 1
+        upper = code.upper()
+        format_type = (2 if "YY" in upper or "DD" in upper else 0) | (4 if "HH" in upper or "SS" in upper else 0)
+        self._formats[key] = (format_type or 16, code)
+        return key
+
+    def getStandardFormat(self, format_type: int, locale: Any) -> int:  # noqa: N802 - UNO naming
+        self._charge("getStandardFormat")
+        return next((key for key, (known, _) in self._formats.items() if known == format_type), 0)
+
+
+class FakeUndoManager(FakeUnoObject):
+    """com.sun.star.document.XUndoManager (context nesting only)."""
+
+    def __init__(self, office: "FakeOffice") -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_contexts", [])
+        object.__setattr__(self, "_actions", [])
+
+    def enterUndoContext(self, title: str) -> None:  # noqa: N802 - UNO naming
+        self._charge("enterUndoContext")
+        self._contexts.append(str(title))
+
+    def leaveUndoContext(self) -> None:  # noqa: N802 - UNO naming
+        self._charge("leaveUndoContext")
+        if not self._contexts:
+            raise FakeUnoException("InvalidStateException: no open undo context")
+        title = self._contexts.pop()
+        if not self._contexts:
+            self._actions.append(title)
+
+    def isUndoPossible(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("isUndoPossible")
+        return bool(self._actions)
+
+    def getCurrentUndoActionTitle(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getCurrentUndoActionTitle")
+        if not self._actions:
+            raise FakeUnoException("EmptyUndoStackException")
+        return self._actions[-1]
+
+
+class FakeController(FakeUnoObject):
+    """Spreadsheet view controller (active sheet and frame)."""
+
+    def __init__(self, document: "FakeCalcDocument") -> None:
+        super().__init__(document._office)
+        object.__setattr__(self, "_document", document)
+        object.__setattr__(self, "_active", None)
+
+    def getActiveSheet(self) -> FakeSheet:  # noqa: N802 - UNO naming
+        self._charge("getActiveSheet")
+        sheets = self._document._sheets._items
+        return self._active if self._active in sheets else sheets[0]
+
+    def setActiveSheet(self, sheet: FakeSheet) -> None:  # noqa: N802 - UNO naming
+        self._charge("setActiveSheet")
+        self._active = sheet
+
+    def getFrame(self) -> "FakeController":  # noqa: N802 - UNO naming
+        self._charge("getFrame")
+        return self
+
+    def activate(self) -> None:
+        self._charge("activate")
+        self._office.desktop._current = self._document
+
+    def getModel(self) -> "FakeCalcDocument":  # noqa: N802 - UNO naming
+        self._charge("getModel")
+        return self._document
+
+
+class FakeCalcDocument(FakeUnoObject):
+    """com.sun.star.sheet.SpreadsheetDocument."""
+
+    _services = ("com.sun.star.sheet.SpreadsheetDocument", "com.sun.star.document.OfficeDocument")
+    _defaults = _DOCUMENT_DEFAULTS
+
+    def __init__(self, office: "FakeOffice", sheet_names: Iterable[str] = ("Sheet1",)) -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_sheets", FakeSheets(self))
+        object.__setattr__(self, "_controller", FakeController(self))
+        object.__setattr__(self, "_undo", FakeUndoManager(office))
+        object.__setattr__(self, "_number_formats", FakeNumberFormats(office))
+        object.__setattr__(self, "_url", "")
+        object.__setattr__(self, "_modified", False)
+        object.__setattr__(self, "_closed", False)
+        object.__setattr__(self, "_controller_locks", 0)
+        object.__setattr__(self, "_action_locks", 0)
+        object.__setattr__(self, "_auto_calc", True)
+        object.__setattr__(self, "_recalculations", 0)
+        for name in sheet_names:
+            self._sheets._items.append(FakeSheet(self, name))
+        self._modified = False
+
+    @property
+    def recalculations(self) -> int:
+        """Number of calculate()/calculateAll() calls (formulas are not evaluated)."""
+
+        return self._recalculations
+
+    def _snapshot(self) -> "FakeCalcDocument":
+        return copy.deepcopy(self, {id(self._office): self._office})
+
+    def getSheets(self) -> FakeSheets:  # noqa: N802 - UNO naming
+        self._charge("getSheets")
+        return self._sheets
+
+    def getNumberFormats(self) -> FakeNumberFormats:  # noqa: N802 - UNO naming
+        self._charge("getNumberFormats")
+        return self._number_formats
+
+    def getCurrentController(self) -> FakeController:  # noqa: N802 - UNO naming
+        self._charge("getCurrentController")
+        return self._controller
+
+    def createInstance(self, service: str) -> FakeShape:  # noqa: N802 - UNO naming
+        self._charge("createInstance")
+        if not service.startswith("com.sun.star.drawing."):
+            raise FakeUnoException(f"ServiceNotRegisteredException: {service}")
+        return FakeShape(self._office, service)
+
+    # XModel locking / XActionLockable / XCalculatable
+    def lockControllers(self) -> None:  # noqa: N802 - UNO naming
+        self._charge("lockControllers")
+        self._controller_locks += 1
+
+    def unlockControllers(self) -> None:  # noqa: N802 - UNO naming
+        self._charge("unlockControllers")
+        self._controller_locks = max(0, self._controller_locks - 1)
+
+    def hasControllersLocked(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("hasControllersLocked")
+        return self._controller_locks > 0
+
+    def addActionLock(self) -> None:  # noqa: N802 - UNO naming
+        self._charge("addActionLock")
+        self._action_locks += 1
+
+    def removeActionLock(self) -> None:  # noqa: N802 - UNO naming
+        self._charge("removeActionLock")
+        self._action_locks = max(0, self._action_locks - 1)
+
+    def isActionLocked(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("isActionLocked")
+        return self._action_locks > 0
+
+    def isAutomaticCalculationEnabled(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("isAutomaticCalculationEnabled")
+        return self._auto_calc
+
+    def enableAutomaticCalculation(self, enabled: bool) -> None:  # noqa: N802 - UNO naming
+        self._charge("enableAutomaticCalculation")
+        self._auto_calc = bool(enabled)
+
+    def calculate(self) -> None:
+        self._charge("calculate")
+        self._recalculations += 1
+
+    def calculateAll(self) -> None:  # noqa: N802 - UNO naming
+        self._charge("calculateAll")
+        self._recalculations += 1
+
+    def getUndoManager(self) -> FakeUndoManager:  # noqa: N802 - UNO naming
+        self._charge("getUndoManager")
+        return self._undo
+
+    # XStorable / XModifiable / XModel
+    def _store(self, url: str) -> None:
+        self._office.files[url] = self._snapshot()
+
+    def store(self) -> None:
+        self._charge("store")
+        if not self._url:
+            raise FakeUnoException("IOException: document has no location")
+        self._store(self._url)
+        self._modified = False
+
+    def storeAsURL(self, url: str, args: Sequence[Any] = ()) -> None:  # noqa: N802 - UNO naming
+        self._charge("storeAsURL")
+        self._url = str(url)
+        self._store(self._url)
+        self._modified = False
+
+    def storeToURL(self, url: str, args: Sequence[Any] = ()) -> None:  # noqa: N802 - UNO naming
+        self._charge("storeToURL")
+        self._store(str(url))
+
+    def hasLocation(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("hasLocation")
+        return bool(self._url)
+
+    def getLocation(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getLocation")
+        return self._url
+
+    def isModified(self) -> bool:  # noqa: N802 - UNO naming
+        self._charge("isModified")
+        return self._modified
+
+    def setModified(self, modified: bool) -> None:  # noqa: N802 - UNO naming
+        self._charge("setModified")
+        self._modified = bool(modified)
+
+    def getURL(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getURL")
+        return self._url
+
+    def getTitle(self) -> str:  # noqa: N802 - UNO naming
+        self._charge("getTitle")
+        return self._url.rsplit("/", 1)[-1] if self._url else "Untitled 1"
+
+    def close(self, deliver_ownership: bool = True) -> None:
+        self._charge("close")
+        self._closed = True
+        self._office.desktop._forget(self)
+
+    def dispose(self) -> None:
+        self._charge("dispose")
+        self._closed = True
+        self._office.desktop._forget(self)
+
+
+class FakeDesktop(FakeUnoObject):
+    """com.sun.star.frame.Desktop that creates and "loads" FakeCalcDocuments."""
+
+    _services = ("com.sun.star.frame.Desktop",)
+
+    def __init__(self, office: "FakeOffice") -> None:
+        super().__init__(office)
+        object.__setattr__(self, "_documents", [])
+        object.__setattr__(self, "_current", None)
+        object.__setattr__(self, "_terminated", False)
+
+    @property
+    def terminated(self) -> bool:
+        return self._terminated
+
+    def _open(self, document: FakeCalcDocument) -> FakeCalcDocument:
+        self._documents.append(document)
+        self._current = document
+        return document
+
+    def _forget(self, document: FakeCalcDocument) -> None:
+        if document in self._documents:
+            self._documents.remove(document)
+        if self._current is document:
+            self._current = self._documents[-1] if self._documents else None
+
+    def getCurrentComponent(self) -> Optional[FakeCalcDocument]:  # noqa: N802 - UNO naming
+        self._charge("getCurrentComponent")
+        return self._current
+
+    def loadComponentFromURL(self, url: str, target: str = "_blank", flags: int = 0,  # noqa: N802 - UNO naming
+                             args: Sequence[Any] = ()) -> FakeCalcDocument:
+        self._charge("loadComponentFromURL")
+        if url == "private:factory/scalc":
+            return self._open(FakeCalcDocument(self._office))
+        stored = self._office.files.get(url)
+        if stored is None:
+            raise FakeUnoException(f"IllegalArgumentException: Unsupported URL <{url}>")
+        document = stored._snapshot()
+        document._url = url
+        return self._open(document)
+
+    def terminate(self) -> bool:
+        self._charge("terminate")
+        self._terminated = True
+        return True
+
+
+class FakeOffice:
+    """One fake office process: its desktop, "files" on disk and latency model."""
+
+    def __init__(self, latency: LatencyModel | None = None) -> None:
+        self.latency = latency or LatencyModel()
+        self.files: Dict[str, FakeCalcDocument] = {}
+        self.desktop = FakeDesktop(self)
+
+    def new_document(self, sheet_names: Iterable[str] = ("Sheet1",)) -> FakeCalcDocument:
+        """Open a new document without charging the latency model."""
+
+        return self.desktop._open(FakeCalcDocument(self, sheet_names))
+
+    def connect_calc(self, sheet_names: Iterable[str] = ("Sheet1",)) -> Tuple[FakeDesktop, Any, Any]:
+        """Like connection.connect_calc(): ``(desktop, CalcDocument, first Spreadsheet)``."""
+
+        from ..core.calc_document import CalcDocument
+
+        document = self.desktop._current or self.new_document(sheet_names)
+        doc = CalcDocument(document)
+        return self.desktop, doc, doc.sheet(0)
+
+
+def fake_calc(latency: LatencyModel | None = None, sheet_names: Iterable[str] = ("Sheet1",)) -> Tuple[FakeOffice, Any, Any]:
+    """Shortcut: ``office, doc, sheet = fake_calc()`` on a fresh FakeOffice."""
+
+    office = FakeOffice(latency)
+    _, doc, sheet = office.connect_calc(sheet_names)
+    return office, doc, sheet
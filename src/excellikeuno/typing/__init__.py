@@ -1,55 +1,107 @@
-from .calc import (
-    Color,
-    BorderLine,
-    BorderLine2,
-    CellHoriJustify,
-    CellOrientation,
-    CellVertJustify,
-    Colors,
-    ShadowLocation,
-    LineDash,
-    LineStyle,
-    FontSlant,
-    FontUnderline,
-    FontStrikeout,
-    TableBorder,
-    TableBorder2,
-    XCell,
-    XCellRange,
-    XTableColumns,
-    XTableRows,
-    XDrawPage,
-    XDrawPageSupplier,
-    XShapes,
-    XShape,
-    XNamed,
-    XPropertySet,
-    XSheetCellRange,
-    XSheetCellRanges,
-    XSpreadsheet,
-    XSpreadsheetDocument,
-    XStorable,
-    XColumnRowRange,
-    XCellRangeAddressable,
-    XMergeable,
-    BorderLineStyle,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .interfaces import InterfaceNames
-from .structs import (
-    BarCode,
-    BezierPoint,
-    BorderLine2,
-    BorderLine,
-    CellAddress,
-    CellRangeAddress,
-    Point,
-    TableBorder2,
-    TableBorder,
-    TableSortField,
-    ShadowFormat,
-    CellProtection,
-)
-from ..style.font import Font
+
+if TYPE_CHECKING:
+    from .calc import (
+        Color,
+        CellHoriJustify,
+        CellOrientation,
+        CellVertJustify,
+        Colors,
+        ShadowLocation,
+        LineDash,
+        LineStyle,
+        FontSlant,
+        FontUnderline,
+        FontStrikeout,
+        XCell,
+        XCellRange,
+        XTableColumns,
+        XTableRows,
+        XDrawPage,
+        XDrawPageSupplier,
+        XShapes,
+        XShape,
+        XNamed,
+        XPropertySet,
+        XSheetCellRange,
+        XSheetCellRanges,
+        XCellRangeData,
+        XCellRangeFormula,
+        XSpreadsheet,
+        XSpreadsheetDocument,
+        XStorable,
+        XColumnRowRange,
+        XCellRangeAddressable,
+        XMergeable,
+        BorderLineStyle,
+    )
+    from .structs import (
+        BarCode,
+        BezierPoint,
+        BorderLine2,
+        BorderLine,
+        CellAddress,
+        CellRangeAddress,
+        Point,
+        TableBorder2,
+        TableBorder,
+        TableSortField,
+        ShadowFormat,
+        CellProtection,
+    )
+    from ..style.font import Font
+
+# calc.py（列挙・プロトコル）と structs.py は大きいので、名前が使われたときに読み込む
+_LAZY = {
+    "Color": ".calc",
+    "BorderLine": ".structs",
+    "BorderLine2": ".structs",
+    "CellHoriJustify": ".calc",
+    "CellOrientation": ".calc",
+    "CellVertJustify": ".calc",
+    "Colors": ".calc",
+    "ShadowLocation": ".calc",
+    "LineDash": ".calc",
+    "LineStyle": ".calc",
+    "FontSlant": ".calc",
+    "FontUnderline": ".calc",
+    "FontStrikeout": ".calc",
+    "TableBorder": ".structs",
+    "TableBorder2": ".structs",
+    "XCell": ".calc",
+    "XCellRange": ".calc",
+    "XTableColumns": ".calc",
+    "XTableRows": ".calc",
+    "XDrawPage": ".calc",
+    "XDrawPageSupplier": ".calc",
+    "XShapes": ".calc",
+    "XShape": ".calc",
+    "XNamed": ".calc",
+    "XPropertySet": ".calc",
+    "XSheetCellRange": ".calc",
+    "XSheetCellRanges": ".calc",
+    "XCellRangeData": ".calc",
+    "XCellRangeFormula": ".calc",
+    "XSpreadsheet": ".calc",
+    "XSpreadsheetDocument": ".calc",
+    "XStorable": ".calc",
+    "XColumnRowRange": ".calc",
+    "XCellRangeAddressable": ".calc",
+    "XMergeable": ".calc",
+    "BorderLineStyle": ".calc",
+    "BarCode": ".structs",
+    "BezierPoint": ".structs",
+    "CellAddress": ".structs",
+    "CellRangeAddress": ".structs",
+    "Point": ".structs",
+    "TableSortField": ".structs",
+    "ShadowFormat": ".structs",
+    "CellProtection": ".structs",
+    "Font": "..style.font",
+}
 
 __all__ = [
     "BorderLine",
@@ -80,6 +132,8 @@ __all__ = [
     "XSheetCellRange",
     "XSheetCellRanges",
     "XCellRangeAddressable",
+    "XCellRangeData",
+    "XCellRangeFormula",
     "XSpreadsheet",
     "XSpreadsheetDocument",
     "XStorable",
@@ -101,3 +155,16 @@ __all__ = [
     "Font",
     "BorderLineStyle",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -37,6 +37,9 @@ class XSpreadsheet(Protocol):
     def getCellByPosition(self, column: int, row: int) -> Any:
         ...
 
+    def createCursor(self) -> Any:
+        ...
+
     def getCellRangeByPosition(self, start_column: int, start_row: int, end_column: int, end_row: int) -> Any:
         ...
 
@@ -65,11 +68,47 @@ class XSheetCellRange(Protocol):
         ...
 
 
+@runtime_checkable
+class XCellRangeData(Protocol):
+    def getDataArray(self) -> Any:
+        ...
+
+    def setDataArray(self, array: Any) -> None:
+        ...
+
+
+@runtime_checkable
+class XCellRangeFormula(Protocol):
+    def getFormulaArray(self) -> Any:
+        ...
+
+    def setFormulaArray(self, array: Any) -> None:
+        ...
+
+
+@runtime_checkable
+class XUsedAreaCursor(Protocol):
+    def gotoStartOfUsedArea(self, expand: bool) -> None:
+        ...
+
+    def gotoEndOfUsedArea(self, expand: bool) -> None:
+        ...
+
+
 @runtime_checkable
 class XSheetCellRanges(Protocol):
     def getCells(self) -> Any:
         ...
 
+    def getRangeAddresses(self) -> Any:
+        ...
+
+
+@runtime_checkable
+class XCellRangesQuery(Protocol):
+    def queryContentCells(self, cell_flags: int) -> Any:
+        ...
+
 
 @runtime_checkable
 class XCellRangeAddressable(Protocol):
@@ -411,6 +450,14 @@ class CellVertJustify(IntEnum):
     BLOCK = 4
 
 
+class CellFlags(IntEnum):
+    VALUE = 1
+    DATETIME = 2
+    STRING = 4
+    ANNOTATION = 8
+    FORMULA = 16
+
+
 class DataPilotFieldOrientation(IntEnum):
     HIDDEN = 0
     PAGE = 1
@@ -8,6 +8,11 @@ class InterfaceNames:
     X_SHEET_CELL_RANGE = "com.sun.star.sheet.XSheetCellRange"
     X_SHEET_CELL_RANGES = "com.sun.star.sheet.XSheetCellRanges"
     X_CELL_RANGE_ADDRESSABLE = "com.sun.star.sheet.XCellRangeAddressable"
+    X_CELL_RANGE_DATA = "com.sun.star.sheet.XCellRangeData"
+    X_CELL_RANGE_FORMULA = "com.sun.star.sheet.XCellRangeFormula"
+    X_SHEET_CELL_CURSOR = "com.sun.star.sheet.XSheetCellCursor"
+    X_USED_AREA_CURSOR = "com.sun.star.sheet.XUsedAreaCursor"
+    X_CELL_RANGES_QUERY = "com.sun.star.sheet.XCellRangesQuery"
     X_COLUMN_ROW_RANGE = "com.sun.star.table.XColumnRowRange"
     X_STORABLE = "com.sun.star.frame.XStorable"
     X_SPREADSHEET_DOCUMENT = "com.sun.star.sheet.XSpreadsheetDocument"
@@ -56,6 +61,7 @@ class StructNames:
     SIZE = "com.sun.star.awt.Size"
     CELL_ADDRESS = "com.sun.star.table.CellAddress"
     CELL_RANGE_ADDRESS = "com.sun.star.table.CellRangeAddress"
+    LOCALE = "com.sun.star.lang.Locale"
     RECTANGLE = "com.sun.star.awt.Rectangle"
     TABLE_SORT_FIELD = "com.sun.star.table.TableSortField"
     BAR_CODE = "com.sun.star.drawing.BarCode"
@@ -0,0 +1,9 @@
+import pytest
+
+from excellikeuno.testing import max_uno_calls as _max_uno_calls
+
+
+@pytest.fixture
+def max_uno_calls():
+    """Context manager asserting a UNO call budget: ``with max_uno_calls(5): ...``."""
+    return _max_uno_calls
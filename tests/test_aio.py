@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from excellikeuno import aio
+
+
+class _SlowRange:
+    """Stands in for a SheetCellRange whose bridge calls block until ``gate`` lets them go."""
+
+    def __init__(self, gate=None, events=None):
+        self._value = 0
+        self.threads = set()
+        self.gate = gate
+        self.events = events if events is not None else []
+
+    def _block(self):
+        self.threads.add(threading.current_thread().name)
+        self.events.append("start")
+        if self.gate is not None:
+            self.gate()
+        else:
+            time.sleep(0.01)  # leave room for another call to overlap if it could
+        self.events.append("end")
+
+    @property
+    def value(self):
+        self._block()
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._block()
+        self._value = value
+
+
+def test_calls_run_on_one_bridge_thread_per_office():
+    # Both offices must be inside a call at the same time to pass the barrier, and each
+    # call waits until the event loop has run a task while the calls were blocked.
+    barrier = threading.Barrier(2)
+    loop_ran = threading.Event()
+    waited = []
+
+    def gate():
+        barrier.wait(timeout=5)
+        waited.append(loop_ran.wait(timeout=5))
+
+    async def scenario():
+        offices = [aio.AsyncOffice(desktop=object()), aio.AsyncOffice(desktop=object())]
+        ranges = [aio.AsyncRange(office, _SlowRange(gate)) for office in offices]
+
+        async def mark_loop_running():
+            await asyncio.sleep(0)
+            loop_ran.set()
+
+        await asyncio.gather(mark_loop_running(), *(rng.set_value(5) for rng in ranges))
+        values = await asyncio.gather(*(rng.get_value() for rng in ranges))
+        for office in offices:
+            await office.aclose()
+        return ranges, values
+
+    ranges, values = asyncio.run(scenario())
+    assert values == [5, 5]
+    # Each range only ever saw its own bridge thread, and the two offices overlapped.
+    assert len(ranges[0].sync.threads) == 1
+    assert ranges[0].sync.threads != ranges[1].sync.threads
+    assert waited == [True] * 4
+
+
+def test_calls_on_one_office_are_serialized():
+    async def scenario():
+        office = aio.AsyncOffice(desktop=object())
+        rng = aio.AsyncRange(office, _SlowRange())
+        await asyncio.gather(rng.set_value(1), rng.set_value(2), rng.get_value())
+        await office.aclose()
+        return rng.sync.events
+
+    assert asyncio.run(scenario()) == ["start", "end"] * 3
+
+
+def test_closed_office_rejects_calls():
+    async def scenario():
+        office = aio.AsyncOffice(desktop=object())
+        await office.aclose()
+        with pytest.raises(RuntimeError):
+            await office.run(lambda: None)
+
+    asyncio.run(scenario())
+
+
+def test_connect_calc_reads_and_writes_range():
+    async def scenario():
+        try:
+            office, doc, sheet = await aio.connect_calc()
+        except RuntimeError as exc:
+            await aio.close_all()
+            pytest.skip(f"UNO runtime not available: {exc}")
+        try:
+            rng = await sheet.range("J1:K2")
+            await rng.set_value([[1, 2], [3, 4]])
+            return await rng.get_data()
+        finally:
+            await aio.close_all()
+
+    assert asyncio.run(scenario()) == [[1.0, 2.0], [3.0, 4.0]]
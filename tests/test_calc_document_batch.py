@@ -0,0 +1,42 @@
+import pytest
+
+from excellikeuno.connection import connect_calc
+
+
+def _connect_or_skip():
+    try:
+        return connect_calc()
+    except RuntimeError as exc:
+        pytest.skip(f"UNO runtime not available: {exc}")
+
+
+def test_batch_recalculates_once_and_restores_state():
+    _, doc, sheet = _connect_or_skip()
+    raw = doc.raw
+    auto_before = raw.isAutomaticCalculationEnabled()
+
+    with doc.batch():
+        assert raw.isAutomaticCalculationEnabled() is False
+        assert raw.hasControllersLocked()
+        with doc.batch():
+            sheet.cell("H1").value = 2
+        sheet.cell("H2").value = 3
+        sheet.cell("H3").formula = "=H1*H2"
+
+    assert raw.isAutomaticCalculationEnabled() == auto_before
+    assert not raw.hasControllersLocked()
+    assert sheet.cell("H3").value == 6
+
+
+def test_batch_restores_state_on_error():
+    _, doc, sheet = _connect_or_skip()
+    raw = doc.raw
+    auto_before = raw.isAutomaticCalculationEnabled()
+
+    with pytest.raises(ValueError):
+        with doc.batch():
+            sheet.cell("H4").value = 1
+            raise ValueError("boom")
+
+    assert raw.isAutomaticCalculationEnabled() == auto_before
+    assert not raw.hasControllersLocked()
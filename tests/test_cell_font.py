@@ -108,3 +108,35 @@ def test_font_without_owner_reusable_on_multiple_cells():
         (c1_height, c1_bold), (c2_height, c2_bold) = originals
         c1.font.apply(size=c1_height, bold=c1_bold)
         c2.font.apply(size=c2_height, bold=c2_bold)
+
+
+def test_font_owner_reads_and_writes_in_one_batch():
+    class _BatchProps:
+        def __init__(self):
+            self.values = {"CharHeight": 10.0, "CharWeight": 100.0, "CharColor": 0}
+            self.calls = []
+
+        def get_properties(self, names):
+            self.calls.append("get")
+            return {name: self.values.get(name) for name in names}
+
+        def set_properties(self, values):
+            self.calls.append("set")
+            self.values.update(values)
+            return []
+
+    class _Owner:
+        def __init__(self):
+            self.character_properties = _BatchProps()
+
+    owner = _Owner()
+    Font(owner=owner).apply(bold=True, size=12, color=0xFF0000)
+    assert owner.character_properties.calls == ["set"]
+    assert owner.character_properties.values["CharHeightAsian"] == 12.0
+
+    owner.character_properties.calls.clear()
+    current = Font(owner=owner)._current()
+    assert owner.character_properties.calls == ["get"]
+    assert current["bold"] is True
+    assert current["size"] == 12.0
+    assert current["color"] == 0xFF0000
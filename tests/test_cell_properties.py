@@ -48,6 +48,15 @@ def test_cellproperties_attribute_passthrough():
         cell.props.IsTextWrapped = original_wrap
 
 
+def test_cellproperties_unknown_name_raises_attribute_error():
+    _, _, sheet = _connect_or_skip()
+    cell = sheet.cell(2, 2)
+    with pytest.raises(AttributeError):
+        cell.props.NoSuchCellProperty
+    # the shared property info still resolves real names afterwards
+    assert "CellBackColor" in cell._property_set_info()
+    assert sheet.cell(3, 2).props.CellBackColor == sheet.cell(3, 2).CellBackColor
+
 def test_cell_topborder_roundtrip():
     _, _, sheet = _connect_or_skip()
     cell = sheet.cell(3, 2)
@@ -112,3 +121,53 @@ def test_cell_vertjustify_enum_roundtrip():
         assert cell.VertJustify == new_value
     finally:
         cell.VertJustify = original
+
+
+def test_cell_props_use_handles_and_fall_back_to_names_offline(monkeypatch):
+    from excellikeuno.core import properties
+    from excellikeuno.testing import fake_calc
+
+    monkeypatch.setattr(properties, "_PROPERTY_INFO", {})
+    office, doc, sheet = fake_calc()
+    cell = sheet.cell(0, 0)
+    cell.props.CharHeight = 14.0
+    office.latency.reset()
+
+    assert sheet.cell(1, 0).props.CharHeight == 10.0
+    assert cell.props.CharHeight == 14.0
+    assert office.latency.by_method["getFastPropertyValue"] == 2
+    assert "getPropertyValue" not in office.latency.by_method
+    assert "getPropertySetInfo" not in office.latency.by_method  # fetched once, before reset
+
+    # names missing from the shared snapshot still reach the object by name
+    assert "CharKerning" not in cell._property_set_info()
+    cell.props.CharKerning = 50
+    assert cell.props.CharKerning == 50
+    assert office.latency.by_method["setPropertyValue"] == 1
+    assert office.latency.by_method["getPropertyValue"] == 1
+    with pytest.raises(AttributeError):
+        cell.props.NoSuchCellProperty
+
+    rng = sheet.range("A1:B2")
+    office.latency.reset()
+    assert rng.props.set_properties({"CharWeight": 150.0, "CharKerning": 30}) == []
+    assert rng.props.get_properties(["CharKerning", "CharWeight"]) == {"CharKerning": 30, "CharWeight": 150.0}
+    assert office.latency.by_method["setPropertyValues"] == 1
+    assert office.latency.by_method["getPropertyValues"] == 1
+    assert sheet.cell(1, 1).CharWeight == 150.0
+
+
+def test_missing_property_set_info_is_cached(monkeypatch):
+    from excellikeuno.core import properties
+
+    class NoInfo:
+        calls = 0
+
+        def getPropertySetInfo(self):  # noqa: N802 - UNO naming
+            NoInfo.calls += 1
+            raise RuntimeError("no XPropertySetInfo")
+
+    monkeypatch.setattr(properties, "_PROPERTY_INFO", {})
+    assert properties.property_set_info(NoInfo(), "test.Service") is None
+    assert properties.property_set_info(NoInfo(), "test.Service") is None
+    assert NoInfo.calls == 1
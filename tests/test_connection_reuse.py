@@ -0,0 +1,92 @@
+import pytest
+
+from excellikeuno.connection import bootstrap
+from excellikeuno.testing import FakeOffice, FakeUnoException
+from excellikeuno.testing.fake_uno import FakeDesktop
+
+
+class _Desktop:
+    def __init__(self):
+        self.alive = True
+
+    def getImplementationName(self):
+        if not self.alive:
+            raise RuntimeError("bridge disposed")
+        return "com.sun.star.comp.framework.Desktop"
+
+
+def test_shared_desktop_is_reused_until_bridge_dies(monkeypatch):
+    created = []
+
+    def fake_bootstrap(settings=None):
+        desktop = _Desktop()
+        created.append(desktop)
+        return desktop
+
+    monkeypatch.setattr(bootstrap, "_bootstrap_desktop", fake_bootstrap)
+    monkeypatch.setattr(bootstrap, "current_desktop", None)
+    monkeypatch.setattr(bootstrap, "ALIVE_CHECK_INTERVAL", 0.0)
+
+    first = bootstrap._shared_desktop()
+    assert bootstrap._shared_desktop() is first
+    assert len(created) == 1
+
+    first.alive = False
+    second = bootstrap._shared_desktop()
+    assert second is not first
+    assert bootstrap.current_desktop is second
+    assert len(created) == 2
+
+
+class _OfficeDesktop(FakeDesktop):
+    """Fake desktop whose bridge is disposed once the office terminates."""
+
+    def getImplementationName(self):
+        if self.terminated:
+            raise FakeUnoException("DisposedException: bridge disposed")
+        return super().getImplementationName()
+
+    def loadComponentFromURL(self, *args):
+        if self.terminated:
+            raise FakeUnoException("DisposedException: bridge disposed")
+        return super().loadComponentFromURL(*args)
+
+
+def _fake_offices(monkeypatch):
+    created = []
+
+    def fake_bootstrap(settings=None):
+        desktop = _OfficeDesktop(FakeOffice())
+        created.append(desktop)
+        return desktop
+
+    monkeypatch.setattr(bootstrap, "_bootstrap_desktop", fake_bootstrap)
+    monkeypatch.setattr(bootstrap, "_make_properties", lambda options: ())
+    monkeypatch.setattr(bootstrap, "current_desktop", None)
+    monkeypatch.setattr(bootstrap, "current_settings", None)
+    monkeypatch.setattr(bootstrap, "_alive_checked", (None, 0.0))
+    monkeypatch.setattr(bootstrap, "ALIVE_CHECK_INTERVAL", 60.0)
+    return created
+
+
+def test_new_document_reconnects_when_office_died_within_check_interval(monkeypatch):
+    created = _fake_offices(monkeypatch)
+
+    first, _, _ = bootstrap.new_calc_document()
+    first.terminate()  # the office exits while its last health check is still trusted
+    desktop, doc, sheet = bootstrap.new_calc_document()
+
+    assert desktop is not first
+    assert bootstrap.current_desktop is desktop
+    assert len(created) == 2
+    sheet.cell(0, 0).value = 1
+    assert sheet.cell(0, 0).value == 1.0
+
+
+def test_load_error_on_a_live_office_is_not_retried(monkeypatch):
+    created = _fake_offices(monkeypatch)
+
+    with pytest.raises(FakeUnoException):
+        bootstrap._load_on_shared_desktop(None, "file:///missing.ods", {})
+    assert len(created) == 1
+    assert bootstrap.current_desktop is created[0]
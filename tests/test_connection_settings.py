@@ -0,0 +1,32 @@
+import pytest
+
+from excellikeuno.connection import ConnectionSettings
+
+
+def test_default_settings_match_classic_socket_url():
+    settings = ConnectionSettings()
+    assert settings.to_uno_url() == "uno:socket,host=localhost,port=2002;urp;StarOffice.ComponentContext"
+
+
+def test_pipe_settings_build_url_and_accept_argument():
+    settings = ConnectionSettings.pipe("worker1")
+    assert settings.to_uno_url() == "uno:pipe,name=worker1;urp;StarOffice.ComponentContext"
+    assert settings.accept_argument() == "pipe,name=worker1;urp;StarOffice.ComponentContext"
+
+
+def test_settings_from_env():
+    env = {
+        "EXCELLIKEUNO_TRANSPORT": "PIPE",
+        "EXCELLIKEUNO_PIPE_NAME": "calc",
+        "EXCELLIKEUNO_TIMEOUT": "5",
+    }
+    settings = ConnectionSettings.from_env(env)
+    assert settings == ConnectionSettings(transport="pipe", pipe_name="calc", timeout=5.0)
+    assert ConnectionSettings.in_env(env)
+    assert not ConnectionSettings.in_env({})
+    assert ConnectionSettings.from_env({"EXCELLIKEUNO_PORT": "2003"}).port == 2003
+
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError):
+        ConnectionSettings(transport="http")
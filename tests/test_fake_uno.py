@@ -0,0 +1,97 @@
+import pytest
+
+from excellikeuno.core.calc_document import CalcDocument
+from excellikeuno.style.border import Borders
+from excellikeuno.testing import FakeUnoException, LatencyModel, fake_calc
+from excellikeuno.typing.structs import BorderLine2
+
+
+def test_range_values_round_trip():
+    office, doc, sheet = fake_calc()
+    rng = sheet.range("A1:C2")
+    rng.value = [[1, 2, "x"], [3, "=A1+1", 4.5]]
+
+    assert rng.value == [["1", "2", "x"], ["3", "=A1+1", "4.5"]]
+    assert rng.data == [[1.0, 2.0, "x"], [3.0, 0.0, 4.5]]
+    assert sheet.cell(2, 0).text == "x"
+    with pytest.raises(FakeUnoException):
+        sheet.range("A1:B2").raw.setDataArray(((1,),))
+
+
+def test_latency_model_counts_round_trips():
+    office, doc, sheet = fake_calc(LatencyModel(per_call=0.001, per_item=0.0001))
+    rng = sheet.range("A1:J10")
+    office.latency.reset()
+    rng.value = [[c for c in range(10)] for _ in range(10)]
+
+    assert office.latency.by_method["setDataArray"] == 1
+    assert office.latency.items == 100
+    assert office.latency.elapsed == pytest.approx(office.latency.calls * 0.001 + 100 * 0.0001)
+
+
+def test_broadcasts_reach_every_cell():
+    office, doc, sheet = fake_calc()
+    rng = sheet.range("A1:C3")
+    rng.borders = Borders(all=BorderLine2(Color=0xFF, LineWidth=50))
+    rng.backcolor = 0xFF0000
+    rng.font.bold = True
+
+    center = sheet.cell(1, 1)
+    assert center.raw.TopBorder.Color == 0xFF
+    assert sheet.cell(2, 2).raw.RightBorder.LineWidth == 50
+    assert center.backcolor == 0xFF0000
+    assert center.font.bold is True
+    assert sheet.cell(3, 3).backcolor == -1
+
+
+def test_shapes_charts_and_sheets():
+    office, doc, sheet = fake_calc()
+    sheet.shapes.add_rectangle_shape(100, 200, 300, 400, fill_color=0xFF)
+    sheet.shapes.add_text_shape(0, 0, 10, 10, text="hi")
+    shapes = sheet.shapes()
+    assert [type(shape).__name__ for shape in shapes] == ["RectangleShape", "TextShape"]
+    assert (shapes[0].Position.X, shapes[0].Size.Height) == (100, 400)
+    assert shapes[1].String == "hi"
+
+    sheet.range("A1:B3").value = [["k", "v"], ["a", 1], ["b", 2]]
+    chart = sheet.charts.add_bar_diagram("c1", sheet.range("A1:B3"))
+    assert chart.name == "c1"
+    pivot = sheet.pivot_tables.add("p1", sheet.range("A1:B3"), sheet.cell(4, 0), row_fields=["k"], data_fields=["v"])
+    assert pivot.name == "p1"
+
+    doc.add_sheet("Two")
+    assert doc.sheet_names == ["Sheet1", "Two"]
+
+
+def test_group_and_connector_shapes():
+    office, doc, sheet = fake_calc()
+    start = sheet.shapes.add_rectangle_shape(0, 0, 100, 100)
+    end = sheet.shapes.add_rectangle_shape(500, 0, 100, 100)
+
+    group = sheet.shapes.add_group_shape([start, end])
+    assert type(group).__name__ == "GroupShape"
+    assert group.raw.getCount() == 2
+
+    connector = sheet.shapes.add_connector_shape(start, end, line_color=0xFF, line_width=50)
+    assert type(connector).__name__ == "ConnectorShape"
+    assert connector.raw.StartShape is start.raw
+    assert connector.raw.EndShape is end.raw
+    assert (connector.LineColor, connector.LineWidth) == (0xFF, 50)
+
+
+def test_stored_documents_can_be_reloaded():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1").value = 42
+    doc.raw.storeAsURL("file:///tmp/book.ods", ())
+    sheet.range("A1").value = 0
+
+    loaded = office.desktop.loadComponentFromURL("file:///tmp/book.ods", "_blank", 0, ())
+    assert CalcDocument(loaded).sheet(0).cell(0, 0).value == 42.0
+
+
+def test_budget_applies_to_the_fake(max_uno_calls):
+    office, doc, sheet = fake_calc()
+    rng = sheet.range("A1:T10")
+    with max_uno_calls(5):
+        rng.value = [[float(c) for c in range(20)] for _ in range(10)]
+        rng.read(typed=True)
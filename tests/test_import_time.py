@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import excellikeuno
+
+# Subpackages and stdlib modules that macro-mode start-up (import +
+# connect_calc_script lookup) must not load.
+HEAVY_MODULES = (
+    "excellikeuno.drawing",
+    "excellikeuno.chart",
+    "excellikeuno.table.pivot_table",
+    "excellikeuno.connection.pool",
+    "excellikeuno.connection.pushdown",
+    "excellikeuno.core.recording",
+    "subprocess",
+    "hashlib",
+)
+
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(excellikeuno.__file__)))
+
+
+def _fresh_import(code):
+    """Run ``code`` in a new interpreter; return the excellikeuno (and heavy stdlib) modules it loaded."""
+
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        "modules = sorted(m for m in sys.modules if m.split('.')[0] in ('excellikeuno', 'subprocess', 'hashlib'))\n"
+        "print(json.dumps(modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=_SRC)
+    out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    return set(json.loads(out.stdout.strip().splitlines()[-1]))
+
+
+def test_package_import_is_lazy():
+    modules = _fresh_import("import excellikeuno")
+    assert modules == {"excellikeuno"}
+
+
+def test_macro_path_skips_shapes_charts_and_pools():
+    code = "import excellikeuno\nexcellikeuno.connect_calc_script\nexcellikeuno.SheetCell"
+    modules = _fresh_import(code)
+    assert "excellikeuno.connection.bootstrap" in modules
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules
+
+
+def test_lazy_names_resolve():
+    from excellikeuno.connection import OfficePool
+    from excellikeuno.sheet.spreadsheet import Shapes
+    from excellikeuno.typing import BorderLine2, Font
+
+    assert excellikeuno.RectangleShape.__name__ == "RectangleShape"
+    assert excellikeuno.PivotTables.__name__ == "PivotTables"
+    assert {OfficePool.__name__, Shapes.__name__, BorderLine2.__name__, Font.__name__} == {
+        "OfficePool", "Shapes", "BorderLine2", "Font"
+    }
+    assert set(excellikeuno.__all__) <= set(dir(excellikeuno))
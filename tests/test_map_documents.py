@@ -0,0 +1,106 @@
+import threading
+from contextlib import contextmanager
+
+from excellikeuno.connection import map_documents
+
+
+class _Doc:
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+
+    def close(self, deliver_ownership=True):
+        self.closed = True
+
+
+class _Worker:
+    def __init__(self):
+        self.alive = True
+        self.opened = []
+
+    def open_document(self, path, **options):
+        doc = _Doc(path)
+        self.opened.append(doc)
+        return doc
+
+    def is_alive(self):
+        return self.alive
+
+    def kill(self):
+        self.alive = False
+
+
+class _Pool:
+    size = 2
+
+    def __init__(self):
+        self.workers = [_Worker(), _Worker()]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def start(self):
+        return self
+
+    @contextmanager
+    def worker(self, timeout=None):
+        with self._lock:
+            worker = self.workers[self._next % len(self.workers)]
+            self._next += 1
+        if not worker.alive:
+            worker.alive = True  # restarted by the real pool
+        yield worker
+
+    def all_docs(self):
+        return [doc for worker in self.workers for doc in worker.opened]
+
+
+def test_map_documents_streams_results_and_closes_documents():
+    pool = _Pool()
+    results = list(map_documents(lambda doc, path: path.upper(), ["a.ods", "b.ods", "c.ods"], pool=pool))
+
+    assert sorted(r.value for r in results) == ["A.ODS", "B.ODS", "C.ODS"]
+    assert all(r.ok and r.attempts == 1 for r in results)
+    assert all(doc.closed for doc in pool.all_docs())
+
+
+def test_map_documents_reports_func_errors_without_retry():
+    pool = _Pool()
+
+    def boom(doc, path):
+        raise ValueError(path)
+
+    (result,) = map_documents(boom, ["x.ods"], pool=pool, retries=3)
+    assert not result.ok
+    assert isinstance(result.error, ValueError)
+    assert result.attempts == 1
+
+
+def test_map_documents_retries_when_the_office_dies():
+    pool = _Pool()
+    calls = []
+
+    def flaky(doc, path):
+        calls.append(path)
+        if len(calls) == 1:
+            pool.workers[0].alive = False
+            raise RuntimeError("bridge disposed")
+        return "done"
+
+    (result,) = map_documents(flaky, ["y.ods"], pool=pool, retries=1)
+    assert result.ok and result.value == "done"
+    assert result.attempts == 2
+
+
+def test_map_documents_times_out_hung_jobs():
+    pool = _Pool()
+    killed = threading.Event()
+    for worker in pool.workers:
+        worker.kill = killed.set  # killing the office unblocks the pending bridge call
+
+    def hang(doc, path):
+        killed.wait(5)
+        raise RuntimeError("bridge disposed")
+
+    (result,) = map_documents(hang, ["z.ods"], pool=pool, timeout=0.05, retries=0)
+    assert killed.is_set()
+    assert isinstance(result.error, TimeoutError)
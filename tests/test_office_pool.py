@@ -0,0 +1,74 @@
+import pytest
+
+from excellikeuno.connection import OfficePool
+
+
+class _FakeWorker:
+    def __init__(self, index):
+        self.index = index
+        self.jobs = 0
+        self.alive = True
+        self.memory = 0
+        self.restarts = 0
+        self.stopped = False
+
+    def launch(self):
+        pass
+
+    def start(self):
+        self.jobs = 0
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def memory_kb(self):
+        return self.memory
+
+    def restart(self):
+        self.restarts += 1
+        self.start()
+
+    def stop(self):
+        self.stopped = True
+
+    def remove_profile(self):
+        pass
+
+
+def _pool(**kwargs):
+    pool = OfficePool(size=1, **kwargs)
+    pool.workers = [_FakeWorker(0)]
+    return pool
+
+
+def test_pool_restarts_worker_after_job_limit():
+    with _pool(max_jobs=2) as pool:
+        for _ in range(5):
+            with pool.worker() as worker:
+                pass
+        # restarted before the 3rd and 5th leases
+        assert worker.restarts == 2
+    assert worker.stopped
+
+
+def test_pool_restarts_dead_or_bloated_worker():
+    with _pool(max_memory_mb=100) as pool:
+        with pool.worker() as worker:
+            worker.alive = False
+        with pool.worker():
+            pass
+        assert worker.restarts == 1
+
+        worker.memory = 200 * 1024
+        with pool.worker():
+            pass
+        assert worker.restarts == 2
+
+
+def test_pool_lease_times_out_when_all_workers_busy():
+    with _pool() as pool:
+        with pool.worker():
+            with pytest.raises(TimeoutError):
+                with pool.worker(timeout=0.01):
+                    pass
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from excellikeuno.connection import PushdownError, ScriptPushdown, connect_calc, run_in_office
+from excellikeuno.connection.pushdown import ENTRY_POINT, _module_source
+
+
+def _connect_or_skip():
+    try:
+        return connect_calc()
+    except RuntimeError as exc:
+        pytest.skip(f"UNO runtime not available: {exc}")
+
+
+def fill_column(doc, column, rows):
+    sheet = doc.sheet(0)
+    for row in range(rows):
+        sheet.cell(column, row).value = row + 1
+    return sum(sheet.cell(column, row).value for row in range(rows))
+
+
+def fails(doc):
+    raise ValueError("boom")
+
+
+def test_module_source_runs_registered_function():
+    namespace = {}
+    exec(_module_source([fill_column, fails]), namespace)
+    assert namespace["g_exportedScripts"] == (namespace[ENTRY_POINT],)
+    assert "def fill_column(doc, column, rows):" in _module_source([fill_column])
+
+    response = json.loads(namespace[ENTRY_POINT](object(), json.dumps({"func": "fails", "args": [], "kwargs": {}})))
+    assert response["ok"] is False
+    assert response["type"] == "ValueError"
+    assert "boom" in response["traceback"]
+
+
+def test_register_rejects_closures_and_lambdas():
+    offset = 1
+
+    def closure(doc):
+        return offset
+
+    pushdown = ScriptPushdown(object())
+    with pytest.raises(ValueError):
+        pushdown.register(closure)
+    with pytest.raises(ValueError):
+        pushdown.register(lambda doc: 1)
+
+
+def test_run_in_office_returns_result_in_one_call():
+    _, doc, _ = _connect_or_skip()
+    assert run_in_office(doc, fill_column, 9, 100) == sum(range(1, 101))
+    assert doc.sheet(0).cell(9, 99).value == 100
+
+
+def test_run_in_office_raises_remote_error():
+    _, doc, _ = _connect_or_skip()
+    with pytest.raises(PushdownError) as info:
+        run_in_office(doc, fails)
+    assert info.value.type_name == "ValueError"
+
+
+def test_pushdown_uses_the_context_of_the_documents_office(monkeypatch):
+    from excellikeuno.connection import bootstrap
+    from excellikeuno.core.calc_document import CalcDocument
+
+    worker_ctx, global_ctx, explicit_ctx = object(), object(), object()
+    monkeypatch.setattr(bootstrap, "current_context", global_ctx)
+    doc = CalcDocument(object(), context=worker_ctx)
+
+    assert ScriptPushdown(doc)._context() is worker_ctx
+    assert ScriptPushdown(doc, context=explicit_ctx)._context() is explicit_ctx
+    assert ScriptPushdown(CalcDocument(object()))._context() is global_ctx
+
+    seen = {}
+
+    def fake_call(self, func, *args, **kwargs):
+        seen.update(context=self._context(), args=args, kwargs=kwargs)
+        return "done"
+
+    monkeypatch.setattr(ScriptPushdown, "call", fake_call)
+    assert run_in_office(doc, fill_column, 1, rows=5, context=explicit_ctx) == "done"
+    assert seen == {"context": explicit_ctx, "args": (1,), "kwargs": {"rows": 5}}
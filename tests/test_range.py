@@ -46,3 +46,19 @@ def test_range_a1_notation():
 
     sub = sheet.range("A1", "B2")
     assert sub.cell(1, 1).text == "center"
+
+
+def test_range_backcolor_applies_to_every_cell():
+    _, doc, sheet = _connect_or_skip()
+    rng = sheet.range("E20:F21")
+    cells = [rng.cell(0, 0), rng.cell(1, 0), rng.cell(0, 1), rng.cell(1, 1)]
+    originals = [c.backcolor for c in cells]
+
+    try:
+        rng.backcolor = 0x336699
+        for cell in cells:
+            assert cell.backcolor == 0x336699
+        assert rng.backcolor == 0x336699
+    finally:
+        for cell, color in zip(cells, originals):
+            cell.backcolor = color
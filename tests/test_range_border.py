@@ -292,4 +292,43 @@ def test_range_borders_inner():
             cell.TopBorder = top
             cell.BottomBorder = bottom
             cell.LeftBorder = left
-            cell.RightBorder = right
\ No newline at end of file
+            cell.RightBorder = right
+
+# 外枠と内枠を同時に引く場合
+def test_range_borders_around_and_inner_together():
+    _, _, sheet = _connect_or_skip()
+    rng = sheet.range("F2:G3")
+
+    cells = [rng.cell(0, 0), rng.cell(1, 0), rng.cell(0, 1), rng.cell(1, 1)]
+    originals = [
+        (c.borders.top, c.borders.bottom, c.borders.left, c.borders.right) for c in cells
+    ]
+
+    outer = BorderStyle(color=0x000000, weight=40, line_style=BorderLineStyle.SOLID)
+    inner = BorderStyle(color=0x00FF00, weight=20, line_style=BorderLineStyle.SOLID)
+
+    try:
+        rng.borders = Borders(around=outer, inner=inner)
+
+        assert rng.cell(0, 0).borders.top.color == 0x000000
+        assert rng.cell(0, 0).borders.right.color == 0x00FF00
+        assert rng.cell(1, 1).borders.bottom.color == 0x000000
+        assert rng.cell(1, 1).borders.left.color == 0x00FF00
+    finally:
+        for cell, (top, bottom, left, right) in zip(cells, originals):
+            cell.borders.top = top
+            cell.borders.bottom = bottom
+            cell.borders.left = left
+            cell.borders.right = right
+
+
+def test_range_border_broadcast_stays_within_call_budget(max_uno_calls):
+    _, _, sheet = _connect_or_skip()
+    rng = sheet.range(0, 40, 9, 49)  # 10x10 block
+    line = BorderLine(Color=0x123456, OuterLineWidth=36)
+
+    # One TableBorder2 assignment for the whole range, not one per cell.
+    with max_uno_calls(10):
+        rng.borders = Borders(all=line)
+
+    assert getattr(rng.cell(9, 9).borders.bottom, "Color", None) == line.Color
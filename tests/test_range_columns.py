@@ -0,0 +1,56 @@
+import math
+from array import array
+from datetime import date, datetime
+
+from excellikeuno.testing import fake_calc
+from excellikeuno.testing.fake_uno import FakeDate
+
+
+def _table(sheet):
+    sheet.range("A1:D4").value = [
+        ["id", "name", "score", "day"],
+        [1, "a", 1.5, 45292],
+        [2, "", None, 45293.5],
+        [3, "c", 3, 45294],
+    ]
+
+
+def test_read_columns_types_each_column_once():
+    office, doc, sheet = fake_calc()
+    _table(sheet)
+    office.latency.reset()
+
+    cols = sheet.range("A1:D4").read_columns()
+
+    assert list(cols) == ["id", "name", "score", "day"]
+    assert isinstance(cols["id"], array) and cols["id"].tolist() == [1.0, 2.0, 3.0]
+    assert cols["name"] == ["a", None, "c"]
+    assert cols["score"][0] == 1.5 and math.isnan(cols["score"][1])
+    assert isinstance(cols["day"], array)
+    assert office.latency.by_method["getDataArray"] == 1
+
+
+def test_read_columns_converts_date_columns():
+    office, doc, sheet = fake_calc()
+    _table(sheet)
+    sheet.range("D2:D4").NumberFormat = 51  # YYYY-MM-DD HH:MM:SS
+
+    cols = sheet.range("A1:D4").read_columns()
+    assert cols["day"] == [datetime(2024, 1, 1), datetime(2024, 1, 2, 12), datetime(2024, 1, 3)]
+
+    sheet.range("D2:D4").NumberFormat = 37  # YYYY-MM-DD
+    assert sheet.range("D2:D4").read_columns(header=False)["D"] == [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+    assert sheet.range("D2:D4").read_columns(header=False, dates=False)["D"].tolist() == [45292.0, 45293.5, 45294.0]
+
+    doc.raw.NullDate = FakeDate(1904, 1, 1)
+    doc.refresh_number_formats()
+    assert sheet.range("D2:D2").read_columns(header=False)["D"] == [date(2028, 1, 2)]
+
+
+def test_read_columns_without_header_uses_column_letters():
+    office, doc, sheet = fake_calc()
+    sheet.range("AA5:AB6").value = [[1, "x"], [2, ""]]
+
+    cols = sheet.range("AA5:AB6").read_columns(header=False)
+    assert cols["AA"].tolist() == [1.0, 2.0]
+    assert cols["AB"] == ["x", None]
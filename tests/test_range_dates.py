@@ -0,0 +1,69 @@
+from datetime import date, datetime, timezone
+
+from excellikeuno.sheet import SheetCellRange
+from excellikeuno.testing import fake_calc
+
+
+def test_write_dates_as_serials_with_date_formats():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:C3").value = [
+        ["day", "at", "n"],
+        [date(2024, 1, 1), datetime(2024, 1, 2, 12), 1],
+        [date(2024, 1, 3), datetime(2024, 1, 3, 6, tzinfo=timezone.utc), 2],
+    ]
+
+    assert sheet.range("A2:C3").data == [[45292.0, 45293.5, 1.0], [45294.0, 45294.25, 2.0]]
+    assert sheet.range("A2:A3").NumberFormat == 36  # standard date
+    assert sheet.range("B2:B3").NumberFormat == 50  # standard date + time
+    assert sheet.range("C2:C3").NumberFormat == 0
+
+    rows = sheet.range("A1:C3").read(typed=True, dates=True)
+    assert rows[0] == ["day", "at", "n"]
+    assert rows[1] == [date(2024, 1, 1), datetime(2024, 1, 2, 12), 1.0]
+    assert rows[2][1] == datetime(2024, 1, 3, 6)
+
+
+def test_write_keeps_existing_date_format_and_formulas():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:A2").NumberFormat = 37  # YYYY-MM-DD
+    sheet.range("A1:B2").value = [[date(2024, 1, 1), "=A1+1"], [None, "=A1+2"]]
+
+    assert sheet.range("A1:A2").NumberFormat == 37
+    assert sheet.range("A1:B2").value == [["45292", "=A1+1"], ["", "=A1+2"]]
+
+
+def test_date_lookups_are_cached_per_document():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:B3").value = [["d", "x"], [date(2024, 1, 1), 1], [date(2024, 1, 2), 2]]
+    doc.refresh_number_formats()
+    office.latency.reset()
+
+    for _ in range(3):
+        cols = sheet.range("A1:B3").read_columns()
+    assert cols["d"] == [date(2024, 1, 1), date(2024, 1, 2)]
+    assert cols["x"].tolist() == [1.0, 2.0]
+    assert office.latency.by_method["queryContentCells"] == 3
+    assert office.latency.by_method["getByKey"] == 1
+    # one NullDate read; the rest are the NumberFormat key of column d
+    assert office.latency.by_method["getPropertyValue"] == 1 + 3
+
+
+def test_ranges_without_document_use_default_null_date():
+    office, doc, sheet = fake_calc()
+    rng = SheetCellRange(sheet.range("A1:B1").raw)
+    rng.value = [date(1900, 1, 1), datetime(1899, 12, 31, 18)]
+
+    assert rng.data == [[2.0, 1.75]]
+    assert rng.read(typed=True, dates=True) == [[2.0, 1.75]]
+
+
+def test_ranges_without_document_skip_the_date_query():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:B2").value = [["d", "x"], [date(2024, 1, 1), 1]]
+    rng = SheetCellRange(sheet.range("A1:B2").raw)
+    office.latency.reset()
+
+    assert rng.read_columns()["d"].tolist() == [45292.0]
+    assert rng.read(typed=True, dates=True) == [["d", "x"], [45292.0, 1.0]]
+    assert "queryContentCells" not in office.latency.by_method
+    assert "queryInterface" not in office.latency.by_method
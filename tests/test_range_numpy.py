@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from excellikeuno.testing import fake_calc
+
+np = pytest.importorskip("numpy")
+
+
+def test_to_numpy_numeric_block():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:C2").value = [[1, 2, 3], [4, 5, 6.5]]
+    office.latency.reset()
+
+    arr = sheet.range("A1:C2").to_numpy()
+
+    assert arr.dtype == np.float64 and arr.shape == (2, 3)
+    assert arr.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.5]]
+    assert office.latency.by_method["getDataArray"] == 1
+
+
+def test_to_numpy_mixed_block_uses_empty():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:C2").data = [[1, "", "x"], [None, 5, "12"]]
+    rng = sheet.range("A1:C2")
+
+    arr = rng.to_numpy()
+    assert arr[0, 0] == 1.0 and arr[1, 1] == 5.0
+    assert all(math.isnan(v) for v in (arr[0, 1], arr[0, 2], arr[1, 0]))
+
+    assert rng.to_numpy(dtype=int, empty=-1).tolist() == [[1, -1, -1], [-1, 5, -1]]
+    assert rng.to_numpy(dtype=object, empty=None).tolist() == [[1.0, None, "x"], [None, 5.0, "12"]]
+
+
+def test_from_numpy_and_write_array():
+    office, doc, sheet = fake_calc()
+    office.latency.reset()
+    rng = sheet.write_array(np.array([[1.5, np.nan], [3, 4]]), at="B2")
+
+    assert office.latency.by_method["setDataArray"] == 1
+    assert "setFormulaArray" not in office.latency.by_method
+    assert sheet.range("B2:C3").data == [[1.5, ""], [3.0, 4.0]]
+    assert rng.to_numpy()[1].tolist() == [3.0, 4.0]
+
+    sheet.range("A1:C1").from_numpy(np.array(["a", "=B2*2", None], dtype=object))
+    assert sheet.range("A1:C1").value == [["a", "=B2*2", ""]]
+    with pytest.raises(ValueError):
+        sheet.range("A1:B2").from_numpy(np.zeros((3, 3)))
@@ -59,3 +59,91 @@ def test_range_value_row_roundtrip():
                 rng.cell(c, r).formula = formula
             except Exception:
                 pass
+
+
+def test_range_read_typed_and_formula():
+    _, __, sheet = _connect_or_skip()
+    rng = sheet.range(0, 12, 2, 12)  # 1x3 block
+
+    coords = [(0, 0), (1, 0), (2, 0)]
+    originals = [rng.cell(c, r).formula for c, r in coords]
+
+    try:
+        rng.cell(0, 0).value = 3.5
+        rng.cell(1, 0).text = "gamma"
+        rng.cell(2, 0).formula = "=A13*2"
+
+        assert rng.read(typed=True) == [[3.5, "gamma", 7.0]]
+        assert rng.data == [[3.5, "gamma", 7.0]]
+        assert rng.read() == [["3.5", "gamma", "=A13*2"]]
+        assert rng.formula == rng.value
+    finally:
+        for (c, r), formula in zip(coords, originals):
+            try:
+                rng.cell(c, r).formula = formula
+            except Exception:
+                pass
+
+
+def test_range_write_keeps_numbers_and_formulas():
+    _, __, sheet = _connect_or_skip()
+    rng = sheet.range(0, 14, 2, 15)  # 2x3 block
+
+    originals = rng.formula
+
+    try:
+        rng.value = [[1.5, "delta", "=A15*2"], [4]]
+
+        assert rng.data == [[1.5, "delta", 3.0], [4.0, "", ""]]
+        assert rng.formula[0][2] == "=A15*2"
+        assert rng.cell(0, 0).value == 1.5
+    finally:
+        try:
+            rng.formula = originals
+        except Exception:
+            pass
+
+
+def test_range_value_write_stays_within_call_budget(max_uno_calls):
+    _, __, sheet = _connect_or_skip()
+    rng = sheet.range(0, 20, 9, 39)  # 10x20 block
+    matrix = [[r * 10 + c for c in range(10)] for r in range(20)]
+
+    # A bulk write is a handful of calls; a per-cell loop would be hundreds.
+    with max_uno_calls(5):
+        rng.value = matrix
+    with max_uno_calls(5):
+        assert rng.read(typed=True)[19][9] == 199.0
+
+    rng.value = [[None] * 10 for _ in range(20)]
+
+
+def test_range_write_keeps_text_between_formulas_as_text():
+    from excellikeuno.testing import fake_calc
+
+    office, doc, sheet = fake_calc()
+    office.latency.reset()
+    sheet.range("A1:D2").data = [["=1+1", "00123", "TRUE", "=2+2"], ["=3+3", "1/2", 5, "=4+4"]]
+
+    assert sheet.range("A1:D2").data == [[0.0, "00123", "TRUE", 0.0], [0.0, "1/2", 5.0, 0.0]]
+    assert sheet.range("A1:D2").formula == [["=1+1", "00123", "TRUE", "=2+2"], ["=3+3", "1/2", "5", "=4+4"]]
+    # one data array plus one formula array per formula column
+    assert office.latency.by_method["setDataArray"] == 1
+    assert office.latency.by_method["setFormulaArray"] == 2
+
+
+def test_range_value_copy_keeps_numbers_numeric():
+    from excellikeuno.testing import fake_calc
+
+    office, doc, sheet = fake_calc()
+    source = sheet.range("A1:C2")
+    source.value = [[1.25, "alpha", "=A1*2"], [2, "00123", None]]
+    target = sheet.range("E1:G2")
+    office.latency.reset()
+    target.value = source.value
+
+    assert target.data == [[1.25, "alpha", 0.0], [2.0, 123.0, ""]]
+    assert target.formula == source.formula
+    # formula text only: one setFormulaArray, no setDataArray
+    assert office.latency.by_method["setFormulaArray"] == 1
+    assert "setDataArray" not in office.latency.by_method
@@ -0,0 +1,73 @@
+import gzip
+import json
+
+import pytest
+
+from excellikeuno.core.recording import Recorder, ReplayError, Replayer
+from excellikeuno.testing import fake_calc
+
+
+def _job(sheet):
+    sheet.range("A1:J10").value = [[float(r * 10 + c) for c in range(10)] for r in range(10)]
+    sheet.range("B2").value = 7
+    sheet.range("A1:C3").font.bold = True
+    sheet.name = "Data"
+
+
+def _events(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_record_and_replay_on_another_document(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    office, doc, sheet = fake_calc()
+    with Recorder(path) as recorder:
+        _job(sheet)
+
+    events = _events(path)
+    assert events[0]["format"] == "excellikeuno-uno-trace"
+    assert sum("m" in event for event in events) == recorder.calls
+    bulk = next(event for event in events if event.get("m") == "setDataArray")
+    assert bulk["a"] == [{"$shape": [10, 10], "$kind": "n"}]
+
+    other_office, other_doc, other_sheet = fake_calc()
+    other_office.latency.reset()
+    report = Replayer(path, document=other_doc).run()
+
+    assert report.mismatches == []
+    assert report.calls == recorder.calls
+    assert other_sheet.name == "Data"
+    assert other_sheet.cell(1, 1).value == 7.0
+    assert other_sheet.cell(0, 0).font.bold is True
+    assert other_office.latency.by_method["setDataArray"] == 2
+    assert "setDataArray" in report.format_summary()
+
+
+def test_capture_values_and_gzip(tmp_path):
+    path = str(tmp_path / "job.jsonl.gz")
+    office, doc, sheet = fake_calc()
+    with Recorder(path, capture_values=True):
+        sheet.range("A1:J10").value = [[float(c) for c in range(10)] for _ in range(10)]
+
+    bulk = next(event for event in _events(path) if event.get("m") == "setDataArray")
+    assert bulk["a"][0][9] == list(map(float, range(10)))
+
+    other_office, other_doc, other_sheet = fake_calc()
+    Replayer(path, document=other_doc).run()
+    assert other_sheet.cell(9, 9).value == 9.0
+
+
+def test_replay_reports_mismatches(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    office, doc, sheet = fake_calc(sheet_names=("Sheet1", "Two"))
+    with Recorder(path):
+        doc.sheet(1).range("A1").value = 1
+
+    other_office, other_doc, other_sheet = fake_calc()
+    report = Replayer(path, document=other_doc).run()
+    assert report.mismatches
+    assert other_sheet.cell(0, 0).value == 0.0
+    with pytest.raises(ReplayError):
+        Replayer(path, document=other_doc, strict=True).run()
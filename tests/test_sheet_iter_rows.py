@@ -0,0 +1,54 @@
+import pytest
+
+from excellikeuno.sheet import SheetCell
+from excellikeuno.testing import fake_calc
+
+
+def test_used_range_skips_leading_empty_rows_and_columns():
+    office, doc, sheet = fake_calc()
+    sheet.range("C3:D4").value = [[1, "a"], [2, "b"]]
+    sheet.cell(5, 9).value = 7
+
+    used = sheet.used_range
+    addr = used.raw.getRangeAddress()
+    assert (addr.StartColumn, addr.StartRow, addr.EndColumn, addr.EndRow) == (2, 2, 5, 9)
+
+
+def test_iter_rows_fetches_in_chunks():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:C10").value = [[r, f"r{r}", r * 0.5] for r in range(10)]
+    office.latency.reset()
+
+    rows = list(sheet.iter_rows(chunk_rows=4))
+
+    assert len(rows) == 10
+    assert rows[0] == (0.0, "r0", 0.0)
+    assert rows[9] == (9.0, "r9", 4.5)
+    assert all(isinstance(row, tuple) for row in rows)
+    assert office.latency.by_method["getDataArray"] == 3
+    assert office.latency.items == 30
+
+
+def test_iter_rows_is_lazy_and_can_yield_cells():
+    office, doc, sheet = fake_calc()
+    sheet.range("A1:B3").value = [[1, 2], [3, 4], [5, 6]]
+    office.latency.reset()
+
+    rows = sheet.iter_rows(chunk_rows=1)
+    assert next(rows) == (1.0, 2.0)
+    assert office.latency.by_method["getDataArray"] == 1
+
+    cells = list(sheet.iter_rows(values_only=False))
+    assert len(cells) == 3 and isinstance(cells[2][1], SheetCell)
+    assert cells[2][1].value == 6.0
+    with pytest.raises(ValueError):
+        next(sheet.iter_rows(chunk_rows=0))
+
+
+def test_iter_rows_on_empty_sheet():
+    office, doc, sheet = fake_calc()
+    assert list(sheet.iter_rows()) == []
+    assert sheet.used_range is None
+
+    sheet.cell(0, 0).value = 1
+    assert list(sheet.iter_rows()) == [(1.0,)]
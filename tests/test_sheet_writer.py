@@ -0,0 +1,51 @@
+import pytest
+
+from excellikeuno.testing import fake_calc
+
+
+def test_writer_flushes_blocks_of_rows():
+    office, doc, sheet = fake_calc()
+    office.latency.reset()
+    with sheet.writer("B2", flush_rows=4) as writer:
+        writer.extend([r, f"row{r}", r * 1.5] for r in range(10))
+        assert writer.rows_written == 8 and writer.pending_rows == 2
+
+    assert writer.flushes == 3
+    assert writer.next_row == 11
+    assert office.latency.by_method["setDataArray"] == 3
+    assert "getCellByPosition" not in office.latency.by_method
+    assert sheet.range("B2:D3").data == [[0.0, "row0", 0.0], [1.0, "row1", 1.5]]
+    assert sheet.cell(3, 10).value == 13.5
+    assert writer.rows_per_second > 0
+
+
+def test_writer_pads_short_rows_and_keeps_formulas():
+    office, doc, sheet = fake_calc()
+    writer = sheet.writer((0, 0))
+    writer.append([1, 2, 3])
+    writer.append([4])
+    writer.append([5, 6, "=A1+B1"])
+    writer.close()
+
+    assert sheet.range("A1:C3").value == [["1", "2", "3"], ["4", "", ""], ["5", "6", "=A1+B1"]]
+
+
+def test_writer_drops_pending_rows_on_error():
+    office, doc, sheet = fake_calc()
+    with pytest.raises(RuntimeError):
+        with sheet.writer(flush_rows=2) as writer:
+            writer.extend([[1], [2], [3]])
+            raise RuntimeError("source failed")
+
+    assert sheet.range("A1:A3").data == [[1.0], [2.0], [""]]
+    with pytest.raises(ValueError):
+        sheet.writer(flush_rows=0)
+
+
+def test_writer_keeps_text_between_formula_columns():
+    office, doc, sheet = fake_calc()
+    with sheet.writer("A1", flush_rows=2) as writer:
+        writer.extend([f"=ROW()*{r}", "00123", "TRUE", f"=A{r + 1}+1"] for r in range(3))
+
+    assert sheet.range("B1:C3").data == [["00123", "TRUE"]] * 3
+    assert sheet.range("A3:D3").formula == [["=ROW()*2", "00123", "TRUE", "=A3+1"]]
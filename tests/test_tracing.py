@@ -0,0 +1,101 @@
+import json
+
+from excellikeuno.core.tracing import Tracer, TracedObject, unwrap
+from excellikeuno.sheet import SheetCell, SheetCellRange
+
+
+class _FakeUno:
+    """Marker base for test doubles that the tracer should treat as UNO objects."""
+
+
+class _Cell(_FakeUno):
+    def __init__(self):
+        self.formula = ""
+        self.Label = "cell"
+
+    def queryInterface(self, iface):
+        return self
+
+    def getValue(self):
+        try:
+            return float(self.formula)
+        except ValueError:
+            return 0.0
+
+    def setValue(self, value):
+        self.formula = str(value)
+
+    def getFormula(self):
+        return self.formula
+
+    def setFormula(self, formula):
+        self.formula = formula
+
+
+class _Range(_FakeUno):
+    def __init__(self):
+        self.cells = {}
+        self.linked = None
+
+    def queryInterface(self, iface):
+        return self
+
+    def getCellByPosition(self, column, row):
+        return self.cells.setdefault((column, row), _Cell())
+
+    def link(self, other):
+        self.linked = other
+
+
+def _tracer():
+    return Tracer(should_wrap=lambda value: isinstance(value, _FakeUno))
+
+
+def test_tracer_counts_and_tags_calls():
+    cell = SheetCell(_Cell())
+    with _tracer() as tracer:
+        cell.value = 5
+        assert cell.value == 5.0
+    cell.value = 6  # not traced any more
+
+    assert tracer.calls == 2
+    assert [(rec.api, rec.member, rec.kind) for rec in tracer.records] == [
+        ("SheetCell.value", "setValue", "call"),
+        ("SheetCell.value", "getValue", "call"),
+    ]
+    rows = {(row["api"], row["member"]): row["calls"] for row in tracer.summary()}
+    assert rows == {("SheetCell.value", "setValue"): 1, ("SheetCell.value", "getValue"): 1}
+
+
+def test_tracer_follows_returned_objects_and_unwraps_arguments():
+    raw = _Range()
+    rng = SheetCellRange(raw)
+    with _tracer() as tracer:
+        cell = rng.cell(1, 2)
+        cell.formula = "=1+1"
+        proxied = rng.raw
+        assert isinstance(proxied, TracedObject)
+        proxied.link(proxied)
+        assert raw.linked is raw
+        assert unwrap(proxied.linked) is raw
+        proxied.Label = "x"
+
+    members = [rec.member for rec in tracer.records]
+    assert members == ["getCellByPosition", "setFormula", "link", "linked", "Label"]
+    assert tracer.records[0].api == "SheetCellRange.cell"
+    assert tracer.records[-1].kind == "set"
+    # Wrappers built while tracing keep the raw object.
+    assert unwrap(cell._obj) is cell._obj
+
+
+def test_tracer_exports_json_and_collapsed_stacks():
+    cell = SheetCell(_Cell())
+    with _tracer() as tracer:
+        cell.formula = "=A1"
+        cell.formula = "=A2"
+
+    document = json.loads(json.dumps(tracer.to_json()))
+    assert [event["name"] for event in document["traceEvents"]] == ["setFormula", "setFormula"]
+    assert document["summary"][0]["calls"] == 2
+    assert tracer.collapsed_stacks(weight="count") == ["SheetCell.formula;setFormula 2"]
+    assert "SheetCell.formula" in tracer.format_summary()
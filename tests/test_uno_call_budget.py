@@ -0,0 +1,50 @@
+import pytest
+
+from excellikeuno.sheet import SheetCell
+from excellikeuno.testing import UnoCallBudgetExceeded
+
+
+class _Cell:
+    def __init__(self):
+        self.formula = ""
+
+    def queryInterface(self, iface):
+        return self
+
+    def getFormula(self):
+        return self.formula
+
+    def setFormula(self, formula):
+        self.formula = formula
+
+
+def _is_fake(value):
+    return isinstance(value, _Cell)
+
+
+def test_budget_passes_within_limit(max_uno_calls):
+    cell = SheetCell(_Cell())
+    with max_uno_calls(2, should_wrap=_is_fake) as tracer:
+        cell.formula = "=1"
+        assert cell.formula == "=1"
+    assert tracer.calls == 2
+
+
+def test_budget_failure_reports_the_calls(max_uno_calls):
+    cells = [SheetCell(_Cell()) for _ in range(3)]
+    with pytest.raises(UnoCallBudgetExceeded) as info:
+        with max_uno_calls(2, should_wrap=_is_fake):
+            for cell in cells:
+                cell.formula = "=1"
+    message = str(info.value)
+    assert "at most 2 UNO calls, got 3" in message
+    assert "SheetCell.formula" in message
+
+
+def test_nested_budgets_both_count(max_uno_calls):
+    cell = SheetCell(_Cell())
+    with max_uno_calls(3, should_wrap=_is_fake) as outer:
+        cell.formula = "=1"
+        with max_uno_calls(1, should_wrap=_is_fake) as inner:
+            cell.formula = "=2"
+    assert (inner.calls, outer.calls) == (1, 2)
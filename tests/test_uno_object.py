@@ -0,0 +1,65 @@
+import sys
+import types
+
+from excellikeuno.core import base
+from excellikeuno.core.base import UnoObject, resolve_uno_type
+from excellikeuno.testing import fake_calc
+from excellikeuno.typing import InterfaceNames
+
+
+class _Raw:
+    def __init__(self):
+        self.queried = []
+
+    def queryInterface(self, iface):
+        self.queried.append(iface)
+        return self
+
+
+def _fake_uno(resolved):
+    def getTypeByName(name):
+        resolved.append(name)
+        return f"type:{name}"
+
+    return types.SimpleNamespace(getTypeByName=getTypeByName)
+
+
+def test_direct_interfaces_skip_query_interface():
+    office, doc, sheet = fake_calc()
+    rng = sheet.range("A1:B2")
+    office.latency.reset()
+
+    rng.value = [[1, "=A1*2"], ["x", 4]]
+    assert rng.data == [[1.0, 0.0], ["x", 4.0]]
+    assert "queryInterface" not in office.latency.by_method
+
+
+def test_each_type_is_resolved_once_per_process(monkeypatch):
+    resolved = []
+    monkeypatch.setattr(base, "_UNO_TYPES", {})
+    monkeypatch.setitem(sys.modules, "uno", _fake_uno(resolved))
+
+    first, second = _Raw(), _Raw()
+    UnoObject(first).iface(InterfaceNames.X_PROPERTY_SET)
+    UnoObject(first).iface(InterfaceNames.X_PROPERTY_SET)
+    UnoObject(second).iface(InterfaceNames.X_PROPERTY_SET)
+
+    assert resolved == [InterfaceNames.X_PROPERTY_SET]
+    # the type is reused, but every new wrapper still queries its own object
+    assert first.queried == ["type:" + InterfaceNames.X_PROPERTY_SET] * 2
+    assert second.queried == ["type:" + InterfaceNames.X_PROPERTY_SET]
+
+
+def test_missing_runtime_is_not_cached(monkeypatch):
+    resolved = []
+    monkeypatch.setattr(base, "_UNO_TYPES", {})
+    monkeypatch.setattr(base, "_NO_RUNTIME_PATH", None)
+    monkeypatch.setitem(sys.modules, "uno", None)  # import uno raises ImportError
+
+    assert resolve_uno_type(InterfaceNames.X_CELL) is None
+    assert base._UNO_TYPES == {}
+
+    monkeypatch.setitem(sys.modules, "uno", _fake_uno(resolved))
+    assert resolve_uno_type(InterfaceNames.X_CELL) == "type:" + InterfaceNames.X_CELL
+    assert resolve_uno_type(InterfaceNames.X_CELL) == "type:" + InterfaceNames.X_CELL
+    assert resolved == [InterfaceNames.X_CELL]